@@ -0,0 +1,77 @@
+""" Benchmark: parsing many configuration files one by one, with threads and with processes,
+    and only indexing them to load the file of the first used entity on demand
+
+    Usage: python3 benchmark/assembler_parallel.py [file count] [entities per file]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imagination.assembler.core import Assembler
+
+ENTITY_TEMPLATE = '''
+    <entity id="entity-{file_index}-{index}" class="dummy.core.PlainOldObjectWithParameters">
+        <param name="a" type="int">{index}</param>
+        <param name="b" type="list">
+            <item type="str">alpha</item>
+            <item type="float">1.5</item>
+            <item type="entity">entity-{file_index}-0</item>
+        </param>
+        <interception before="entity-{file_index}-0" do="method" with="method"/>
+    </entity>
+'''
+
+
+def generate_config_files(directory, file_count, entity_count):
+    filepaths = []
+
+    for file_index in range(file_count):
+        filepath = os.path.join(directory, 'fragment-{}.xml'.format(file_index))
+
+        with open(filepath, 'w') as f:
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n<imagination>')
+            f.write(''.join(
+                ENTITY_TEMPLATE.format(file_index = file_index, index = index)
+                for index in range(entity_count)
+            ))
+            f.write('</imagination>\n')
+
+        filepaths.append(filepath)
+
+    return filepaths
+
+
+def main(file_count, entity_count):
+    directory = tempfile.mkdtemp()
+
+    try:
+        filepaths = generate_config_files(directory, file_count, entity_count)
+
+        for name, options in (
+            ('sequential', {'max_workers': 1}),
+            ('threads',    {}),
+            ('processes',  {'use_processes': True}),
+            ('lazy',       {'lazy': True}),
+        ):
+            started_at = time.perf_counter()
+            assembler  = Assembler(**options)
+
+            assembler.load(*filepaths)
+            assembler.core.get_metadata('entity-0-1')
+
+            print('{:<10} {} files x {} entities: {:8.2f} ms'.format(
+                name, file_count, entity_count, (time.perf_counter() - started_at) * 1000
+            ))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 40,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,112 @@
+""" Benchmark: the DOM-based XML parser, the streaming XML parser, the JSON
+    parser, and loading the metadata from the on-disk cache
+
+    Usage: python3 benchmark/config_parsers.py [entity count]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imagination.assembler.core   import Assembler
+from imagination.assembler.json   import JSONParser
+from imagination.assembler.stream import StreamingXMLParser
+from imagination.assembler.xml    import XMLParser
+
+ENTITY_TEMPLATE = '''
+    <entity id="entity-{index}" class="dummy.core.PlainOldObjectWithParameters">
+        <param name="a" type="int">{index}</param>
+        <param name="b" type="dict">
+            <item name="label" type="str">Entity #{index}</item>
+            <item name="ratio" type="float">1.5</item>
+            <item name="peers" type="list">
+                <item type="entity">entity-0</item>
+                <item type="class">dummy.core.PlainOldObject</item>
+            </item>
+        </param>
+        <interception before="entity-0" do="method" with="method"/>
+    </entity>
+'''
+
+
+def make_json_entity(index):
+    return {
+        'id'     : 'entity-{}'.format(index),
+        'class'  : 'dummy.core.PlainOldObjectWithParameters',
+        'params' : [
+            {'name': 'a', 'value': index},
+            {'name': 'b', 'type': 'dict', 'items': [
+                {'name': 'label', 'value': 'Entity #{}'.format(index)},
+                {'name': 'ratio', 'value': 1.5},
+                {'name': 'peers', 'type': 'list', 'items': [
+                    {'type': 'entity', 'value': 'entity-0'},
+                    {'type': 'class', 'value': 'dummy.core.PlainOldObject'},
+                ]},
+            ]},
+        ],
+        'interceptions' : [{'before': 'entity-0', 'do': 'method', 'with': 'method'}],
+    }
+
+
+def main(entity_count):
+    json_path = tempfile.mktemp(suffix = '.json')
+
+    with open(json_path, 'w') as f:
+        json.dump({'entity': [make_json_entity(index) for index in range(entity_count)]}, f)
+
+    with tempfile.NamedTemporaryFile('w', suffix = '.xml', delete = False) as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<imagination>')
+
+        for index in range(entity_count):
+            f.write(ENTITY_TEMPLATE.format(index = index))
+
+        f.write('</imagination>\n')
+
+    try:
+        print('{} entities, {:.1f} MB'.format(entity_count, os.path.getsize(f.name) / 1024 / 1024))
+
+        for parser, filepath in ((XMLParser(), f.name), (StreamingXMLParser(), f.name), (JSONParser(), json_path)):
+            gc.collect()
+            tracemalloc.start()
+
+            started_at    = time.perf_counter()
+            container_map = parser.parse(filepath)
+            elapsed_time  = time.perf_counter() - started_at
+
+            _, peak_memory = tracemalloc.get_traced_memory()
+
+            tracemalloc.stop()
+
+            assert len(container_map) == entity_count
+
+            print('{:<20} {:10.2f} ms, peak memory {:8.1f} MB'.format(
+                type(parser).__name__, elapsed_time * 1000, peak_memory / 1024 / 1024
+            ))
+
+            del container_map
+
+        cache_path = f.name + '.cache'
+
+        for name in ('cache (cold)', 'cache (warm)'):
+            gc.collect()
+
+            assembler  = Assembler(max_workers = 1, parsers = [StreamingXMLParser()], cache_path = cache_path)
+            started_at = time.perf_counter()
+
+            assembler._load_config_files(f.name)
+
+            print('{:<20} {:10.2f} ms'.format(name, (time.perf_counter() - started_at) * 1000))
+
+        os.unlink(cache_path)
+    finally:
+        os.unlink(f.name)
+        os.unlink(json_path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
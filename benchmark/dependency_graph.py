@@ -0,0 +1,59 @@
+""" Benchmark: queries on the dependency graph of a synthetic configuration
+
+    Each entity depends on up to three entities defined before it, so the
+    graph is layered like a real application.
+
+    Usage: python3 benchmark/dependency_graph.py [entity count]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imagination.graph import DependencyGraph
+
+
+def make_graph(entity_count):
+    randomizer = random.Random(entity_count)
+
+    return {
+        'entity-{}'.format(index): {
+            'entity-{}'.format(randomizer.randrange(index))
+            for _ in range(min(index, 3))
+        }
+        for index in range(entity_count)
+    }
+
+
+def measure(name, function, repeat = 1000):
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        function()
+
+    print('{:<32} {:10.4f} ms'.format(name, (time.perf_counter() - started_at) * 1000 / repeat))
+
+
+def main(entity_count):
+    graph      = make_graph(entity_count)
+    middle_id  = 'entity-{}'.format(entity_count // 2)
+    leaf_id    = 'entity-{}'.format(entity_count - 1)
+    started_at = time.perf_counter()
+    dependency_graph = DependencyGraph(graph)
+
+    print('{} entities, {} dependencies'.format(entity_count, dependency_graph.edge_count))
+    print('{:<32} {:10.4f} ms'.format('build', (time.perf_counter() - started_at) * 1000))
+
+    measure('first depth (all components)', lambda: dependency_graph.depth(leaf_id), 1)
+    measure('dependants', lambda: dependency_graph.dependants(middle_id))
+    measure('dependencies', lambda: dependency_graph.dependencies(leaf_id))
+    measure('depth', lambda: dependency_graph.depth(leaf_id))
+    measure('cycles', lambda: dependency_graph.cycles())
+    measure('transitive dependants (middle)', lambda: dependency_graph.dependants(middle_id, True), 10)
+    measure('invalidated (leaf)', lambda: dependency_graph.invalidated(leaf_id))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
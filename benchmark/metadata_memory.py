@@ -0,0 +1,81 @@
+""" Benchmark: memory footprint of the metadata of a synthetic configuration, loaded in the core
+
+    Usage: python3 benchmark/metadata_memory.py [entity count]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imagination.core            import Imagination
+from imagination.meta.container  import Entity
+from imagination.meta.definition import DataDefinition, Interception, ParameterCollection
+
+
+def text(value):
+    """ Make a new string like the one read from a file. """
+    return ''.join(list(value))
+
+
+def make_entity(index):
+    peers = ParameterCollection()
+    peers.add(DataDefinition(text('entity-0'), kind = text('entity')))
+    peers.add(DataDefinition(text('dummy.core.PlainOldObject'), kind = text('class')))
+
+    options = ParameterCollection()
+    options.add(DataDefinition(text('1.5'), text('ratio'), text('float')), text('ratio'))
+    options.add(DataDefinition(text('true'), text('strict'), text('bool')), text('strict'))
+    options.add(DataDefinition(peers, text('peers'), text('list')), text('peers'))
+
+    params = ParameterCollection()
+    params.add(DataDefinition(text(str(index)), text('a'), text('int')), text('a'))
+    params.add(DataDefinition(options, text('b'), text('dict')), text('b'))
+
+    interceptions = [
+        Interception(text('before'), text('entity-0'), text('method'), text('entity-{}'.format(index)), text('method')),
+    ]
+
+    return Entity(
+        text('entity-{}'.format(index)),
+        text('dummy.core.PlainOldObjectWithParameters'),
+        params,
+        interceptions
+    )
+
+
+def main(entity_count):
+    gc.collect()
+    tracemalloc.start()
+
+    started_at = time.perf_counter()
+    core       = Imagination()
+
+    core.update_metadata({
+        'entity-{}'.format(index): make_entity(index)
+        for index in range(entity_count)
+    })
+
+    elapsed = time.perf_counter() - started_at
+
+    gc.collect()
+
+    current, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    print('{} entities: {:8.1f} MB retained ({:8.1f} bytes per entity), {:8.1f} MB peak, {:8.2f} s'.format(
+        entity_count,
+        current / 1024 / 1024,
+        current / entity_count,
+        peak / 1024 / 1024,
+        elapsed
+    ))
+
+    return core
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
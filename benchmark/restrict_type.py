@@ -0,0 +1,52 @@
+""" Benchmark: overhead of :func:`imagination.decorator.validator.restrict_type` per call
+
+    Usage: python3 benchmark/restrict_type.py [call count]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imagination.decorator import validator
+
+
+class Account(object):
+    def deposit(self, amount, currency, tags = None):
+        return amount
+
+    def withdraw(self, amount : int, currency : str, tags : list = None):
+        return amount
+
+
+def make_cases():
+    validated_deposit  = validator.restrict_type(int, str, tags = list)(Account.deposit)
+    annotated_withdraw = validator.restrict_type()(Account.withdraw)
+
+    validator.set_disabled()
+
+    try:
+        disabled_deposit = validator.restrict_type(int, str, tags = list)(Account.deposit)
+    finally:
+        validator.set_disabled(False)
+
+    account = Account()
+
+    return [
+        ('unwrapped',            lambda: Account.deposit(account, 100, 'CAD')),
+        ('restrict_type',        lambda: validated_deposit(account, 100, 'CAD')),
+        ('restrict_type (kw)',   lambda: validated_deposit(account, 100, 'CAD', tags = [])),
+        ('annotations',          lambda: annotated_withdraw(account, 100, 'CAD')),
+        ('disabled',             lambda: disabled_deposit(account, 100, 'CAD')),
+    ]
+
+
+def main(call_count):
+    for name, case in make_cases():
+        duration = min(timeit.repeat(case, number = call_count, repeat = 5))
+
+        print('{:<24} {:10.1f} ns per call'.format(name, duration * 1000000000 / call_count))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
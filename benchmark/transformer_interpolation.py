@@ -0,0 +1,45 @@
+""" Benchmark: casting parameter values with and without environment blocks,
+    and casting the values pre-computed at lock-down
+
+    Usage: python3 benchmark/transformer_interpolation.py [value count]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imagination.helper.transformer import Transformer
+from imagination.meta.definition    import DataDefinition
+
+
+def main(value_count):
+    os.environ.setdefault('BENCHMARK_HOST', 'localhost')
+
+    transformer = Transformer(None)
+    samples     = {
+        'literal'     : [DataDefinition('value-{}'.format(i)) for i in range(value_count)],
+        'placeholder' : [
+            DataDefinition('http://{ $BENCHMARK_HOST }:{ $BENCHMARK_PORT or 80 }/' + str(i))
+            for i in range(value_count)
+        ],
+        'integer'     : [DataDefinition(str(i), kind = 'int') for i in range(value_count)],
+    }
+
+    samples['folded'] = [transformer.fold(definition) for definition in samples['integer']]
+
+    for name, definitions in sorted(samples.items()):
+        def cast_all():
+            for definition in definitions:
+                transformer.cast(definition)
+
+        first_pass = timeit.timeit(cast_all, number = 1)
+        next_pass  = min(timeit.repeat(cast_all, number = 1, repeat = 5))
+
+        print('{:<12} {:>7} values: first pass {:8.2f} ms, next passes {:8.2f} ms'.format(
+            name, value_count, first_pass * 1000, next_pass * 1000
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -1 +1 @@
-__version__ = (1, 5, 6)
\ No newline at end of file
+__version__ = (2, 5, 3)  # NOTE also the version of the package in setup.py
@@ -0,0 +1,6 @@
+# v2
+import sys
+
+from .cli import main
+
+sys.exit(main())
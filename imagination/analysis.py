@@ -0,0 +1,317 @@
+# v2
+import inspect
+
+from .graph              import DependencyGraph
+from .helper.general     import extract_class_paths_from_parameters
+from .helper.transformer import Constant
+from .loader             import resolve
+from .meta.container     import Entity, Factorization, Lambda
+from .meta.definition    import DataDefinition
+from .wrapper            import WILDCARD_METHOD
+
+UNDEFINED_DEPENDENCY   = 'undefined-dependency'
+UNRESOLVABLE_REFERENCE = 'unresolvable-reference'
+MISSING_PARAMETER      = 'missing-parameter'
+UNEXPECTED_PARAMETER   = 'unexpected-parameter'
+ANNOTATION_MISMATCH    = 'annotation-mismatch'
+MISSING_METHOD         = 'missing-method'
+UNDEFINED_INTERCEPTION = 'undefined-interception'
+DEPENDENCY_CYCLE       = 'dependency-cycle'
+
+
+class Finding(object):
+    """ Problem found by :class:`GraphValidator`
+
+        :param str container_id: the ID of the container with the problem
+        :param str code: the kind of problem, e.g., ``missing-parameter``
+        :param str message: the description
+    """
+    __slots__ = ('container_id', 'code', 'message')
+
+    def __init__(self, container_id : str, code : str, message : str):
+        self.container_id = container_id
+        self.code         = code
+        self.message      = message
+
+    def __repr__(self):
+        return '<Finding {} {}: {}>'.format(self.code, self.container_id, self.message)
+
+    def __str__(self):
+        return '{}: {}'.format(self.container_id, self.message)
+
+
+class GraphValidationError(RuntimeError):
+    """ Error when :meth:`imagination.core.Imagination.validate` finds problems
+
+        :param list findings: all findings
+    """
+    def __init__(self, findings : list):
+        super().__init__('{} problem(s) found:\n{}'.format(
+            len(findings),
+            '\n'.join('- {}'.format(finding) for finding in findings)
+        ))
+
+        self.findings = findings
+
+
+class ValidatedSignature(object):
+    """ Outcome of the validation of one container, which the controller uses
+        to skip the same checks on instantiation
+
+        :param list expected_params: the parameters of the class (only for entities)
+        :param frozenset verified_params: the names of the parameters whose
+                                          values are checked against the annotations
+    """
+    __slots__ = ('expected_params', 'verified_params')
+
+    def __init__(self, expected_params : list = None, verified_params : frozenset = frozenset()):
+        self.expected_params = expected_params
+        self.verified_params = verified_params
+
+
+class GraphValidator(object):
+    """ Static analysis of the whole graph of containers
+
+        Every class and callable is resolved, every signature is checked
+        against the defined parameters, the parameters pre-computed by
+        :meth:`imagination.helper.transformer.Transformer.fold` are checked
+        against the annotations, every interception is checked against the
+        entities and their methods, and the dependency cycles are detected.
+        All findings are reported at once.
+
+        :param core: the core
+        :param tuple reserved_ids: the IDs which are always defined, e.g., the core itself
+
+        .. note:: The containers loaded on first use are loaded.
+    """
+    def __init__(self, core, reserved_ids : tuple = ()):
+        self.__core         = core
+        self.__reserved_ids = set(reserved_ids)
+        self.__classes      = {}  # container ID -> resolved class (or None)
+        self.__findings     = []
+        self.__signatures   = {}  # container ID -> ValidatedSignature
+
+    @property
+    def signatures(self) -> dict:
+        """ The map of the container IDs to :class:`ValidatedSignature` """
+        return dict(self.__signatures)
+
+    def validate(self) -> list:
+        """ Validate the graph.
+
+            :return: the list of :class:`Finding`
+        """
+        core     = self.__core
+        metadata = {container_id: core.get_metadata(container_id) for container_id in core.all_ids()}
+
+        self.__findings = []
+
+        for container_id, meta_container in metadata.items():
+            self.__classes[container_id] = self.__resolve_container(meta_container)
+
+        for container_id, meta_container in metadata.items():
+            self.__check_dependencies(meta_container)
+            self.__check_signature(meta_container)
+
+        for interception in core._collect_interceptions():
+            self.__check_interception(interception)
+
+        for cycle in core.dependency_graph.cycles():
+            self.__report(cycle[0], DEPENDENCY_CYCLE, 'Dependency cycle among {}'.format(', '.join(cycle)))
+
+        return list(self.__findings)
+
+    def __report(self, container_id, code, message):
+        self.__findings.append(Finding(container_id, code, message))
+
+    def __resolve(self, container_id, path):
+        try:
+            return resolve(path)
+        except (ImportError, ValueError) as error:
+            self.__report(container_id, UNRESOLVABLE_REFERENCE, 'Unable to resolve {} ({})'.format(path, error))
+
+            return None
+
+    def __resolve_container(self, meta_container):
+        container_type = type(meta_container)
+
+        for class_path in sorted(extract_class_paths_from_parameters(meta_container.params)):
+            self.__resolve(meta_container.id, class_path)
+
+        if container_type is Entity:
+            return self.__resolve(meta_container.id, meta_container.fqcn)
+
+        if container_type is Lambda:
+            self.__resolve(meta_container.id, meta_container.fq_callable_name)
+
+        return None
+
+    def __check_dependencies(self, meta_container):
+        for dependency_id in sorted(meta_container.dependencies):
+            if dependency_id in self.__reserved_ids or self.__core.contain(dependency_id):
+                continue
+
+            self.__report(meta_container.id, UNDEFINED_DEPENDENCY, 'Undefined dependency: {}'.format(dependency_id))
+
+    def __get_make_method(self, meta_container):
+        """ Get the make method and the flag if the signature includes the instance. """
+        container_type = type(meta_container)
+
+        if container_type is Entity:
+            return self.__classes.get(meta_container.id), False
+
+        if container_type is not Factorization:
+            return None, False
+
+        factory_class = self.__classes.get(meta_container.factory_id)
+        method_name   = meta_container.factory_method_name
+
+        if factory_class is None:
+            return None, False
+
+        if not hasattr(factory_class, method_name):
+            self.__report(meta_container.id, MISSING_METHOD, '{} has no factory method "{}"'.format(
+                factory_class.__name__, method_name
+            ))
+
+            return None, False
+
+        bound = isinstance(inspect.getattr_static(factory_class, method_name), (staticmethod, classmethod))
+
+        return getattr(factory_class, method_name), not bound
+
+    def __check_signature(self, meta_container):
+        make_method, has_instance = self.__get_make_method(meta_container)
+
+        if make_method is None:
+            return
+
+        try:
+            expected_params = list(inspect.signature(make_method).parameters.values())
+        except (TypeError, ValueError):
+            return  # e.g., built-in
+
+        if has_instance:
+            expected_params = expected_params[1:]
+
+        fixed_params   = [param for param in expected_params if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)]
+        fixed_names    = [param.name for param in fixed_params]
+        any_positional = any(param.kind == param.VAR_POSITIONAL for param in expected_params)
+        any_keyword    = any(param.kind == param.VAR_KEYWORD for param in expected_params)
+        definitions    = {}  # parameter name -> data definition
+        extra_count    = 0
+
+        # NOTE The keyword parameters come first, like in the controller.
+        for name, data in meta_container.params.items():
+            if name in fixed_names:
+                definitions[name] = data
+            elif not any_keyword:
+                self.__report(meta_container.id, UNEXPECTED_PARAMETER, 'Unexpected parameter: {}'.format(name))
+
+        index = 0
+
+        for data in meta_container.params.sequence():
+            if index >= len(fixed_names) or fixed_names[index] in definitions:
+                extra_count += 1
+
+                continue
+
+            definitions[fixed_names[index]] = data
+
+            index += 1
+
+        if extra_count and not definitions and not any_positional:
+            self.__report(meta_container.id, UNEXPECTED_PARAMETER, '{} unexpected positional parameter(s)'.format(extra_count))
+
+        for param in fixed_params:
+            if param.name not in definitions and param.default is inspect.Parameter.empty:
+                self.__report(meta_container.id, MISSING_PARAMETER, 'Missing parameter: {}'.format(param.name))
+
+        verified_params = frozenset(
+            param.name
+            for param in fixed_params
+            if param.name in definitions and self.__check_annotation(meta_container.id, param, definitions[param.name])
+        )
+
+        self.__signatures[meta_container.id] = ValidatedSignature(
+            expected_params if type(meta_container) is Entity else None,
+            verified_params
+        )
+
+    def __check_annotation(self, container_id, param, data):
+        """ Check the statically known value against the annotation.
+
+            :return: ``True`` if the value is known and matches the annotation
+        """
+        annotation = param.annotation
+
+        if type(data) is not DataDefinition:
+            return False
+
+        if annotation is inspect.Parameter.empty:
+            return True
+
+        if not isinstance(annotation, type):
+            return False
+
+        if data.kind == 'entity' and data.transformation_required:
+            dependency_class = self.__classes.get(data.definition)
+
+            if dependency_class is not None and not issubclass(dependency_class, annotation):
+                self.__report_annotation_mismatch(container_id, param, dependency_class)
+
+            return False  # The instance may still be replaced, e.g., by a wrapper.
+
+        folded = self.__core.transformer.fold(data) if data.transformation_required else Constant(data.definition)
+
+        if type(folded) is not Constant:
+            return False
+
+        if not isinstance(folded.value, annotation):
+            self.__report_annotation_mismatch(container_id, param, type(folded.value))
+
+            return False
+
+        return True
+
+    def __report_annotation_mismatch(self, container_id, param, given_type):
+        self.__report(container_id, ANNOTATION_MISMATCH, 'Given {}, expected {}, for {}'.format(
+            given_type.__name__,
+            param.annotation.__name__,
+            param.name
+        ))
+
+    def __check_interception(self, interception):
+        core = self.__core
+
+        for role, container_id in (('intercepted', interception.intercepted_id),
+                                   ('interceptor', interception.interceptor_id)):
+            if not core.contain(container_id):
+                self.__report(interception.interceptor_id, UNDEFINED_INTERCEPTION,
+                              'Undefined {} entity: {}'.format(role, container_id))
+
+                return
+
+        for container_id, method_name in ((interception.intercepted_id, interception.method_to_intercept),
+                                          (interception.interceptor_id, interception.intercepting_method)):
+            container_class = self.__classes.get(container_id)
+
+            if method_name == WILDCARD_METHOD or container_class is None or hasattr(container_class, method_name):
+                continue
+
+            self.__report(interception.interceptor_id, MISSING_METHOD, '{} ({}) has no method "{}"'.format(
+                container_id,
+                container_class.__name__,
+                method_name
+            ))
+
+
+def find_cycles(graph : dict) -> list:
+    """ Find the cycles in the directed graph, see :meth:`imagination.graph.DependencyGraph.cycles`.
+
+        :param dict graph: the map of each node to its successors
+
+        :return: the list of the strongly connected components with more
+                 than one node or with a loop, each in the order of discovery
+    """
+    return DependencyGraph(graph).cycles()
@@ -1,6 +1,60 @@
+from ..helper.transformer import TypeRegistry, type_registry
+
+
 class ConfigParser(object):
+    """ Base configuration parser
+
+        A subclass overrides either :meth:`parse` or :meth:`parse_with_types`.
+
+        :param TypeRegistry registry: the registry of data types (optional,
+                                      the process-wide ``type_registry`` by default)
+    """
+    extensions = ()  # The extensions of the handled files, e.g., ``('.xml',)``
+
+    _registry = type_registry
+
+    def __init__(self, registry : TypeRegistry = None):
+        self._registry = registry or type_registry
+
+    @property
+    def registry(self) -> TypeRegistry:
+        return self._registry
+
     def can_handle(self, filepath : str) -> bool:
-        raise NotImplementedError()
+        return filepath.lower().endswith(self.extensions)
 
     def parse(self, filepath : str) -> dict:
-        raise NotImplementedError()
+        if type(self).parse_with_types is ConfigParser.parse_with_types:
+            raise NotImplementedError()
+
+        container_map, _ = self.parse_with_types(filepath)
+
+        return container_map
+
+    def parse_with_types(self, filepath : str) -> tuple:
+        """ Parse the file and report the data types defined by the file.
+
+            :return: the container map and the list of ``(name, caster path, immutable)``
+        """
+        return self.parse(filepath), []
+
+    def register_types(self, type_definitions : list):
+        """ Register the data types reported by :meth:`parse_with_types` in another process. """
+        for type_definition in type_definitions:
+            self._registry.register(*type_definition)
+
+    def index_with_types(self, filepath : str) -> tuple:
+        """ Index the containers defined by the file, e.g., to load the file on first use.
+
+            :return: the map from the container IDs to their interceptions,
+                     and the list of ``(name, caster path, immutable)``
+        """
+        container_map, type_definitions = self.parse_with_types(filepath)
+
+        return (
+            {
+                container_id: list(meta_container.interceptions)
+                for container_id, meta_container in container_map.items()
+            },
+            type_definitions,
+        )
@@ -0,0 +1,301 @@
+# v2
+import hashlib
+import marshal
+import mmap
+import os
+
+import imagination
+
+from ..meta.container  import Entity, Factorization, Lambda
+from ..meta.definition import DataDefinition, Interception, ParameterCollection
+
+# NOTE Bump this whenever the exported shape of the metadata changes. The
+#      cache is also discarded with another version of the package
+#      (``imagination.__version__``), which setup.py uses as well.
+CACHE_FORMAT_VERSION = 1
+
+_MAGIC = 'imagination-metadata-cache'
+
+
+def export_parameters(params : ParameterCollection) -> tuple:
+    return (
+        [export_data_definition(item) for item in params.sequence()],
+        [(name, export_data_definition(item)) for name, item in params.items()],
+    )
+
+
+def export_data_definition(data : DataDefinition) -> tuple:
+    definition    = data.definition
+    is_collection = isinstance(definition, ParameterCollection)
+
+    return (
+        data.name,
+        data.kind,
+        export_parameters(definition) if is_collection else definition,
+        is_collection,
+        data.transformation_required,
+    )
+
+
+def export_interception(interception : Interception) -> tuple:
+    return (
+        interception.when_to_intercept,
+        interception.intercepted_id,
+        interception.method_to_intercept,
+        interception.interceptor_id,
+        interception.intercepting_method,
+        interception.count_items,
+        interception.mode,
+        interception.sample_rate,
+        interception.sample_every,
+        interception.enabled,
+    )
+
+
+def export_container(metadata) -> tuple:
+    """ Export the container metadata into the data which :mod:`marshal` can serialize. """
+    container_type = type(metadata)
+
+    if container_type is Entity:
+        target = metadata.fqcn
+    elif container_type is Factorization:
+        target = (metadata.factory_id, metadata.factory_method_name)
+    elif container_type is Lambda:
+        target = metadata.fq_callable_name
+    else:
+        raise TypeError('Unsupported container: {}'.format(container_type.__name__))
+
+    return (
+        container_type.__name__,
+        metadata.id,
+        target,
+        export_parameters(metadata.params),
+        [export_interception(interception) for interception in metadata.interceptions],
+        metadata.cacheable,
+    )
+
+
+def import_parameters(data : tuple) -> ParameterCollection:
+    sequence, items = data
+    params          = ParameterCollection()
+
+    for item in sequence:
+        params.add(import_data_definition(item))
+
+    for name, item in items:
+        params.add(import_data_definition(item), name)
+
+    return params
+
+
+def import_data_definition(data : tuple) -> DataDefinition:
+    name, kind, definition, is_collection, transformation_required = data
+
+    return DataDefinition(
+        import_parameters(definition) if is_collection else definition,
+        name,
+        kind,
+        transformation_required
+    )
+
+
+def import_container(data : tuple):
+    """ Import the container metadata exported by :func:`export_container`. """
+    container_type, container_id, target, params, interceptions, cacheable = data
+
+    params = import_parameters(params)
+
+    if container_type == 'Lambda':
+        return Lambda(container_id, target, params, cacheable)
+
+    interceptions = [Interception(*interception) for interception in interceptions]
+
+    if container_type == 'Factorization':
+        return Factorization(container_id, target[0], target[1], params, interceptions, cacheable)
+
+    return Entity(container_id, target, params, interceptions, cacheable)
+
+
+def fingerprint(filepath : str, digest : bool = True) -> tuple:
+    """ Make the fingerprint of the file.
+
+        :return: the modification time, the size and the content hash (if ``digest`` is true)
+    """
+    stat = os.stat(filepath)
+
+    if not digest:
+        return stat.st_mtime_ns, stat.st_size, None
+
+    with open(filepath, 'rb') as f:
+        content_hash = hashlib.blake2b(f.read(), digest_size = 20).hexdigest()
+
+    return stat.st_mtime_ns, stat.st_size, content_hash
+
+
+class MetadataCache(object):
+    """ On-disk cache of the parsed metadata per configuration file
+
+        The whole cache is one file, which is read at once through a memory
+        map. Each configuration file has its own entry, keyed by the
+        modification time, the size and the content hash of the file, so
+        editing one file only invalidates its own entry. When only the
+        modification time has changed, the content hash is compared instead.
+        The cache is discarded with another version of Imagination.
+
+        :param str path: the path to the cache file
+    """
+    def __init__(self, path : str):
+        self.__path     = path
+        self.__entries  = None  # key -> (mtime, size, content hash, containers, data types)
+        self.__pending  = {}    # key -> the fingerprint taken before parsing
+        self.__modified = False
+        self.hits       = 0
+        self.misses     = 0
+
+    @property
+    def path(self):
+        return self.__path
+
+    def get(self, key : str, filepath : str):
+        """ Get the parsed metadata of the configuration file.
+
+            :param str key: the cache key, e.g., the parser and the file path
+            :param str filepath: the path to the configuration file
+
+            :return: the container map and the data types, or ``None`` if the
+                     entry is missing or stale
+        """
+        entry = self.__lookup(key, filepath)
+
+        if entry is None:
+            return None
+
+        container_map = {}
+
+        for exported_container in entry[3]:
+            meta_container = import_container(exported_container)
+
+            container_map[meta_container.id] = meta_container
+
+        return container_map, [tuple(type_definition) for type_definition in entry[4]]
+
+    def get_index(self, key : str, filepath : str):
+        """ Get the index of the configuration file, see :meth:`ConfigParser.index_with_types`.
+
+            :return: the map from the container IDs to their interceptions and
+                     the data types, or ``None`` if the entry is missing or stale
+        """
+        entry = self.__lookup(key, filepath)
+
+        if entry is None:
+            return None
+
+        index = {
+            container_id: [Interception(*interception) for interception in interceptions]
+            for container_id, interceptions in entry[3]
+        }
+
+        return index, [tuple(type_definition) for type_definition in entry[4]]
+
+    def put(self, key : str, filepath : str, container_map : dict, type_definitions : list):
+        """ Store the parsed metadata of the configuration file.
+
+            The fingerprint taken by :meth:`get` before parsing is used, so
+            that a file changed while being parsed is parsed again next time.
+        """
+        self.__store(
+            key,
+            filepath,
+            [export_container(meta_container) for meta_container in container_map.values()],
+            type_definitions
+        )
+
+    def put_index(self, key : str, filepath : str, index : dict, type_definitions : list):
+        """ Store the index of the configuration file, like :meth:`put`. """
+        self.__store(
+            key,
+            filepath,
+            [
+                (container_id, [export_interception(interception) for interception in interceptions])
+                for container_id, interceptions in index.items()
+            ],
+            type_definitions
+        )
+
+    def save(self):
+        """ Write the cache if it has been modified. """
+        if not self.__modified:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.__path))
+
+        os.makedirs(directory, exist_ok = True)
+
+        temporary_path = '{}.{}.tmp'.format(self.__path, os.getpid())
+
+        with open(temporary_path, 'wb') as f:
+            marshal.dump((_MAGIC, CACHE_FORMAT_VERSION, list(imagination.__version__), self.__entries), f)
+
+        os.replace(temporary_path, self.__path)
+
+        self.__modified = False
+
+    def clear(self):
+        self.__entries  = {}
+        self.__modified = True
+
+    def __load(self):
+        if self.__entries is not None:
+            return self.__entries
+
+        self.__entries = {}
+
+        try:
+            with open(self.__path, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as mapped:
+                content = marshal.loads(mapped)
+        except (OSError, ValueError, EOFError, TypeError):
+            return self.__entries  # missing, empty or corrupted
+
+        if isinstance(content, tuple) and len(content) == 4 \
+                and content[:3] == (_MAGIC, CACHE_FORMAT_VERSION, list(imagination.__version__)):
+            self.__entries = content[3]
+
+        return self.__entries
+
+    def __lookup(self, key, filepath):
+        entries = self.__load()
+        entry   = entries.get(key)
+        current = fingerprint(filepath, digest = False)
+
+        if entry is not None and entry[:2] != current[:2]:
+            current = fingerprint(filepath)
+
+            if entry[2] == current[2]:
+                # Only touched. Keep the entry with the new modification time.
+                entry = entries[key] = current + entry[3:]
+
+                self.__modified = True
+            else:
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+
+            self.__pending[key] = current if current[2] is not None else fingerprint(filepath)
+
+            return None
+
+        self.hits += 1
+
+        return entry
+
+    def __store(self, key, filepath, exported_data, type_definitions):
+        entries = self.__load()
+        current = self.__pending.pop(key, None) or fingerprint(filepath)
+
+        entries[key] = current + (
+            exported_data,
+            [list(type_definition) for type_definition in type_definitions],
+        )
+
+        self.__modified = True
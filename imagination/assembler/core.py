@@ -1,27 +1,110 @@
 # v2
-from ..core  import Imagination
-from ..debug import dump_meta_container
+import concurrent.futures
+import functools
+import os
 
-from .xml import XMLParser
+from ..core               import Imagination
+from ..debug              import dump_meta_container, get_logger
+from ..helper.transformer import UnknownKindError
+
+from .cache import MetadataCache
+from .json  import JSONParser
+from .toml  import TOMLParser
+from .xml   import XMLParser
 
 
 class UnsupportedConfigFileError(RuntimeError):
     """ Error when detect unsupported configuration file """
 
 
+class DuplicateContainerIDError(RuntimeError):
+    """ Error when more than one configuration file defines the same container ID. """
+
+
+def _parse_config_file(parser, filepath, method_name = 'parse_with_types'):
+    """ Parse (or index) the file in a worker.
+
+        :return: the container map (or the index) and the defined data types,
+                 or ``None`` if the file uses the data types which may be
+                 defined by another file.
+    """
+    try:
+        return getattr(parser, method_name)(filepath)
+    except UnknownKindError:
+        return None
+
+
 class Assembler(object):
-    def __init__(self, core : Imagination = None):
-        self._parsers = [
+    """ Assembler
+
+        The configuration files are parsed in parallel, then the containers
+        are merged in the given order, i.e., the container defined later
+        overrides the one with the same ID defined earlier.
+
+        .. note:: The parsing is CPU-bound Python code, so the worker threads
+                  used by default only overlap reading the files and give
+                  no speed-up on more CPUs. Set ``use_processes = True`` to
+                  parse large configurations on more CPUs, at the cost of
+                  starting the worker processes and copying the metadata
+                  back from them.
+
+        :param Imagination core: the core (optional)
+        :param int max_workers: the number of workers to parse the files
+                                (optional, the number of CPUs by default);
+                                ``1`` to parse the files one by one
+        :param bool use_processes: flag to parse the files in worker processes
+                                   instead of threads, which is required to
+                                   scale with the number of CPUs
+        :param bool strict: flag to raise :class:`DuplicateContainerIDError`
+                            instead of logging a warning when a container ID
+                            is defined by more than one file
+        :param list parsers: the configuration parsers (optional), e.g.,
+                             ``[StreamingXMLParser()]`` for large XML files
+        :param str cache_path: the path to the cache of the parsed metadata
+                               (optional), see :class:`imagination.assembler.cache.MetadataCache`
+        :param bool lazy: flag to only index the containers and the
+                          interceptions of each file on :meth:`load`, and to
+                          parse the file when one of its containers is first
+                          used, see :meth:`imagination.core.Imagination.add_lazy_metadata`
+    """
+    def __init__(self, core : Imagination = None, max_workers : int = None,
+                 use_processes : bool = False, strict : bool = False,
+                 parsers : list = None, cache_path : str = None, lazy : bool = False):
+        self._parsers = parsers or [
             XMLParser(),
+            JSONParser(),
+            TOMLParser(),
         ]
 
-        self._core = Imagination()
+        self._core          = core or Imagination()
+        self._max_workers   = max_workers
+        self._use_processes = use_processes
+        self._strict        = strict
+        self._origins       = {}  # container ID -> file path
+        self._cache         = MetadataCache(cache_path) if cache_path else None
+        self._lazy          = lazy
+        self._logger        = get_logger('assembler')
 
     @property
     def core(self):
         return self._core
 
+    @property
+    def cache(self) -> MetadataCache:
+        """ The cache of the parsed metadata (or ``None``) """
+        return self._cache
+
+    @property
+    def origins(self) -> dict:
+        """ The map from container IDs to the paths of the files defining them """
+        return dict(self._origins)
+
     def load(self, *filepaths):
+        if self._lazy:
+            self._index_config_files(*filepaths)
+
+            return
+
         meta_container_map = self._load_config_files(*filepaths)
 
         self.core.update_metadata(meta_container_map)
@@ -29,20 +112,142 @@ class Assembler(object):
     def _load_config_files(self, *filepaths):
         meta_container_map = {}
 
-        for filepath in filepaths:
-            config_handled = False
+        for _, filepath, sub_meta_container_map in self._parse_config_files(filepaths):
+            for container_id, meta_container in sub_meta_container_map.items():
+                self._track_origin(container_id, filepath)
+
+                meta_container_map[container_id] = meta_container
+
+        return meta_container_map
+
+    def _index_config_files(self, *filepaths):
+        for parser, filepath, index in self._parse_config_files(filepaths, index_only = True):
+            for container_id in index:
+                self._track_origin(container_id, filepath)
+
+            self.core.add_lazy_metadata(functools.partial(self._load_shard, parser, filepath), index)
+
+    def _load_shard(self, parser, filepath):
+        """ Parse the file indexed by :meth:`_index_config_files`.
+
+            :return: the container map
+        """
+        key     = self._make_cache_key(parser, filepath)
+        outcome = self._cache.get(key, filepath) if self._cache is not None else None
+
+        if outcome is not None:
+            return outcome[0]
+
+        outcome = parser.parse_with_types(filepath)
+
+        if self._cache is not None:
+            self._cache.put(key, filepath, *outcome)
+            self._cache.save()
+
+        self._logger.debug('Loaded {} on first use'.format(filepath))
 
-            for parser in self._parsers:
-                if not parser.can_handle(filepath):
-                    continue
+        return outcome[0]
 
-                sub_meta_container_map = parser.parse(filepath)
+    def _track_origin(self, container_id, filepath):
+        origin = self._origins.get(container_id)
 
-                meta_container_map.update(sub_meta_container_map)
+        if origin is not None and origin != filepath:
+            self._report_conflict(container_id, origin, filepath)
 
-                config_handled = True
+        self._origins[container_id] = filepath
 
-            if not config_handled:
+    def _report_conflict(self, container_id, origin, filepath):
+        message = '{} is defined in {} and overridden by {}.'.format(container_id, origin, filepath)
+
+        if self._strict:
+            raise DuplicateContainerIDError(message)
+
+        self._logger.warning(message)
+
+    def _parse_config_files(self, filepaths, index_only = False):
+        """ Parse the files.
+
+            :param bool index_only: flag to index the files instead, see :meth:`ConfigParser.index_with_types`
+
+            :return: the list of the parsers, the file paths and the container
+                     maps (or the indexes) in the given order
+        """
+        tasks = []
+
+        for filepath in filepaths:
+            parsers = [parser for parser in self._parsers if parser.can_handle(filepath)]
+
+            if not parsers:
                 raise UnsupportedConfigFileError(filepath)
 
-        return meta_container_map
+            tasks.extend((parser, filepath) for parser in parsers)
+
+        outcomes    = [None] * len(tasks)
+        method_name = 'index_with_types' if index_only else 'parse_with_types'
+
+        if self._cache is not None:
+            cache_get = self._cache.get_index if index_only else self._cache.get
+
+            for index, (parser, filepath) in enumerate(tasks):
+                outcomes[index] = cache_get(self._make_cache_key(parser, filepath, index_only), filepath)
+
+                if outcomes[index] is not None:
+                    parser.register_types(outcomes[index][1])
+
+        pending_indexes = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        pending_tasks   = [tasks[index] for index in pending_indexes]
+
+        for index, outcome in zip(pending_indexes, self._parse_in_workers(pending_tasks, method_name)):
+            outcomes[index] = outcome
+
+            if self._cache is not None:
+                parser, filepath = tasks[index]
+                cache_put        = self._cache.put_index if index_only else self._cache.put
+
+                cache_put(self._make_cache_key(parser, filepath, index_only), filepath, *outcome)
+
+        if self._cache is not None:
+            self._cache.save()
+
+        return [
+            (parser, filepath, outcome[0])
+            for (parser, filepath), outcome in zip(tasks, outcomes)
+        ]
+
+    def _parse_in_workers(self, tasks, method_name = 'parse_with_types'):
+        """ Parse (or index) the files in parallel.
+
+            :return: the list of the container maps (or the indexes) and the
+                     defined data types in the given order
+        """
+        max_workers = min(len(tasks), self._max_workers or os.cpu_count() or 1)
+
+        if max_workers <= 1:
+            outcomes = [_parse_config_file(parser, filepath, method_name) for parser, filepath in tasks]
+        else:
+            executor_class = concurrent.futures.ProcessPoolExecutor \
+                if self._use_processes \
+                else concurrent.futures.ThreadPoolExecutor
+
+            with executor_class(max_workers) as executor:
+                outcomes = list(executor.map(
+                    _parse_config_file,
+                    [parser for parser, _ in tasks],
+                    [filepath for _, filepath in tasks],
+                    [method_name] * len(tasks)
+                ))
+
+            # NOTE The data types defined in the worker processes are registered here.
+            for (parser, _), outcome in zip(tasks, outcomes):
+                if outcome is not None:
+                    parser.register_types(outcome[1])
+
+        # NOTE The files using the data types defined by other files are parsed
+        #      again once all data types are registered.
+        return [
+            outcome if outcome is not None else getattr(parser, method_name)(filepath)
+            for (parser, filepath), outcome in zip(tasks, outcomes)
+        ]
+
+    def _make_cache_key(self, parser, filepath, index_only = False):
+        return '{}{}:{}'.format('index:' if index_only else '', type(parser).__name__, os.path.abspath(filepath))
@@ -0,0 +1,16 @@
+# v2
+import json
+
+from .mapping import MappingParser
+
+
+class JSONParser(MappingParser):
+    """ JSON configuration parser
+
+        See :class:`imagination.assembler.mapping.MappingParser` for the structure.
+    """
+    extensions = ('.json',)
+
+    def load(self, filepath : str) -> dict:
+        with open(filepath, encoding = 'utf-8') as f:
+            return json.load(f)
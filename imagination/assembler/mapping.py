@@ -0,0 +1,145 @@
+# v2
+import json
+
+from .abstract import ConfigParser
+from .xml      import convert_container_node_to_meta_container, register_type_node
+
+TYPE_SECTION       = 'type'
+CONTAINER_SECTIONS = ('entity', 'factorization', 'factorisation', 'callable')
+STRUCTURED_KIND    = 'json'
+
+
+class UnsupportedValueError(ValueError):
+    """ Error when the value is a mapping or a list, but not of the ``json`` type """
+
+
+def _to_text(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+
+    return str(value)
+
+
+def _infer_kind(value):
+    if isinstance(value, bool):
+        return 'bool'
+
+    if isinstance(value, int):
+        return 'int'
+
+    if isinstance(value, float):
+        return 'float'
+
+    if isinstance(value, (dict, list)):
+        return STRUCTURED_KIND
+
+    return 'str'
+
+
+class MappingNode(object):
+    """ Adapter of a mapping, e.g., decoded from JSON or TOML, to the node
+        interface used by the converters in :mod:`imagination.assembler.xml`
+
+        A container is a mapping with the same attributes as the XML element,
+        and optionally ``params`` and ``interceptions``. A parameter or an
+        item is a mapping with ``name``, ``type`` (inferred from a boolean,
+        numeric, mapping or list ``value`` if undefined), and either ``value``
+        or ``items``. A mapping or a list is only the value of the ``json`` type.
+
+        :param str tag: the name of the corresponding XML element
+        :param dict mapping: the mapping
+    """
+    __slots__ = ('tag', 'mapping')
+
+    def __init__(self, tag : str, mapping : dict):
+        self.tag     = tag
+        self.mapping = mapping
+
+    def name(self):
+        return self.tag
+
+    def attribute(self, key):
+        value = self.mapping.get(key)
+
+        if value is None and key == 'type' and self.tag in ('param', 'item'):
+            value = _infer_kind(self.mapping.get('value'))
+
+        return None if value is None else _to_text(value)
+
+    def children(self, name = None):
+        if self.tag in ('param', 'item'):
+            children = [MappingNode('item', item) for item in self.mapping.get('items') or []]
+        else:
+            children = [MappingNode('param', param) for param in self.mapping.get('params') or []]
+            children.extend(
+                MappingNode('interception', interception)
+                for interception in self.mapping.get('interceptions') or []
+            )
+
+        return [child for child in children if name is None or child.tag == name]
+
+    def data(self):
+        value = self.mapping.get('value')
+
+        if isinstance(value, (dict, list)):
+            kind = self.attribute('type')
+
+            if kind != STRUCTURED_KIND:
+                raise UnsupportedValueError('{} "{}": a mapping or a list is only allowed as the value of the {} type, not {}.'.format(
+                    self.tag, self.mapping.get('name'), STRUCTURED_KIND, kind
+                ))
+
+            return json.dumps(value)
+
+        return '' if value is None else _to_text(value)
+
+
+class MappingParser(ConfigParser):
+    """ Base parser of configuration files decoded into mappings
+
+        The document maps the data types (``type``) and each kind of
+        containers (``entity``, ``factorization`` and ``callable``) to the list
+        of their definitions, e.g., in JSON:
+
+        .. code-block:: json
+
+            {
+                "type": [{"name": "money", "with": "app.money.Money", "immutable": true}],
+                "entity": [
+                    {
+                        "id": "invoice",
+                        "class": "app.Invoice",
+                        "params": [
+                            {"name": "total", "type": "money", "value": "12.50 CAD"},
+                            {"name": "tags", "type": "list", "items": [{"value": "paid"}]}
+                        ],
+                        "interceptions": [{"before": "printer", "do": "print", "with": "warm_up"}]
+                    }
+                ]
+            }
+
+        :param TypeRegistry registry: the registry of data types (optional,
+                                      the process-wide ``type_registry`` by default)
+    """
+    def parse_with_types(self, filepath : str):
+        document         = self.load(filepath)
+        container_map    = {}
+        type_definitions = [
+            register_type_node(MappingNode(TYPE_SECTION, definition), self._registry)
+            for definition in document.get(TYPE_SECTION) or []
+        ]
+
+        for section in CONTAINER_SECTIONS:
+            for definition in document.get(section) or []:
+                meta_container = convert_container_node_to_meta_container(
+                    MappingNode(section, definition),
+                    self._registry
+                )
+
+                container_map[meta_container.id] = meta_container
+
+        return container_map, type_definitions
+
+    def load(self, filepath : str) -> dict:
+        """ Decode the file into the document. """
+        raise NotImplementedError()
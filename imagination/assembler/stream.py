@@ -0,0 +1,60 @@
+# v2
+from xml.etree.ElementTree import Element, iterparse
+
+from ..helper.transformer import UnknownKindError
+from .xml                 import ElementNode, XMLParser, convert_container_node_to_meta_container, register_type_node
+
+
+class StreamingXMLParser(XMLParser):
+    """ Streaming XML configuration parser
+
+        This is the alternative to :class:`imagination.assembler.xml.XMLParser`
+        for large configuration files. The file is read with
+        :func:`xml.etree.ElementTree.iterparse`, and each container is
+        converted and then freed as soon as its element ends, so that the
+        whole document is never kept in memory.
+
+        :param TypeRegistry registry: the registry of data types (optional,
+                                      the process-wide ``type_registry`` by default)
+    """
+    def parse_with_types(self, filepath : str):
+        root_element     = None
+        depth            = 0
+        meta_containers  = []  # meta container, or element using a data type defined later in the file
+        type_definitions = []
+
+        for event, element in iterparse(filepath, ('start', 'end')):
+            if event == 'start':
+                root_element = element if root_element is None else root_element
+                depth       += 1
+
+                continue
+
+            depth -= 1
+
+            if depth != 1:
+                continue
+
+            if element.tag.lower() == 'type':
+                type_definitions.append(register_type_node(ElementNode(element), self._registry))
+            else:
+                try:
+                    meta_containers.append(
+                        convert_container_node_to_meta_container(ElementNode(element), self._registry)
+                    )
+                except UnknownKindError:
+                    meta_containers.append(element)
+
+                    continue  # Converted again at the end of the file.
+
+            root_element.remove(element)
+
+        container_map = {}
+
+        for meta_container in meta_containers:
+            if isinstance(meta_container, Element):
+                meta_container = convert_container_node_to_meta_container(ElementNode(meta_container), self._registry)
+
+            container_map[meta_container.id] = meta_container
+
+        return container_map, type_definitions
@@ -0,0 +1,43 @@
+# v2
+try:
+    import tomllib
+except ImportError:  # Python 3.10 or older
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from .mapping import MappingParser
+
+
+class TOMLParserUnavailableError(RuntimeError):
+    """ Error when neither ``tomllib`` (Python 3.11+) nor ``tomli`` is available. """
+
+
+class TOMLParser(MappingParser):
+    """ TOML configuration parser
+
+        See :class:`imagination.assembler.mapping.MappingParser` for the
+        structure, where each list is an array of tables, e.g.,
+
+        .. code-block:: toml
+
+            [[entity]]
+            id    = "invoice"
+            class = "app.Invoice"
+
+                [[entity.params]]
+                name  = "total"
+                type  = "money"
+                value = "12.50 CAD"
+
+        .. note:: This requires Python 3.11 or newer, or ``tomli``.
+    """
+    extensions = ('.toml',)
+
+    def load(self, filepath : str) -> dict:
+        if tomllib is None:
+            raise TOMLParserUnavailableError(filepath)
+
+        with open(filepath, 'rb') as f:
+            return tomllib.load(f)
@@ -1,12 +1,15 @@
 # v2
 import re
 
+from xml.etree.ElementTree import iterparse
+
 from kotoba import load_from_file
 
-from ..meta.container  import Container
-from ..meta.definition import ParameterCollection, DataDefinition, Interception
-from .abstract         import ConfigParser
-from .handlers         import EntityCreator, FactorizationCreator, LambdaCreator
+from ..helper.transformer import COLLECTION_KINDS, TypeRegistry, UnknownKindError, type_registry
+from ..meta.container     import Container
+from ..meta.definition    import ParameterCollection, DataDefinition, Interception, InvalidInterceptionError
+from .abstract           import ConfigParser
+from .handlers           import EntityCreator, FactorizationCreator, LambdaCreator
 
 
 __re_factorization_element_name = re.compile('^factori(s|z)ation$')
@@ -21,10 +24,40 @@ class UnknownEventTypeError(RuntimeError):
     """ Error when an unknown event type is spotted. """
 
 
-def convert_container_node_to_meta_container(container_node) -> Container:
+class InvalidInterceptionAttributeError(ValueError):
+    """ Error when an attribute of the interception has an invalid value. """
+
+
+class ElementNode(object):
+    """ Adapter of :class:`xml.etree.ElementTree.Element` to the node interface
+        used by the converters in this module
+    """
+    __slots__ = ('element',)
+
+    def __init__(self, element):
+        self.element = element
+
+    def name(self):
+        return self.element.tag
+
+    def attribute(self, key):
+        return self.element.get(key)
+
+    def children(self, name = None):
+        return [
+            ElementNode(child)
+            for child in self.element
+            if name is None or child.tag == name
+        ]
+
+    def data(self):
+        return ''.join(self.element.itertext())
+
+
+def convert_container_node_to_meta_container(container_node, registry : TypeRegistry = None) -> Container:
     container_type   = container_node.name().lower()
     container_id     = container_node.attribute('id')
-    container_params = convert_container_node_to_parameter_collection(container_node)
+    container_params = convert_container_node_to_parameter_collection(container_node, registry = registry)
     interceptions    = convert_blocks_to_interception_metadatas(container_node)
 
     for creator in __container_creators:
@@ -37,7 +70,9 @@ def convert_container_node_to_meta_container(container_node) -> Container:
     raise UnsupportedContainerError(container_type)
 
 
-def convert_container_node_to_parameter_collection(node, key_property_name = None) -> ParameterCollection:
+def convert_container_node_to_parameter_collection(node, key_property_name = None,
+                                                   registry : TypeRegistry = None) -> ParameterCollection:
+    registry   = registry or type_registry
     collection = ParameterCollection()
 
     for child_node in node.children():
@@ -47,8 +82,11 @@ def convert_container_node_to_parameter_collection(node, key_property_name = Non
         name = child_node.attribute(key_property_name) or child_node.attribute('name') or None
         kind = child_node.attribute('type')
 
-        definition = convert_container_node_to_parameter_collection(child_node, 'key') \
-            if kind in ('tuple', 'list', 'dict') \
+        if kind and kind not in registry:
+            raise UnknownKindError('Unknown type: {} (Parameter: {})'.format(kind, name))
+
+        definition = convert_container_node_to_parameter_collection(child_node, 'key', registry) \
+            if kind in COLLECTION_KINDS \
             else child_node.data().strip()
 
         data = DataDefinition(definition, name, kind)
@@ -58,6 +96,29 @@ def convert_container_node_to_parameter_collection(node, key_property_name = Non
     return collection
 
 
+def parse_interception_number(node, child_node, name : str, cast : callable, is_valid : callable, expectation : str):
+    """ Parse the numeric attribute of the interception (``1`` if not given).
+
+        :raise InvalidInterceptionAttributeError: if the value is not a number or not valid
+    """
+    value = child_node.attribute(name)
+
+    if not value:
+        return 1
+
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+
+    if number is None or not is_valid(number):
+        raise InvalidInterceptionAttributeError(
+            'Invalid Interception for {}: {}="{}" ({})'.format(node.attribute('id'), name, value, expectation)
+        )
+
+    return number
+
+
 def convert_blocks_to_interception_metadatas(node):
     interceptor_id = node.attribute('id')
     interceptions  = []
@@ -75,6 +136,11 @@ def convert_blocks_to_interception_metadatas(node):
 
                 break
 
+        sample_rate  = parse_interception_number(node, child_node, 'sample', float, lambda rate: 0 < rate <= 1,
+                                                 'expected a number in (0, 1]')
+        sample_every = parse_interception_number(node, child_node, 'every', int, lambda every: every >= 1,
+                                                 'expected a positive integer')
+
         try:
             interceptions.append(Interception(
                 when_to_intercept   = event_type,
@@ -82,8 +148,13 @@ def convert_blocks_to_interception_metadatas(node):
                 method_to_intercept = method_to_intercept,
                 interceptor_id      = interceptor_id,
                 intercepting_method = intercepting_method,
+                count_items         = (child_node.attribute('count') or '').lower() == 'true',
+                mode                = child_node.attribute('mode') or 'sync',
+                sample_rate         = sample_rate,
+                sample_every        = sample_every,
+                enabled             = (child_node.attribute('enabled') or '').lower() != 'false',
             ))
-        except AssertionError as e:
+        except InvalidInterceptionError as e:
             raise UnknownEventTypeError(
                 'Invalid Interception for {} ({})'.format(
                     node.attribute('id'),
@@ -94,20 +165,88 @@ def convert_blocks_to_interception_metadatas(node):
     return interceptions
 
 
+def register_type_node(type_node, registry : TypeRegistry) -> tuple:
+    """ Register the data type defined by ``<type name="..." with="..." immutable="true"/>``.
+
+        :return: the tuple of the name, the caster path and the immutable flag
+    """
+    type_definition = (
+        type_node.attribute('name'),
+        type_node.attribute('with'),
+        (type_node.attribute('immutable') or '').lower() == 'true',
+    )
+
+    registry.register(*type_definition)
+
+    return type_definition
+
+
+def index_xml_file(filepath : str, registry : TypeRegistry) -> tuple:
+    """ Index the containers without converting their parameters.
+
+        Each container element is freed as soon as it ends. The data types
+        are registered as they are defined.
+
+        :return: the map from the container IDs to their interceptions, and
+                 the list of ``(name, caster path, immutable)``
+    """
+    root_element     = None
+    depth            = 0
+    index            = {}
+    type_definitions = []
+
+    for event, element in iterparse(filepath, ('start', 'end')):
+        if event == 'start':
+            root_element = element if root_element is None else root_element
+            depth       += 1
+
+            continue
+
+        depth -= 1
+
+        if depth != 1:
+            continue
+
+        node = ElementNode(element)
+
+        if element.tag.lower() == 'type':
+            type_definitions.append(register_type_node(node, registry))
+        else:
+            index[node.attribute('id').strip()] = convert_blocks_to_interception_metadatas(node)
+
+        root_element.remove(element)
+
+    return index, type_definitions
+
+
 class XMLParser(ConfigParser):
-    def __init__(self):
-        self._re_acceptable_file_extension = re.compile('\.xml$', re.IGNORECASE)
+    """ XML configuration parser
+
+        :param TypeRegistry registry: the registry of data types (optional,
+                                      the process-wide ``type_registry`` by default)
 
-    def can_handle(self, filepath : str):
-        return bool(self._re_acceptable_file_extension.search(filepath))
+        The data types defined with the ``type`` elements are registered
+        before the containers of the same file are parsed.
+    """
+    extensions = ('.xml',)
 
-    def parse(self, filepath : str):
-        root_node     = load_from_file(filepath)
-        container_map = {}
+    def parse_with_types(self, filepath : str):
+        root_node        = load_from_file(filepath)
+        container_map    = {}
+        type_definitions = [
+            register_type_node(type_node, self._registry)
+            for type_node in root_node.children('type')
+        ]
 
         for container_node in root_node.children():
-            meta_container = convert_container_node_to_meta_container(container_node)
+            if container_node.name().lower() == 'type':
+                continue
+
+            meta_container = convert_container_node_to_meta_container(container_node, self._registry)
 
             container_map[meta_container.id] = meta_container
 
-        return container_map
+        return container_map, type_definitions
+
+    def index_with_types(self, filepath : str):
+        return index_xml_file(filepath, self._registry)
@@ -0,0 +1,266 @@
+# v2
+""" Command-line interface
+
+.. code-block:: shell
+
+    python -m imagination stats containers.xml
+    python -m imagination dependants app.db containers.xml --transitive
+    python -m imagination validate containers.xml
+    python -m imagination compile containers.xml --cache /var/cache/app/imagination.bin
+    python -m imagination time containers.xml --repeat 5
+"""
+import argparse
+import json
+import sys
+import time
+
+from .assembler.core   import Assembler
+from .assembler.json   import JSONParser
+from .assembler.stream import StreamingXMLParser
+from .assembler.toml   import TOMLParser
+from .core             import Imagination
+from .loader           import clear_resolution_cache
+from .meta.container   import Entity, Factorization, Lambda
+
+EXIT_OK       = 0
+EXIT_FINDINGS = 1
+EXIT_ERROR    = 2
+
+
+class CommandError(RuntimeError):
+    """ Error when the command cannot run with the given options """
+
+
+def make_assembler(options, core : Imagination = None, lazy : bool = False) -> Assembler:
+    # NOTE Only the XML parser is replaced with --stream.
+    parsers = [StreamingXMLParser(), JSONParser(), TOMLParser()] if options.stream else None
+
+    return Assembler(
+        core,
+        max_workers = options.workers,
+        strict      = options.strict,
+        parsers     = parsers,
+        cache_path  = options.cache,
+        lazy        = lazy,
+    )
+
+
+def load(options) -> Imagination:
+    assembler = make_assembler(options)
+
+    assembler.load(*options.files)
+
+    return assembler.core
+
+
+def collect_stats(core : Imagination) -> dict:
+    """ Collect the statistics of the graph. """
+    graph         = core.dependency_graph
+    depths        = graph.depths()
+    interceptions = core._collect_interceptions()
+    fan_outs      = [len(graph.dependencies(container_id)) for container_id in graph.ids]
+    fan_ins       = {container_id: len(graph.dependants(container_id)) for container_id in graph.ids}
+
+    kinds = {Entity: 'entities', Factorization: 'factorizations', Lambda: 'callables'}
+    stats = {'containers': len(graph), 'entities': 0, 'factorizations': 0, 'callables': 0}
+
+    for container_id in graph.ids:
+        kind = kinds.get(type(core.get_metadata(container_id)))
+
+        if kind:
+            stats[kind] += 1
+
+    stats.update({
+        'dependencies'           : graph.edge_count,
+        'max_depth'              : max(depths.values() or [0]),
+        'max_fan_out'            : max(fan_outs or [0]),
+        'mean_fan_out'           : round(sum(fan_outs) / len(fan_outs), 2) if fan_outs else 0,
+        'most_depended'          : sorted(
+            [item for item in fan_ins.items() if item[1]],
+            key = lambda item: (-item[1], item[0])
+        )[:5],
+        'interceptions'          : len(interceptions),
+        'enabled_interceptions'  : len([i for i in interceptions if core.is_interception_enabled(i)]),
+        'intercepted_containers' : len({interception.intercepted_id for interception in interceptions}),
+        'cycles'                 : graph.cycles(),
+    })
+
+    return stats
+
+
+def run_stats(options, output) -> int:
+    stats = collect_stats(load(options))
+
+    if options.json:
+        output.write(json.dumps(stats, indent = 4) + '\n')
+
+        return EXIT_OK
+
+    for name, value in stats.items():
+        if name == 'most_depended':
+            value = ', '.join('{} ({})'.format(*item) for item in value) or '-'
+        elif name == 'cycles':
+            value = '; '.join(', '.join(cycle) for cycle in value) or '-'
+
+        output.write('{:<24} {}\n'.format(name.replace('_', ' '), value))
+
+    return EXIT_OK
+
+
+def run_dependants(options, output) -> int:
+    core = load(options)
+
+    if not core.contain(options.id):
+        raise CommandError('Undefined container: {}'.format(options.id))
+
+    for dependant_id in core.dependency_graph.dependants(options.id, options.transitive):
+        output.write(dependant_id + '\n')
+
+    return EXIT_OK
+
+
+def run_validate(options, output) -> int:
+    findings = load(options).validate(raise_error = False)
+
+    for finding in findings:
+        output.write('{} [{}] {}\n'.format(finding.container_id, finding.code, finding.message))
+
+    output.write('{} problem(s) found\n'.format(len(findings)))
+
+    return EXIT_FINDINGS if findings else EXIT_OK
+
+
+def run_compile(options, output) -> int:
+    if not options.cache:
+        raise CommandError('The path to the cache (--cache) is required.')
+
+    assembler = make_assembler(options)
+    assembler.load(*options.files)
+
+    # NOTE The index for the lazy loading is cached too.
+    make_assembler(options, Imagination(), lazy = True).load(*options.files)
+
+    output.write('{} container(s) from {} file(s) cached in {}\n'.format(
+        len(assembler.core.all_ids()),
+        len(options.files),
+        options.cache
+    ))
+
+    return EXIT_OK
+
+
+def run_time(options, output) -> int:
+    """ Time the phases of the first (cold) run and of the repeated (warm) runs.
+
+        The paths resolved by a run are forgotten before the next one, but
+        the modules imported by the first run stay imported.
+    """
+    rows = []
+
+    for _ in range(max(options.repeat, 1)):
+        clear_resolution_cache()
+
+        started_at = time.perf_counter()
+        core       = load(options)
+        loaded_at  = time.perf_counter()
+
+        core.lock_down()
+
+        locked_at = time.perf_counter()
+        failures  = 0
+
+        for container_id in core.all_ids():
+            try:
+                core.get(container_id)
+            except Exception:
+                failures += 1
+
+        warmed_at = time.perf_counter()
+
+        rows.append((loaded_at - started_at, locked_at - loaded_at, warmed_at - locked_at, failures))
+
+    for index, phase in enumerate(('parse', 'lock-down', 'warm-up')):
+        line    = '{:<10} cold {:10.2f} ms'.format(phase, rows[0][index] * 1000)
+        timings = sorted(row[index] for row in rows[1:])
+
+        if timings:
+            line += '  warm min {:10.2f} ms  median {:10.2f} ms  max {:10.2f} ms'.format(
+                timings[0] * 1000,
+                timings[len(timings) // 2] * 1000,
+                timings[-1] * 1000
+            )
+
+        output.write(line + '\n')
+
+    if rows[-1][3]:
+        output.write('{} container(s) failed to be activated\n'.format(rows[-1][3]))
+
+    return EXIT_OK
+
+
+def make_argument_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help = False)
+    common.add_argument('--cache', metavar = 'PATH', help = 'the path to the metadata cache')
+    common.add_argument('--stream', action = 'store_true', help = 'parse XML files with the streaming parser')
+    common.add_argument('--strict', action = 'store_true', help = 'fail when a container ID is defined twice')
+    common.add_argument('--workers', type = int, metavar = 'N', help = 'the number of workers to parse the files')
+    common.add_argument('--path', action = 'append', default = [], metavar = 'DIR',
+                        help = 'the directory to import the modules from (repeatable)')
+
+    parser     = argparse.ArgumentParser(prog = 'imagination', description = 'Inspect the configuration files.')
+    subparsers = parser.add_subparsers(dest = 'command', metavar = 'COMMAND')
+    subparsers.required = True
+
+    stats = subparsers.add_parser('stats', parents = [common], help = 'print the statistics of the graph')
+    stats.add_argument('--json', action = 'store_true', help = 'print in JSON')
+    stats.set_defaults(run = run_stats)
+
+    dependants = subparsers.add_parser('dependants', parents = [common],
+                                       help = 'list the containers depending on the given one')
+    dependants.add_argument('id', help = 'the container ID')
+    dependants.add_argument('--transitive', action = 'store_true', help = 'include the indirect dependants')
+    dependants.set_defaults(run = run_dependants)
+
+    validate = subparsers.add_parser('validate', parents = [common], help = 'validate the whole graph')
+    validate.set_defaults(run = run_validate)
+
+    compile_ = subparsers.add_parser('compile', parents = [common], help = 'write the metadata cache')
+    compile_.set_defaults(run = run_compile)
+
+    time_ = subparsers.add_parser('time', parents = [common], help = 'time parse, lock-down and warm-up')
+    time_.add_argument('--repeat', type = int, default = 1, metavar = 'N', help = 'the number of runs')
+    time_.set_defaults(run = run_time)
+
+    for subparser in (stats, dependants, validate, compile_, time_):
+        subparser.add_argument('files', nargs = '+', metavar = 'FILE', help = 'the configuration files')
+
+    return parser
+
+
+def main(argv : list = None, output = None, errors = None) -> int:
+    """ Run the command, e.g., ``main(['stats', 'containers.xml'])``.
+
+        :param output: the stream of the outcome (optional, ``sys.stdout`` by default)
+        :param errors: the stream of the errors (optional, ``sys.stderr`` by default)
+
+        :return: the exit code
+    """
+    options = make_argument_parser().parse_args(argv)
+    output  = output or sys.stdout
+    errors  = errors or sys.stderr
+
+    sys.path[:0] = options.path
+
+    try:
+        return options.run(options, output)
+    except CommandError as error:
+        errors.write('{}\n'.format(error))
+
+        return EXIT_ERROR
+    except Exception as error:
+        errors.write('{}: {}\n'.format(type(error).__name__, error))
+
+        return EXIT_ERROR
+    finally:
+        for path in options.path:
+            sys.path.remove(path)
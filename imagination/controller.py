@@ -5,7 +5,8 @@ import logging
 from .debug           import get_logger, dump_meta_container
 from .exc             import UnexpectedParameterException, MissingParameterException, \
                              UnexpectedDefinitionTypeException, DuplicateKeyError
-from .loader          import Loader
+from .loader          import resolve
+from .memory          import MemoryRecorder
 from .meta.container  import Container, Entity, Factorization, Lambda
 from .meta.definition import DataDefinition, ParameterCollection
 from .wrapper         import Wrapper
@@ -39,20 +40,31 @@ def _assert_with_annotation(entity_id, metadata):
         pass
 
 class Controller(object):
+    __slots__ = ('__metadata', '__core_get', '__core_get_interceptions', '__transformer_cast',
+                 '__core_dispatch_advice', '__logger', '__folded_params', '__validated_signature',
+                 '__container_instance', '__wrapper_instance', '__ignored_parameters',
+                 '__memory_recorder', 'activation_sequence')
+
     def __init__(self,
                  metadata               : Container,
                  core_get               : callable,
                  core_get_interceptions : callable,
-                 transformer_cast       : callable
+                 transformer_cast       : callable,
+                 core_dispatch_advice   : callable = None,
+                 memory_recorder        : MemoryRecorder = None
                  ):
         self.__metadata               = metadata
         self.__core_get               = core_get
         self.__core_get_interceptions = core_get_interceptions
         self.__transformer_cast       = transformer_cast
-        self.__logger                 = get_logger('controller/{}'.format(metadata.id))
+        self.__core_dispatch_advice   = core_dispatch_advice
+        self.__logger                 = get_logger('controller')  # NOTE shared, as the messages include the ID
+        self.__folded_params          = None  # Parameters pre-computed at lock-down
+        self.__validated_signature    = None  # Outcome of the static analysis
         self.__container_instance     = None  # Cache
         self.__wrapper_instance       = None  # Wrapper Cache
         self.__ignored_parameters     = []
+        self.__memory_recorder        = memory_recorder
         self.activation_sequence      = None  # Activation Sequence
 
     @property
@@ -66,27 +78,58 @@ class Controller(object):
         if self.activated():
             return self.__wrapper_instance or self.__container_instance
 
-        new_instance = self.__instantiate_container()
+        cacheable = self.__metadata.cacheable
+
+        if self.__memory_recorder is None:
+            new_instance = self.__instantiate_container()
+        else:
+            new_instance = self.__memory_recorder.measure(self.__metadata.id, self.__instantiate_container)
 
-        if self.__metadata.cacheable:
+            if not cacheable:
+                self.__memory_recorder.track(self.__metadata.id, new_instance)
+
+        if cacheable:
             self.__container_instance = new_instance
 
         interceptions = self.__core_get_interceptions(self.__metadata.id)
 
-        if not interceptions:
-            return self.__container_instance
+        if interceptions is None:
+            return new_instance
 
-        self.__wrapper_instance = Wrapper(
+        wrapper_instance = Wrapper(
             self.__core_get,
-            self.__container_instance,
-            interceptions
+            new_instance,
+            interceptions,
+            self.__metadata.id,
+            self.__core_dispatch_advice
         )
 
-        return self.__wrapper_instance
+        # NOTE The instance of the entity which is not cacheable is made on every activation.
+        if cacheable:
+            self.__wrapper_instance = wrapper_instance
+
+        return wrapper_instance
+
+    def fold_parameters(self, transformer_fold_parameters : callable):
+        """ Pre-compute the static parameters, e.g., with :meth:`Transformer.fold_parameters`. """
+        self.__folded_params = transformer_fold_parameters(self.__metadata.params)
+
+    def set_validated_signature(self, validated_signature):
+        """ Skip the checks already done by :class:`imagination.analysis.GraphValidator`. """
+        self.__validated_signature = validated_signature
+
+    def reset_interceptions(self):
+        """ Apply the latest interception graph to the wrapper. """
+        if self.__wrapper_instance is None:
+            return
+
+        self.__wrapper_instance._reset_interceptions(
+            self.__core_get_interceptions(self.__metadata.id) or {}
+        )
 
     def __instantiate_container(self):
         metadata       = self.__metadata
-        params         = self.__cast_to_params(self.__metadata.params)
+        params         = self.__cast_to_params(self.__folded_params or self.__metadata.params)
         container_type = type(metadata)
 
         # Figure out the make method.
@@ -95,10 +138,10 @@ class Controller(object):
         make_method         = None
 
         if container_type is Lambda:
-            return Loader(metadata.fq_callable_name).package
+            return resolve(metadata.fq_callable_name)
 
         if container_type is Entity:
-            make_method = Loader(metadata.fqcn).package
+            make_method = resolve(metadata.fqcn)
         elif container_type is Factorization:
             factory_service     = self.__core_get(metadata.factory_id)
             factory_method_name = metadata.factory_method_name
@@ -108,8 +151,13 @@ class Controller(object):
             raise NotImplementedError('No make method for {}'.format(container_type.__name__))
 
         # Compile parameters.
-        signature        = inspect.signature(make_method)
-        expected_params  = [signature.parameters[name] for name in signature.parameters]
+        validated_signature = self.__validated_signature
+
+        if validated_signature is not None and validated_signature.expected_params is not None:
+            expected_params = validated_signature.expected_params
+        else:
+            signature       = inspect.signature(make_method)
+            expected_params = [signature.parameters[name] for name in signature.parameters]
 
         # Check whether the signature include dynamic parameters.
         self.__scan_for_dynamic_parameters(expected_params)
@@ -201,8 +249,11 @@ class Controller(object):
         undefined_fixed_parameter_count = len(fixed_parameter_list)
         undefined_parameters            = []
 
+        verified_parameters = self.__validated_signature.verified_params if self.__validated_signature else ()
+
         for fixed_parameter in fixed_parameter_list:
-            _assert_with_annotation(self.__metadata.id, fixed_parameter)
+            if fixed_parameter.name not in verified_parameters:
+                _assert_with_annotation(self.__metadata.id, fixed_parameter)
 
             if fixed_parameter.defined:
                 self.__logger.debug('{}: Param {}: Already defined'.format(self.__metadata.id, fixed_parameter.name))
@@ -250,6 +301,9 @@ class Controller(object):
 
     def __scan_for_dynamic_parameters(self, expected_params):
         for param in expected_params:
+            if param.name in self.__ignored_parameters:
+                continue
+
             if param.kind == param.VAR_POSITIONAL:
                 self.__ignored_parameters.append(param.name)
 
@@ -314,6 +368,8 @@ class Undefined(object):
 
 
 class ParameterMetadata(object):
+    __slots__ = ('index', 'name', 'required', 'spec', 'value', 'defined', 'source_type', 'source_ref')
+
     def __init__(self, index, name, required, spec):
         self.index       = index
         self.name        = name
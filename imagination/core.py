@@ -1,13 +1,22 @@
 # v2
 import threading
 
+from .analysis           import GraphValidationError, GraphValidator
 from .controller         import Controller
+from .dispatcher         import AdviceDispatcher
 from .exc                import UndefinedContainerIDError
-from .helper.general     import exclusive_lock
+from .graph              import DependencyGraph
+from .helper.general     import exclusive_lock, extract_class_paths_from_parameters
 from .helper.transformer import Transformer
-from .meta.container     import Container
+from .loader             import ModulePreloader
+from .memory             import MemoryRecorder
+from .meta.container     import Container, Entity, Lambda
+from .meta.definition    import Interception
+from .registration       import make_callable, make_entity, make_factorization
+from .wrapper            import WILDCARD_METHOD
 
 CORE_SELF_REFERENCE = 'container'
+LATENCY_RECORDER_ID = 'imagination.latency_recorder'
 
 
 class CoreOnLockDownError(RuntimeError):
@@ -26,24 +35,162 @@ class Imagination(object):
             (1) --> (0..n) method name
                             (1) --> (3) event-type
                                         (1) --> (0..n) interception
-    """
-    def __init__(self, transformer : Transformer = None):
-        self.__internal_lock  = threading.Lock()
-        self.__controller_map = {}
-        self.__on_lockdown    = False
-        self.__transformer    = transformer or Transformer(self.get)
-
-        self.__interception_graph = {}
 
-    def lock_down(self):
+        :param Transformer transformer: the data transformer (optional)
+        :param bool record_latency: flag to record the latency of every public
+                                    method of every entity, except callables,
+                                    with :class:`imagination.interceptor.metrics.LatencyRecorder`
+        :param AdviceDispatcher advice_dispatcher: the dispatcher of the
+                                                   interceptions in the "async" mode (optional)
+        :param bool record_memory: flag to record the memory allocated by the
+                                   activation of every entity and to count the
+                                   live instances of the entities which are not
+                                   cacheable, with :class:`imagination.memory.MemoryRecorder`
+    """
+    def __init__(self, transformer : Transformer = None, record_latency : bool = False,
+                 advice_dispatcher : AdviceDispatcher = None, record_memory : bool = False):
+        self.__internal_lock     = threading.Lock()
+        self.__controller_map    = {}
+        self.__on_lockdown       = False
+        self.__transformer       = transformer or Transformer(self.get)
+        self.__advice_dispatcher = advice_dispatcher or AdviceDispatcher()
+
+        self.__interception_graph    = {}
+        self.__interceptions         = None  # All interceptions (after lock-down)
+        self.__interception_switches = {}    # (interceptor ID, intercepting method or None) -> enabled
+        self.__lazy_index            = {}    # container ID -> (load, interceptions) until loaded
+        self.__findings              = None  # Outcome of the last validation
+        self.__dependency_graph      = None  # DependencyGraph (after lock-down)
+        self.__module_preloader      = None
+        self.__record_latency        = record_latency
+        self.__memory_recorder       = MemoryRecorder().start() if record_memory else None
+
+        if record_latency:
+            self.set_metadata(
+                LATENCY_RECORDER_ID,
+                Entity(LATENCY_RECORDER_ID, 'imagination.interceptor.metrics.LatencyRecorder')
+            )
+
+    def lock_down(self, preload_modules : bool = False, max_workers : int = None,
+                  import_order : list = None, validate : bool = False):
         """ Lock down the core.
 
-            This will prevent the core from accepting new entity definition.
+            This will prevent the core from accepting new entity definition,
+            and pre-compute the parameters which depend neither on the
+            environment nor on entities.
+
+            :param bool preload_modules: flag to import all modules referred
+                                         by the metadata in background
+            :param int max_workers: the number of threads to import the modules (optional)
+            :param list import_order: the module names to import one by one in
+                                      this order instead, e.g., the
+                                      ``import_order`` recorded by the
+                                      previous run (optional)
+            :param bool validate: flag to validate the whole graph with :meth:`validate`
 
             .. note:: This method will be invoked on the first ``get`` call.
         """
+        if self.__on_lockdown:
+            return
+
         self.__on_lockdown = True
 
+        self._generate_interception_graph()
+
+        if preload_modules:
+            self.__module_preloader = ModulePreloader(
+                self._collect_module_paths(),
+                max_workers,
+                import_order
+            ).start()
+
+        for controller in list(self.__controller_map.values()):
+            controller.fold_parameters(self.__transformer.fold_parameters)
+
+        if validate:
+            self.validate()
+
+    def validate(self, raise_error : bool = True) -> list:
+        """ Validate the whole graph at once.
+
+            See :class:`imagination.analysis.GraphValidator` for the checks.
+            The outcome is given to the controllers, which skip the same
+            checks on instantiation.
+
+            :param bool raise_error: flag to raise :class:`imagination.analysis.GraphValidationError`
+                                     with all findings
+
+            :return: the list of :class:`imagination.analysis.Finding`
+        """
+        validator = GraphValidator(self, (CORE_SELF_REFERENCE,))
+        findings  = validator.validate()
+
+        self.__findings = findings
+
+        for container_id, validated_signature in validator.signatures.items():
+            self.get_info(container_id).set_validated_signature(validated_signature)
+
+        if findings and raise_error:
+            raise GraphValidationError(findings)
+
+        return findings
+
+    @property
+    def findings(self) -> list:
+        """ The findings of the last :meth:`validate` (or ``None``) """
+        return self.__findings
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """ The indexed graph of the dependencies and the interceptions
+
+            After lock-down, the graph is built once, on first use. Before
+            lock-down, it is built on every use.
+
+            .. note:: The containers loaded on first use are loaded.
+        """
+        if self.__dependency_graph is not None:
+            return self.__dependency_graph
+
+        graph = DependencyGraph.from_core(self)
+
+        if self.__on_lockdown:
+            self.__dependency_graph = graph
+
+        return graph
+
+    @property
+    def module_preloader(self) -> ModulePreloader:
+        """ The module preloader started by :meth:`lock_down` (or ``None``)
+
+            It reports the import time of each module (``timings``), the
+            failures (``failures``) and the order of completion (``import_order``).
+        """
+        return self.__module_preloader
+
+    def shut_down(self, timeout : float = None):
+        """ Shut down the core.
+
+            This will execute all pending interceptions in the "async" mode,
+            and stop tracing the allocations for ``record_memory``.
+
+            :param float timeout: the maximum waiting time per worker thread (optional)
+        """
+        self.__advice_dispatcher.shut_down(timeout)
+
+        if self.__memory_recorder is not None:
+            self.__memory_recorder.stop()
+
+    @property
+    def transformer(self) -> Transformer:
+        """ The data transformer """
+        return self.__transformer
+
+    @property
+    def advice_dispatcher(self) -> AdviceDispatcher:
+        """ The dispatcher of the interceptions in the "async" mode """
+        return self.__advice_dispatcher
+
     def is_on_lockdown(self) -> bool:
         """ Check if the core is locked down. """
         return self.__on_lockdown
@@ -60,9 +207,31 @@ class Imagination(object):
             for entity_id, meta_container in list(meta_container_map.items()):
                 self.set_metadata(entity_id, meta_container)
 
+    def add_lazy_metadata(self, load : callable, index : dict):
+        """ Define the containers whose metadata is loaded on first use, e.g.,
+            by :class:`imagination.assembler.core.Assembler` with ``lazy = True``.
+
+            :param callable load: the callable returning the map of the
+                                  container IDs to the metadata, which is
+                                  called when one of the containers is
+                                  first used
+            :param dict index: the map from the container IDs to the
+                               interceptions by the containers, which apply
+                               before the containers are loaded
+
+            .. warning:: This method allows ID overriding.
+        """
+        if self.__on_lockdown:
+            raise CoreOnLockDownError()
+
+        with exclusive_lock(self.__internal_lock):
+            for container_id, interceptions in index.items():
+                self.__controller_map.pop(container_id, None)
+                self.__lazy_index[container_id] = (load, list(interceptions))
+
     def contain(self, entity_id : str):
         """ Check if the entity ID is registered. """
-        return entity_id in self.__controller_map
+        return entity_id in self.__controller_map or entity_id in self.__lazy_index
 
     def get(self, entity_id : str):
         """ Retrieve an entity by ID """
@@ -77,7 +246,6 @@ class Imagination(object):
         # On the first request, the core will be on lockdown.
         if not self.is_on_lockdown():
             self.lock_down()
-            self._generate_interception_graph()
 
         if not info.activation_sequence:
             new_sequence = self._calculate_activation_sequence(entity_id)
@@ -100,14 +268,24 @@ class Imagination(object):
 
             :rtype: tuple
         """
-        return tuple(self.__controller_map.keys())
+        return tuple(self.__controller_map.keys()) + tuple(self.__lazy_index.keys())
 
     def get_info(self, entity_id : str) -> Controller:
-        if not self.contain(entity_id):
-            raise UndefinedContainerIDError(entity_id)
+        if entity_id not in self.__controller_map:
+            if entity_id not in self.__lazy_index:
+                raise UndefinedContainerIDError(entity_id)
+
+            self._load_lazily(entity_id)
+
+            if entity_id not in self.__controller_map:
+                raise UndefinedContainerIDError(entity_id)
 
         return self.__controller_map[entity_id]
 
+    def is_loaded(self, entity_id : str) -> bool:
+        """ Check if the metadata of the container is loaded, i.e., not pending with :meth:`add_lazy_metadata`. """
+        return entity_id in self.__controller_map
+
     def get_metadata(self, entity_id : str) -> Container:
         """ Retrieve the metadata of the container. """
         return self.get_info(entity_id).metadata
@@ -121,15 +299,94 @@ class Imagination(object):
         if self.__on_lockdown:
             raise CoreOnLockDownError()
 
+        self.__lazy_index.pop(entity_id, None)
+
+        self._install_metadata(entity_id, new_meta_container)
+
+    def _install_metadata(self, entity_id, new_meta_container):
         # Redefine the container ID.
         new_meta_container.id = entity_id
         new_controller        = Controller(new_meta_container,
                                            self.get,
                                            self.get_interceptions,
-                                           self.__transformer.cast)
+                                           self.__transformer.cast,
+                                           self.__advice_dispatcher.dispatch,
+                                           self.__memory_recorder)
+
+        if self.__on_lockdown:
+            new_controller.fold_parameters(self.__transformer.fold_parameters)
 
         self.__controller_map[entity_id] = new_controller
 
+    def _load_lazily(self, entity_id):
+        """ Load the metadata of all containers defined with the given one by :meth:`add_lazy_metadata`. """
+        with exclusive_lock(self.__internal_lock):
+            if entity_id not in self.__lazy_index:
+                return  # Loaded by another thread.
+
+            load = self.__lazy_index[entity_id][0]
+
+            for container_id, meta_container in load().items():
+                if self.__lazy_index.get(container_id, (None,))[0] is not load:
+                    continue  # Overridden by another definition.
+
+                del self.__lazy_index[container_id]
+
+                self._install_metadata(container_id, meta_container)
+
+            # NOTE The container is no longer defined, e.g., the file has changed since indexing.
+            self.__lazy_index.pop(entity_id, None)
+
+            if not self.__on_lockdown:
+                return
+
+            # The interceptions from the index are replaced by the ones in the loaded metadata.
+            self.__interceptions = None
+
+            self._generate_interception_graph()
+
+    def register_entity(self, entity_id : str, cls, args : list = None, params : dict = None,
+                        interceptions : list = None, cacheable : bool = True) -> Entity:
+        """ Define the entity without configuration files.
+
+            :param str entity_id: the entity ID
+            :param cls: the class or its dotted path
+            :param list args: the positional parameters
+            :param dict params: the keyword parameters
+            :param list interceptions: the interceptions by this entity
+            :param bool cacheable: flag to reuse the instance
+
+            The parameters are converted with :func:`imagination.registration.make_data_definition`,
+            e.g., ``core.register_entity('app.db', Database, params = {'pool': ref('app.pool')})``.
+        """
+        metadata = make_entity(entity_id, cls, args, params, interceptions, cacheable)
+
+        self.set_metadata(entity_id, metadata)
+
+        return metadata
+
+    def register_factorization(self, entity_id : str, factory_id : str, factory_method_name : str,
+                               args : list = None, params : dict = None,
+                               interceptions : list = None, cacheable : bool = True) -> Container:
+        """ Define the entity made by the factory method of another entity without configuration files. """
+        metadata = make_factorization(entity_id, factory_id, factory_method_name, args, params,
+                                      interceptions, cacheable)
+
+        self.set_metadata(entity_id, metadata)
+
+        return metadata
+
+    def register_callable(self, entity_id : str, function, cacheable : bool = True) -> Lambda:
+        """ Define the callable entity without configuration files.
+
+            :param function: the callable or its dotted path
+        """
+        metadata = make_callable(entity_id, function, cacheable)
+
+        self.set_metadata(entity_id, metadata)
+
+        return metadata
+
     def get_interceptions(self, intercepted_id, event_type = None,
                           method_to_intercept = None):
         if intercepted_id not in self.__interception_graph:
@@ -148,6 +405,36 @@ class Imagination(object):
 
         return sub_graph[event_type][method_to_intercept]
 
+    def get_latency_stats(self, entity_id : str = None) -> dict:
+        """ Retrieve the latency histograms recorded with ``record_latency``.
+
+            :param str entity_id: the ID of the entity to report (optional)
+
+            :return: the map from ``(entity_id, method_name)`` to
+                     :class:`imagination.interceptor.metrics.LatencyHistogram`,
+                     which is empty if the latency is not recorded.
+        """
+        if not self.__record_latency:
+            return {}
+
+        return self.get(LATENCY_RECORDER_ID).snapshot(entity_id)
+
+    def get_memory_report(self, top : int = 10, samples : int = 3) -> dict:
+        """ Report the memory recorded with ``record_memory``.
+
+            Each call takes the census of the live instances, so that the
+            entities whose instances keep growing over the last ``samples``
+            calls are reported as ``growing``. See :meth:`imagination.memory.MemoryRecorder.report`.
+
+            :param int top: the number of the entities which allocated the most
+
+            :return: the report, which is empty if the memory is not recorded.
+        """
+        if self.__memory_recorder is None:
+            return {}
+
+        return self.__memory_recorder.report(top, samples)
+
     def _calculate_activation_sequence(self, entity_id):
         global CORE_SELF_REFERENCE
 
@@ -185,8 +472,76 @@ class Imagination(object):
             for step in sorted_sequence
         ]
 
-    def _generate_interception_graph(self):
-        interception_graph   = self.__interception_graph
+    def enable_interceptions(self, interceptor_id : str, intercepting_method : str = None) -> int:
+        """ Enable the interceptions by the given interceptor at runtime.
+
+            :param str interceptor_id: the ID of the intercepting entity
+            :param str intercepting_method: the name of the intercepting method (optional)
+
+            :return: the number of matching interceptions
+        """
+        return self._switch_interceptions(True, interceptor_id, intercepting_method)
+
+    def disable_interceptions(self, interceptor_id : str, intercepting_method : str = None) -> int:
+        """ Disable the interceptions by the given interceptor at runtime.
+
+            The intercepted methods without any other interceptions fall back
+            to the original methods.
+
+            :param str interceptor_id: the ID of the intercepting entity
+            :param str intercepting_method: the name of the intercepting method (optional)
+
+            :return: the number of matching interceptions
+
+            .. note:: The intercepted methods already retrieved by the
+                      external code are not affected.
+        """
+        return self._switch_interceptions(False, interceptor_id, intercepting_method)
+
+    def is_interception_enabled(self, interception : Interception) -> bool:
+        switches = self.__interception_switches
+        specific = (interception.interceptor_id, interception.intercepting_method)
+        general  = (interception.interceptor_id, None)
+
+        if specific in switches:
+            return switches[specific]
+
+        if general in switches:
+            return switches[general]
+
+        return interception.enabled
+
+    def _switch_interceptions(self, enabled, interceptor_id, intercepting_method):
+        with exclusive_lock(self.__internal_lock):
+            switches = self.__interception_switches
+
+            if intercepting_method is None:
+                for switch_key in [key for key in switches if key[0] == interceptor_id]:
+                    del switches[switch_key]
+
+            switches[(interceptor_id, intercepting_method)] = enabled
+
+            matched_count = len([
+                interception
+                for interception in self._collect_interceptions()
+                if interception.interceptor_id == interceptor_id
+                and intercepting_method in (None, interception.intercepting_method)
+            ])
+
+            if not self.__on_lockdown:
+                return matched_count
+
+            self._generate_interception_graph()
+
+            for controller in list(self.__controller_map.values()):
+                controller.reset_interceptions()
+
+        return matched_count
+
+    def _collect_interceptions(self):
+        if self.__interceptions is not None:
+            return self.__interceptions
+
         unique_interceptions = list()
 
         for entity_id, controller in list(self.__controller_map.items()):
@@ -198,7 +553,50 @@ class Imagination(object):
 
                 unique_interceptions.append(interception)
 
-        for interception in unique_interceptions:
+        for _, interceptions in list(self.__lazy_index.values()):
+            for interception in interceptions:
+                if interception in unique_interceptions:
+                    continue
+
+                unique_interceptions.append(interception)
+
+        if self.__record_latency:
+            unique_interceptions.extend(self._generate_latency_interceptions())
+
+        if self.__on_lockdown:
+            self.__interceptions = unique_interceptions
+
+        return unique_interceptions
+
+    def _collect_module_paths(self):
+        """ Collect the names of all modules referred by the metadata. """
+        class_paths = set()
+
+        for controller in list(self.__controller_map.values()):
+            metadata = controller.metadata
+
+            if type(metadata) is Lambda:
+                class_paths.add(metadata.fq_callable_name)
+            elif isinstance(metadata, Entity):
+                class_paths.add(metadata.fqcn)
+
+            class_paths.update(extract_class_paths_from_parameters(metadata.params))
+
+        return {
+            class_path.rpartition('.')[0]
+            for class_path in class_paths
+            if '.' in class_path
+        }
+
+    def _generate_interception_graph(self):
+        """ Generate the interception graph with the enabled interceptions.
+
+            The intercepted entity stays in the graph even if all of its
+            interceptions are disabled, so that they can be enabled later.
+        """
+        interception_graph = {}
+
+        for interception in self._collect_interceptions():
             event_type         = interception.when_to_intercept
             intercepted_id     = interception.intercepted_id
             intercepted_method = interception.method_to_intercept
@@ -206,13 +604,27 @@ class Imagination(object):
             if intercepted_id not in interception_graph:
                 interception_graph[intercepted_id] = {}
 
+            if not self.is_interception_enabled(interception):
+                continue
+
             method_to_event_map = interception_graph[intercepted_id]
 
             if intercepted_method not in method_to_event_map:
                 method_to_event_map[intercepted_method] = {
                     'after'  : [],
+                    'around' : [],
                     'before' : [],
                     'error'  : [],
                 }
 
             method_to_event_map[intercepted_method][event_type].append(interception)
+
+        # Swap the whole graph at once.
+        self.__interception_graph = interception_graph
+
+    def _generate_latency_interceptions(self):
+        return [
+            Interception('around', entity_id, WILDCARD_METHOD, LATENCY_RECORDER_ID, 'measure')
+            for entity_id, controller in list(self.__controller_map.items())
+            if entity_id != LATENCY_RECORDER_ID and type(controller.metadata) is not Lambda
+        ]
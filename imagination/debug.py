@@ -5,7 +5,6 @@ import pprint
 import sys
 
 import imagination
-import collections
 
 _working_dir        = os.getcwd()
 _module_path        = imagination.__path__[0]
@@ -44,6 +43,8 @@ def get_logger(namespace, level = None, handler = None):
 
 
 class PrintableMixin(object):
+    __slots__ = ()
+
     def __repr__(self):
         classinfo = type(self)
         props     = dir(self)
@@ -59,7 +60,7 @@ class PrintableMixin(object):
 
             prop = getattr(self, prop_name)
 
-            if isinstance(prop, collections.Callable):
+            if callable(prop):
                 continue
 
             exported.append('{}="{}"'.format(prop_name, prop))
@@ -70,19 +71,57 @@ class PrintableMixin(object):
         return '<{} {}>'.format(fqcn, ' '.join(exported))
 
 
-def dump_meta_container(metadata):
-    params = metadata.params
-
-    data = {
-        'id'           : metadata.id,
-        'class'        : metadata.fqcn,
-        'dependencies' : metadata.dependencies,
-        'params'       : {
-            'sequence' : [i for i in params.sequence()],
-            'items'    : {k: v for k, v in list(params.items())},
-        },
+def export_data_definition(data):
+    """ Export the data definition as plain data. """
+    definition = data.definition
+
+    if hasattr(definition, 'sequence'):  # ParameterCollection
+        definition = export_parameters(definition)
+
+    return {
+        'name'       : data.name,
+        'kind'       : data.kind,
+        'definition' : definition,
+    }
+
+
+def export_parameters(params):
+    """ Export the parameter collection as plain data. """
+    return {
+        'sequence' : [export_data_definition(i) for i in params.sequence()],
+        'items'    : {k: export_data_definition(v) for k, v in list(params.items())},
+    }
+
+
+def export_meta_container(metadata) -> dict:
+    """ Export the container metadata as plain data, e.g., to compare the metadata. """
+    return {
+        'id'            : metadata.id,
+        'type'          : type(metadata).__name__,
+        'class'         : getattr(metadata, 'fqcn', None) or getattr(metadata, 'fq_callable_name', None),
+        'factory'       : (metadata.factory_id, metadata.factory_method_name) if hasattr(metadata, 'factory_id') else None,
+        'cacheable'     : metadata.cacheable,
+        'dependencies'  : sorted(metadata.dependencies),
+        'params'        : export_parameters(metadata.params),
+        'interceptions' : [
+            {
+                'event'               : interception.when_to_intercept,
+                'intercepted_id'      : interception.intercepted_id,
+                'method_to_intercept' : interception.method_to_intercept,
+                'interceptor_id'      : interception.interceptor_id,
+                'intercepting_method' : interception.intercepting_method,
+                'count_items'         : interception.count_items,
+                'mode'                : interception.mode,
+                'sample_rate'         : interception.sample_rate,
+                'sample_every'        : interception.sample_every,
+                'enabled'             : interception.enabled,
+            }
+            for interception in metadata.interceptions
+        ],
     }
 
-    pprint.pprint(data,
+
+def dump_meta_container(metadata):
+    pprint.pprint(export_meta_container(metadata),
                   indent = 2,
                   stream = sys.stderr if _in_testing_debug else sys.stdout)
@@ -32,16 +32,39 @@ except ImportError as e:
     # Fall back to Python 2.7 mode
     from inspect import getargspec as getfullargspec
 
+try:
+    from collections.abc import Callable
+except ImportError as e:
+    # Fall back to Python 2.7 mode
+    from collections import Callable
+
+import functools
+import os
 import sys
 
 from imagination.exception import MisplacedValidatorError
-import collections
 
-_disable_decorator = 'sphinx' in sys.modules
+_disable_decorator = 'sphinx' in sys.modules \
+    or os.environ.get('IMAGINATION_DISABLE_VALIDATOR', '').lower() not in ('', '0', 'false', 'no')
+
+_list_types = (list, tuple, set)
 
 class SpecialType(object):
     function = 'type:function'
 
+def set_disabled(disabled=True):
+    '''
+    Disable (or enable) :func:`restrict_type` globally.
+
+    When disabled, the decorated callable is returned as it is, without any
+    wrapper. This only applies to the callables decorated afterward, e.g.,
+    call this before importing the modules using :func:`restrict_type`, or
+    set the environment variable ``IMAGINATION_DISABLE_VALIDATOR=1``.
+    '''
+    global _disable_decorator
+
+    _disable_decorator = disabled
+
 def restrict_type(*restricted_list, **restricted_map):
     '''
     The method decorator to validate the type of inputs given to the method.
@@ -59,6 +82,11 @@ def restrict_type(*restricted_list, **restricted_map):
      * If the given type is ``None``, there will be no restriction.
      * If the given type is ``long``, the value of ``int`` and ``float`` are also valid.
      * If the given type is ``unicode``, the valud of ``str`` is also valid.
+     * If no types are given, the annotations of the parameters are used instead.
+
+    The checks are compiled once, when the method is decorated. The decorator
+    returns the method as it is when disabled with :func:`set_disabled` or
+    with the environment variable ``IMAGINATION_DISABLE_VALIDATOR=1``.
 
     .. warning:: In Imagination 1.6, types ``unicode`` and ``long`` are no longer have fallback check in order to support Python 3.3.
 
@@ -85,97 +113,117 @@ def restrict_type(*restricted_list, **restricted_map):
             def add_friend(self, person):
                 self.__friends.append(person)
 
+            # Example with the annotations
+            @restrict_type()
+            def rename(self, name : str):
+                self.name = name
+
     '''
     def inner_decorator(reference):
         if _disable_decorator:
             return reference
 
-        if isinstance(reference, type) or not isinstance(reference, collections.Callable):
+        if isinstance(reference, type) or not callable(reference):
             raise MisplacedValidatorError(
                 'Can only be used with callable objects, e.g., functions, class methods, instance methods and static methods.'
             )
 
-        params   = getfullargspec(reference).args
+        spec     = getfullargspec(reference)
+        params   = spec.args
         is_class = params and params[0] == 'self'
+        offset   = 1 if is_class else 0
+
+        allowed_list       = restricted_list
+        allowed_dictionary = restricted_map
+
+        if not allowed_list and not allowed_dictionary:
+            annotations = {
+                name: annotation
+                for name, annotation in (getattr(spec, 'annotations', None) or {}).items()
+                if name != 'return' and isinstance(annotation, type)
+            }
+
+            allowed_list       = [annotations.get(name) for name in params[offset:]]
+            allowed_dictionary = annotations
+
+        positional_checks = [
+            (index + offset, index, __compile_check(expected_type))
+            for index, expected_type in enumerate(allowed_list)
+            if expected_type
+        ]
+        keyword_checks = [
+            (key, key, __compile_check(expected_type))
+            for key, expected_type in allowed_dictionary.items()
+            if expected_type
+        ]
+
+        if not positional_checks and not keyword_checks:
+            return reference
 
-        if is_class:
-            def new_reference(self, *args, **kwargs):
-                __validate_type(restricted_list, restricted_map, args, kwargs)
-
-                return reference(self, *args, **kwargs)
-        else:
-            def new_reference(*args, **kwargs):
-                __validate_type(restricted_list, restricted_map, args, kwargs)
-
-                return reference(*args, **kwargs)
-
-        new_reference.__doc__ == reference.__doc__
-
-        return new_reference
+        return functools.wraps(reference)(__compile_validator(reference, positional_checks, keyword_checks))
 
     return inner_decorator
 
-def __validate_type(allowed_list, allowed_dictionary, argument_list, argument_dictionary):
-    allowed_list = allowed_list[:len(argument_list)]
-    reference    = None
+def __compile_check(expected_type):
+    '''
+    Compile the check of the expected type into the types for :func:`isinstance`,
+    the types of which the instance is also valid, and the name of the expected type.
+    '''
+    if expected_type == SpecialType.function:
+        return Callable, (), 'function'
 
-    try:
-        for index in range(len(allowed_list)):
-            expected_type = allowed_list[index]
-            reference     = argument_list[index]
+    if not isinstance(expected_type, type):
+        raise TypeError('The expected type must be a type.')
 
-            if not expected_type:
-                continue
+    # The list, the tuple and the set are interchangeable.
+    fallback_types = _list_types if expected_type in _list_types else ()
 
-            assert __assert_type(reference, expected_type),\
-                expected_type == SpecialType.function\
-                and 'function'\
-                or expected_type.__name__
+    return expected_type, fallback_types, expected_type.__name__
 
-        for key in allowed_dictionary:
-            expected_type = allowed_dictionary[key]
+def __compile_validator(reference, positional_checks, keyword_checks):
+    '''
+    Generate the wrapper of the reference with one inlined check per restricted
+    parameter, so that each call only goes through :func:`isinstance`.
+    '''
+    namespace = {'reference': reference, 'reject': __reject}
+    lines     = ['def new_reference(*args, **kwargs):']
 
-            if key not in argument_dictionary:
-                continue
+    if positional_checks:
+        lines.append('    count = len(args)')
 
-            reference = argument_dictionary[key]
+    for position, label, check in positional_checks:
+        lines.append(__compile_condition(namespace, 'count > {0}'.format(position), 'args[{0}]'.format(position), label, check))
 
-            if not expected_type:
-                continue
+    if keyword_checks:
+        lines.append('    if kwargs:')
 
-            assert __assert_type(reference, expected_type),\
-                expected_type.__name__
+        for key, label, check in keyword_checks:
+            lines.append('    ' + __compile_condition(namespace, '{0!r} in kwargs'.format(key), 'kwargs[{0!r}]'.format(key), label, check))
 
-    except AssertionError as e:
-        actual_type = e.message if 'message' in dir(e) else e
+    lines.append('    return reference(*args, **kwargs)')
 
-        raise TypeError('Argument #%s was excepting %s but %s has been given.' % (index, actual_type, type(reference).__name__))
+    exec(compile('\n'.join(lines), '<restrict_type {0}>'.format(getattr(reference, '__name__', reference)), 'exec'), namespace)
 
-def __assert_type(instance, expected_type):
-    list_types = [list, tuple, set]
+    return namespace['new_reference']
 
-    callable_expected = expected_type == SpecialType.function
-    instance_expected = isinstance(expected_type, type)
+def __compile_condition(namespace, precondition, value, label, check):
+    expected_type, fallback_types, expected_name = check
 
-    if not callable_expected and not instance_expected:
-        raise TypeError('The expected type must be a type.')
+    suffix = len(namespace)
 
-    fallback_types = []
+    namespace['type_{0}'.format(suffix)]  = expected_type
+    namespace['check_{0}'.format(suffix)] = (label, expected_name)
 
-    # If the callable is expected, validate if it is callable.
+    condition = '{0} and not isinstance({1}, type_{2})'.format(precondition, value, suffix)
 
-    if callable_expected:
-        return isinstance(instance, collections.Callable)
+    if fallback_types:
+        namespace['fallback_{0}'.format(suffix)] = fallback_types
 
-    # Now, validate the type of INSTANCE.
-    if expected_type in list_types:
-        fallback_types.extend(list_types)
+        condition += ' and type({0}) not in fallback_{1}'.format(value, suffix)
 
-    if type(instance) == expected_type or isinstance(instance, expected_type):
-        return True
+    return '    if {0}: reject(check_{1}, {2})'.format(condition, suffix, value)
 
-    for fallback_type in fallback_types:
-        if type(instance) == fallback_type:
-            return True
+def __reject(check, value):
+    label, expected_name = check
 
-    return False
+    raise TypeError('Argument #%s was excepting %s but %s has been given.' % (label, expected_name, type(value).__name__))
@@ -0,0 +1,207 @@
+# v2
+import atexit
+import queue
+import threading
+import weakref
+
+from .debug import get_logger
+
+OVERFLOW_BLOCK       = 'block'
+OVERFLOW_DROP        = 'drop'
+OVERFLOW_DROP_OLDEST = 'drop-oldest'
+
+_STOP = object()
+
+
+class AdviceDispatcher(object):
+    """ Background dispatcher for interceptions in the "async" mode
+
+        The advices are queued and executed by the worker threads, which are
+        started on the first dispatch.
+
+        :param int max_queue_size: the maximum number of pending advices
+        :param int worker_count: the number of worker threads
+        :param str overflow: the policy when the queue is full; ``block`` to
+                             wait for a free slot up to ``block_timeout``
+                             seconds (then drop), ``drop`` to drop the new
+                             advice, or ``drop-oldest`` to drop the oldest
+                             pending advice.
+        :param float block_timeout: the waiting time for the ``block`` policy
+                                    (optional, wait indefinitely by default)
+
+        With the ``block`` policy, an advice dispatched by another advice
+        never waits, as the worker threads might be the only ones to free a
+        slot. It is queued if a slot is free, or executed right away.
+
+        The pending advices are drained by :meth:`shut_down`, which is also
+        called when the interpreter exits.
+    """
+    def __init__(self, max_queue_size : int = 1024, worker_count : int = 1,
+                 overflow : str = OVERFLOW_BLOCK, block_timeout : float = None):
+        if overflow not in (OVERFLOW_BLOCK, OVERFLOW_DROP, OVERFLOW_DROP_OLDEST):
+            raise ValueError('Unknown overflow policy: {}'.format(overflow))
+
+        self.__queue         = queue.Queue(max_queue_size)
+        self.__worker_count  = worker_count
+        self.__overflow      = overflow
+        self.__block_timeout = block_timeout
+        self.__workers       = []
+        self.__lock          = threading.Lock()
+        self.__queue_lock    = threading.Lock()  # Orders the dispatches and the stop signals.
+        self.__local         = threading.local()  # NOTE "in_worker" is only set in the worker threads.
+        self.__shut_down     = False
+        self.__logger        = get_logger('dispatcher')
+        self.__counters      = {'dispatched': 0, 'dropped': 0, 'failed': 0}
+
+    def dispatch(self, advice : callable, *largs, **kwargs) -> bool:
+        """ Queue the advice.
+
+            :return: ``False`` if the advice is dropped.
+
+            .. note:: After shutting down, the advice is executed right away.
+        """
+        task = (advice, largs, kwargs)
+
+        if self.__overflow == OVERFLOW_BLOCK and getattr(self.__local, 'in_worker', False):
+            return self.__dispatch_from_worker(task)
+
+        # NOTE No advice is queued after the stop signals, which are never dropped.
+        with self.__queue_lock:
+            shut_down = self.__shut_down
+
+            if not shut_down:
+                if not self.__workers:
+                    self.__start()
+
+                try:
+                    if self.__overflow == OVERFLOW_BLOCK:
+                        self.__queue.put(task, timeout = self.__block_timeout)
+                    else:
+                        self.__put_or_drop(task)
+                except queue.Full:
+                    self.__count('dropped')
+
+                    return False
+
+        if shut_down:
+            self.__execute(advice, largs, kwargs)
+
+            return True
+
+        self.__count('dispatched')
+
+        return True
+
+    def shut_down(self, timeout : float = None):
+        """ Execute all pending advices and stop the worker threads.
+
+            :param float timeout: the maximum waiting time per worker thread (optional)
+        """
+        with self.__queue_lock:
+            with self.__lock:
+                if self.__shut_down:
+                    return
+
+                self.__shut_down = True
+                workers          = list(self.__workers)
+
+            for worker in workers:
+                self.__queue.put(_STOP)
+
+        for worker in workers:
+            worker.join(timeout)
+
+    @property
+    def pending(self):
+        """ The number of pending advices """
+        return self.__queue.qsize()
+
+    def snapshot(self) -> dict:
+        """ Report the numbers of ``dispatched``, ``dropped``, ``failed`` and ``pending`` advices. """
+        with self.__lock:
+            counters = dict(self.__counters)
+
+        counters['pending'] = self.pending
+
+        return counters
+
+    def __dispatch_from_worker(self, task):
+        """ Queue the advice without waiting for a free slot (or for the queue lock), or execute it right away. """
+        queued = False
+
+        if self.__queue_lock.acquire(blocking = False):
+            try:
+                if not self.__shut_down:
+                    self.__queue.put_nowait(task)
+
+                    queued = True
+            except queue.Full:
+                pass
+            finally:
+                self.__queue_lock.release()
+
+        if not queued:
+            self.__execute(*task)
+
+        self.__count('dispatched')
+
+        return True
+
+    def __put_or_drop(self, task):
+        try:
+            self.__queue.put_nowait(task)
+
+            return
+        except queue.Full:
+            if self.__overflow == OVERFLOW_DROP:
+                raise
+
+        try:
+            self.__queue.get_nowait()
+            self.__count('dropped')
+        except queue.Empty:
+            pass
+
+        self.__queue.put_nowait(task)
+
+    def __start(self):
+        with self.__lock:
+            if self.__workers:
+                return
+
+            for index in range(self.__worker_count):
+                worker = threading.Thread(
+                    target = self.__work,
+                    name   = 'imagination-advice-{}'.format(index),
+                    daemon = True,
+                )
+
+                worker.start()
+
+                self.__workers.append(worker)
+
+        reference = weakref.ref(self)
+
+        atexit.register(lambda: reference() and reference().shut_down())
+
+    def __work(self):
+        self.__local.in_worker = True
+
+        while True:
+            task = self.__queue.get()
+
+            if task is _STOP:
+                return
+
+            self.__execute(*task)
+
+    def __execute(self, advice, largs, kwargs):
+        try:
+            advice(*largs, **kwargs)
+        except Exception as error:
+            self.__count('failed')
+            self.__logger.error('Failed to execute {}: {}'.format(advice, error))
+
+    def __count(self, name):
+        with self.__lock:
+            self.__counters[name] += 1
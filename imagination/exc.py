@@ -25,3 +25,7 @@ class DuplicateKeyError(Exception):
 
 class UnknownEnvironmentVariableError(Exception):
     """ Unknown environment variable error """
+
+
+class UnknownExternalValueError(Exception):
+    """ Unknown value from the value provider error """
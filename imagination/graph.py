@@ -0,0 +1,314 @@
+# v2
+""" Dependency graph of the containers
+
+.. code-block:: python
+
+    graph = core.dependency_graph
+
+    graph.dependants('app.db', transitive = True)
+    graph.depth('app.web')
+    graph.cycles()
+    graph.invalidated('app.db')
+"""
+from array import array
+
+from .exc import UndefinedContainerIDError
+
+
+class DependencyGraph(object):
+    """ Indexed graph of the dependencies between the containers
+
+        Each container ID is numbered once, and the edges are kept in the
+        compressed form, i.e., one array with the successors of all nodes and
+        one array with the offset of each node into it. The reverse edges are
+        indexed the same way, so the dependants are found as fast as the
+        dependencies. The strongly connected components and the depths are
+        calculated once, on first use.
+
+        :param dict graph: the map of each container ID to the IDs of its
+                           dependencies, which are ignored if not in the map
+        :param dict interceptors: the map of each container ID to the IDs of
+                                  the entities intercepting it (optional)
+    """
+    def __init__(self, graph : dict, interceptors : dict = None):
+        self.__ids     = tuple(graph)
+        self.__indexes = {container_id: index for index, container_id in enumerate(self.__ids)}
+
+        self.__dependencies = self.__index_edges(graph)
+        self.__dependants   = self.__reverse_edges(self.__dependencies)
+        self.__intercepted  = self.__reverse_edges(self.__index_edges(interceptors or {}))
+
+        self.__components = None  # strongly connected components (node indexes), dependencies first
+        self.__cycles     = None  # components with a cycle (node indexes)
+        self.__depths     = None  # node index -> depth
+
+    @staticmethod
+    def from_core(core) -> 'DependencyGraph':
+        """ Build the graph of all containers of the core, including the ones loaded on first use. """
+        graph        = {container_id: core.get_metadata(container_id).dependencies for container_id in core.all_ids()}
+        interceptors = {}
+
+        for interception in core._collect_interceptions():
+            interceptors.setdefault(interception.intercepted_id, set()).add(interception.interceptor_id)
+
+        return DependencyGraph(graph, interceptors)
+
+    @property
+    def ids(self) -> tuple:
+        """ All container IDs, in the order of the given map """
+        return self.__ids
+
+    @property
+    def edge_count(self) -> int:
+        """ The number of the dependencies between the containers in the graph """
+        return len(self.__dependencies[1])
+
+    def __len__(self):
+        return len(self.__ids)
+
+    def __contains__(self, container_id):
+        return container_id in self.__indexes
+
+    def dependencies(self, container_id : str) -> list:
+        """ Get the IDs of the direct dependencies of the container. """
+        return self.__to_ids(self.__successors(self.__dependencies, self.__index_of(container_id)))
+
+    def dependants(self, container_id : str, transitive : bool = False) -> list:
+        """ Get the IDs of the containers depending on the given one.
+
+            :param bool transitive: flag to include the indirect dependants
+
+            :return: the sorted list of the container IDs
+        """
+        index = self.__index_of(container_id)
+
+        if not transitive:
+            return sorted(self.__to_ids(self.__successors(self.__dependants, index)))
+
+        return sorted(self.__to_ids(self.__reach([index], (self.__dependants,), False)))
+
+    def invalidated(self, *container_ids) -> list:
+        """ Get the IDs of the containers affected by the change of the given ones.
+
+            They are the given containers, their direct and indirect
+            dependants, and the entities intercepted by any of them.
+
+            :return: the sorted list of the container IDs
+        """
+        indexes = [self.__index_of(container_id) for container_id in container_ids]
+
+        return sorted(self.__to_ids(self.__reach(indexes, (self.__dependants, self.__intercepted), True)))
+
+    def depth(self, container_id : str) -> int:
+        """ Get the length of the longest dependency chain from the container.
+
+            The containers in the same cycle have the same depth.
+        """
+        return self.__get_depths()[self.__index_of(container_id)]
+
+    def depths(self) -> dict:
+        """ Get the map of each container ID to its depth, see :meth:`depth`. """
+        return dict(zip(self.__ids, self.__get_depths()))
+
+    def components(self) -> list:
+        """ Get the strongly connected components with Tarjan's algorithm.
+
+            :return: the list of the components, each of which is the list of
+                     the container IDs in the order of discovery, where the
+                     dependencies come before their dependants
+        """
+        return [self.__to_ids(component) for component in self.__get_components()]
+
+    def cycles(self) -> list:
+        """ Get the components with more than one container or with a container depending on itself. """
+        if self.__cycles is None:
+            dependencies = self.__dependencies
+
+            self.__cycles = [
+                component
+                for component in self.__get_components()
+                if len(component) > 1 or component[0] in self.__successors(dependencies, component[0])
+            ]
+
+        return [self.__to_ids(component) for component in self.__cycles]
+
+    def __index_of(self, container_id):
+        try:
+            return self.__indexes[container_id]
+        except KeyError:
+            raise UndefinedContainerIDError(container_id)
+
+    def __to_ids(self, indexes):
+        ids = self.__ids
+
+        return [ids[index] for index in indexes]
+
+    def __index_edges(self, graph):
+        """ Index the edges as the offsets and the successors of the nodes, sorted by ID. """
+        indexes    = self.__indexes
+        offsets    = array('i', [0])
+        successors = array('i')
+
+        for container_id in self.__ids:
+            target_ids = sorted(target_id for target_id in (graph.get(container_id) or ()) if target_id in indexes)
+
+            successors.extend(indexes[target_id] for target_id in target_ids)
+            offsets.append(len(successors))
+
+        return offsets, successors
+
+    def __reverse_edges(self, edges):
+        offsets, successors = edges
+        node_count          = len(self.__ids)
+        reverse_offsets     = array('i', [0]) * (node_count + 1)
+        predecessors        = array('i', [0]) * len(successors)
+
+        for successor in successors:
+            reverse_offsets[successor + 1] += 1
+
+        for index in range(node_count):
+            reverse_offsets[index + 1] += reverse_offsets[index]
+
+        positions = reverse_offsets[:-1]
+
+        for index in range(node_count):
+            for successor in successors[offsets[index]:offsets[index + 1]]:
+                predecessors[positions[successor]] = index
+                positions[successor] += 1
+
+        return reverse_offsets, predecessors
+
+    def __successors(self, edges, index):
+        offsets, successors = edges
+
+        return successors[offsets[index]:offsets[index + 1]]
+
+    def __reach(self, indexes, edge_sets, inclusive):
+        """ Get the nodes reachable from the given ones through any of the edge sets. """
+        visited = bytearray(len(self.__ids))
+        pending = list(indexes)
+        reached = []
+
+        if inclusive:
+            for index in indexes:
+                if not visited[index]:
+                    visited[index] = 1
+                    reached.append(index)
+
+        while pending:
+            index = pending.pop()
+
+            for offsets, successors in edge_sets:
+                for successor in successors[offsets[index]:offsets[index + 1]]:
+                    if visited[successor]:
+                        continue
+
+                    visited[successor] = 1
+                    reached.append(successor)
+                    pending.append(successor)
+
+        return reached
+
+    def __get_components(self):
+        if self.__components is not None:
+            return self.__components
+
+        offsets, successors = self.__dependencies
+
+        node_count = len(self.__ids)
+        unvisited  = -1
+        indexes    = array('i', [unvisited]) * node_count
+        low_links  = array('i', [0]) * node_count
+        on_stack   = bytearray(node_count)
+        stack      = []
+        components = []
+        counter    = 0
+
+        for root in range(node_count):
+            if indexes[root] != unvisited:
+                continue
+
+            indexes[root] = low_links[root] = counter
+            counter      += 1
+            on_stack[root] = 1
+
+            stack.append(root)
+
+            frames = [(root, iter(successors[offsets[root]:offsets[root + 1]]))]
+
+            while frames:
+                node, node_successors = frames[-1]
+                descended             = False
+
+                for successor in node_successors:
+                    if indexes[successor] == unvisited:
+                        indexes[successor] = low_links[successor] = counter
+                        counter           += 1
+                        on_stack[successor] = 1
+
+                        stack.append(successor)
+                        frames.append((successor, iter(successors[offsets[successor]:offsets[successor + 1]])))
+
+                        descended = True
+
+                        break
+
+                    if on_stack[successor]:
+                        low_links[node] = min(low_links[node], indexes[successor])
+
+                if descended:
+                    continue
+
+                frames.pop()
+
+                if frames:
+                    parent            = frames[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[node])
+
+                if low_links[node] != indexes[node]:
+                    continue
+
+                component = []
+
+                while True:
+                    member           = stack.pop()
+                    on_stack[member] = 0
+
+                    component.append(member)
+
+                    if member == node:
+                        break
+
+                components.append(component[::-1])
+
+        self.__components = components
+
+        return components
+
+    def __get_depths(self):
+        if self.__depths is not None:
+            return self.__depths
+
+        offsets, successors = self.__dependencies
+
+        depths       = array('i', [0]) * len(self.__ids)
+        component_of = array('i', [0]) * len(self.__ids)
+
+        # NOTE The dependencies of each component are in the components found before it.
+        for component_index, component in enumerate(self.__get_components()):
+            depth = 0
+
+            for member in component:
+                component_of[member] = component_index
+
+            for member in component:
+                for successor in successors[offsets[member]:offsets[member + 1]]:
+                    if component_of[successor] != component_index:
+                        depth = max(depth, depths[successor] + 1)
+
+            for member in component:
+                depths[member] = depth
+
+        self.__depths = depths
+
+        return depths
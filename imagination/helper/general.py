@@ -40,3 +40,36 @@ def extract_dependency_ids_from_parameters(collection : ParameterCollection):
         container_ids.add(item.definition)
 
     return container_ids
+
+
+def extract_class_paths_from_parameters(collection : ParameterCollection):
+    """ Extract the dotted paths of the parameters of the "class" type. """
+    class_paths = set()
+
+    for item in collection.sequence():
+        if type(item.definition) is ParameterCollection:
+            class_paths.update(
+                extract_class_paths_from_parameters(item.definition)
+            )
+
+            continue
+
+        if item.kind != 'class':
+            continue
+
+        class_paths.add(item.definition)
+
+    for k, item in list(collection.items()):
+        if type(item.definition) is ParameterCollection:
+            class_paths.update(
+                extract_class_paths_from_parameters(item.definition)
+            )
+
+            continue
+
+        if item.kind != 'class':
+            continue
+
+        class_paths.add(item.definition)
+
+    return class_paths
@@ -0,0 +1,194 @@
+# v2
+import json
+import os
+import threading
+import time
+
+
+class ValueProvider(object):
+    """ Source of the values referred by the value blocks, e.g., ``{ file:/run/secrets/db }``
+
+        The provider is registered to the transformer with the name used
+        before the colon. See :meth:`imagination.helper.transformer.Transformer.register_provider`.
+    """
+    def get(self, reference : str) -> str:
+        """ Get the value by reference.
+
+            :return: the value or ``None`` if the value is undefined.
+        """
+        raise NotImplementedError()
+
+
+class CachedFileReader(object):
+    """ Cache of the parsed files
+
+        A cached file is not checked again within ``ttl`` seconds. After
+        that, it is only read and parsed again if its modification time or
+        its size has changed.
+
+        :param callable parse: the callable taking the content of the file
+                               and returning the parsed data
+        :param float ttl: the time to trust the cached data in seconds
+    """
+    def __init__(self, parse : callable, ttl : float = 5.0):
+        self.__parse = parse
+        self.__ttl   = ttl
+        self.__cache = {}  # path -> (checked at, (mtime, size), parsed data)
+        self.__lock  = threading.Lock()
+        self.reads   = 0
+
+    def read(self, path : str):
+        """ Get the parsed data of the file (or ``None`` if the file does not exist). """
+        now    = time.monotonic()
+        cached = self.__cache.get(path)
+
+        if cached is not None and now - cached[0] < self.__ttl:
+            return cached[2]
+
+        # NOTE Concurrent callers wait for one read instead of reading the same file.
+        with self.__lock:
+            cached = self.__cache.get(path)
+
+            if cached is not None and now - cached[0] < self.__ttl:
+                return cached[2]
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self.__cache.pop(path, None)
+
+                return None
+
+            version = (stat.st_mtime_ns, stat.st_size)
+
+            if cached is not None and cached[1] == version:
+                self.__cache[path] = (now, version, cached[2])
+
+                return cached[2]
+
+            with open(path, encoding = 'utf-8') as f:
+                parsed = self.__parse(f.read())
+
+            self.reads += 1
+
+            self.__cache[path] = (now, version, parsed)
+
+            return parsed
+
+    def clear(self):
+        with self.__lock:
+            self.__cache.clear()
+
+
+class FileProvider(ValueProvider):
+    """ Provider of the content of a file without the trailing line break, e.g., ``{ file:/run/secrets/db }``
+
+        :param str directory: the directory to read the files from, e.g.,
+                              ``/run/secrets`` (optional, any path by default)
+        :param float ttl: the time to trust the cached content in seconds
+    """
+    def __init__(self, directory : str = None, ttl : float = 5.0):
+        self.__directory = os.path.abspath(directory) if directory else None
+        self.__reader    = CachedFileReader(lambda content: content.rstrip('\r\n'), ttl)
+
+    @property
+    def reader(self) -> CachedFileReader:
+        return self.__reader
+
+    def get(self, reference : str) -> str:
+        if self.__directory is None:
+            return self.__reader.read(reference)
+
+        path = os.path.abspath(os.path.join(self.__directory, reference))
+
+        if os.path.dirname(path) != self.__directory:
+            return None  # Only the files directly in the directory are allowed.
+
+        return self.__reader.read(path)
+
+
+class KeyedFileProvider(ValueProvider):
+    """ Provider of the values by key in the parsed files, e.g., ``{ dotenv:/app/.env#DB_HOST }``
+
+        :param callable parse: the callable taking the content of the file and
+                               returning the parsed data
+        :param float ttl: the time to trust the cached data in seconds
+    """
+    def __init__(self, parse : callable, ttl : float = 5.0):
+        self.__reader = CachedFileReader(parse, ttl)
+
+    @property
+    def reader(self) -> CachedFileReader:
+        return self.__reader
+
+    def get(self, reference : str) -> str:
+        path, _, key = reference.rpartition('#')
+
+        if not path:
+            return None
+
+        data = self.__reader.read(path)
+
+        return None if data is None else self.lookup(data, key)
+
+    def lookup(self, data, key : str) -> str:
+        return data.get(key)
+
+
+class DotEnvProvider(KeyedFileProvider):
+    """ Provider of the variables in dotenv files, e.g., ``{ dotenv:/app/.env#DB_HOST }`` """
+    def __init__(self, ttl : float = 5.0):
+        super().__init__(parse_dotenv, ttl)
+
+
+class JSONProvider(KeyedFileProvider):
+    """ Provider of the values in JSON files, e.g., ``{ json:/etc/app.json#db.hosts.0 }``
+
+        The key is the dot-separated path to the value. A value which is not
+        a string is encoded in JSON.
+    """
+    def __init__(self, ttl : float = 5.0):
+        super().__init__(json.loads, ttl)
+
+    def lookup(self, data, key : str) -> str:
+        for name in key.split('.') if key else []:
+            try:
+                data = data[int(name)] if isinstance(data, list) else data[name]
+            except (KeyError, IndexError, TypeError, ValueError):
+                return None
+
+        return data if isinstance(data, str) else json.dumps(data)
+
+
+def parse_dotenv(content : str) -> dict:
+    """ Parse the dotenv file, i.e., ``KEY=value`` per line. """
+    variables = {}
+
+    for line in content.splitlines():
+        line = line.strip()
+
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+
+        if line.startswith('export '):
+            line = line[7:]
+
+        key, _, value = line.partition('=')
+        value         = value.strip()
+
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+
+        variables[key.strip()] = value
+
+    return variables
+
+
+def make_default_providers() -> dict:
+    """ Make the providers for ``file``, ``secret`` (``/run/secrets``), ``dotenv`` and ``json``. """
+    return {
+        'file'   : FileProvider(),
+        'secret' : FileProvider('/run/secrets'),
+        'dotenv' : DotEnvProvider(),
+        'json'   : JSONProvider(),
+    }
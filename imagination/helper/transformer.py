@@ -1,23 +1,397 @@
 # v2
+import collections
+import datetime
+import decimal
+import json
 import logging
 import os
+import pathlib
 import re
+import threading
 
 from ..debug           import get_logger
-from ..exc             import UnknownEnvironmentVariableError
-from ..loader          import Loader
-from ..meta.definition import DataDefinition
+from ..exc             import UnknownEnvironmentVariableError, UnknownExternalValueError
+from ..loader          import resolve
+from ..meta.definition import DataDefinition, ParameterCollection
+from .provider         import ValueProvider, make_default_providers
 
 
-class Transformer(object):
-    """ Data transformer """
-    def __init__(self, core_getter : callable):
-        self.__core_getter = core_getter
+_re_value_block = re.compile(
+    r'\{\s*(?:\$(?P<env_name>[A-Za-z0-9_\.]+)|(?P<source>[a-z][a-z0-9_]*):(?P<reference>[^\s\}]+))'
+    r'(?:\s+or\s+(?:"(?P<string_default>[^"]+)"|(?P<number_default>[0-9]*\.[0-9]*|[0-9]+)))?'
+    r'\s*\}',
+    re.IGNORECASE
+)
+_re_duration_part = re.compile(r'\s*(?P<amount>[0-9]*\.?[0-9]+)\s*(?P<unit>ms|us|w|d|h|m|s)', re.IGNORECASE)
+
+CACHE_SIZE        = 4096  # per cache of each transformer
+STRUCTURAL_KINDS  = ('entity', 'class', 'list', 'tuple', 'set', 'dict')
+COLLECTION_KINDS  = ('list', 'tuple', 'set', 'dict')
+_MISSING          = object()
+_SHALLOW_COPIERS  = {'list': list, 'set': set, 'dict': dict}
+_DURATION_UNITS   = {
+    'us' : 'microseconds',
+    'ms' : 'milliseconds',
+    's'  : 'seconds',
+    'm'  : 'minutes',
+    'h'  : 'hours',
+    'd'  : 'days',
+    'w'  : 'weeks',
+}
+
+
+class UnknownKindError(ValueError):
+    """ Error when the data type is not registered. """
+
+
+class KindConflictError(RuntimeError):
+    """ Error when the data type is already registered with another caster. """
+
+
+class LRUCache(object):
+    """ Map bounded to the most recently used items
+
+        :param int max_size: the maximum number of the items
+    """
+    def __init__(self, max_size : int = CACHE_SIZE):
+        self.__max_size = max_size
+        self.__items    = collections.OrderedDict()
+        self.__lock     = threading.Lock()
+
+    def get(self, key, default = None):
+        """ Get the item and mark it as the most recently used one. """
+        items = self.__items
+
+        try:
+            value = items[key]
+
+            items.move_to_end(key)
+        except KeyError:  # unknown, or discarded meanwhile
+            return default
+
+        return value
+
+    def set(self, key, value):
+        """ Set the item and discard the least recently used ones beyond the maximum size. """
+        items = self.__items
+
+        with self.__lock:
+            items[key] = value
+
+            items.move_to_end(key)
+
+            while len(items) > self.__max_size:
+                items.popitem(last = False)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __contains__(self, key):
+        return key in self.__items
+
+
+class Interpolation(object):
+    """ Tokenized string with value blocks
+
+        The string is split once into literal segments and value blocks, i.e.,
+        environment blocks like ``{ $HOME or "/" }`` and provider blocks like
+        ``{ file:/run/secrets/db }``, so that rendering it is a single pass
+        over the segments.
+
+        :param str template: the string with value blocks, e.g., ``{ $HOME or "/" }app``
+    """
+    __slots__ = ('segments',)
+
+    def __init__(self, template : str):
+        # str (literal) or tuple (source or None for environment variables,
+        # environment name or reference, default value, original block)
+        self.segments = []
+
+        position = 0
+
+        for matches in _re_value_block.finditer(template):
+            if matches.start() > position:
+                self.segments.append(template[position:matches.start()])
+
+            parsed = matches.groupdict()
+
+            self.segments.append((
+                parsed['source'] and parsed['source'].lower(),
+                parsed['env_name'] or parsed['reference'],
+                parsed['string_default'] or parsed['number_default'] or '',
+                matches.group(0),
+            ))
+
+            position = matches.end()
+
+        if position < len(template):
+            self.segments.append(template[position:])
+
+    def render(self, environment : dict, providers : dict = None) -> str:
+        """ Render the string.
+
+            A provider block with an unknown source is rendered as it is.
+
+            :param dict environment: the environment variables
+            :param dict providers: the map of source names to :class:`imagination.helper.provider.ValueProvider` (optional)
+        """
+        rendered = []
+
+        for segment in self.segments:
+            if type(segment) is str:
+                rendered.append(segment)
+
+                continue
+
+            source, reference, default_value, block = segment
+
+            if source is None:
+                value = environment.get(reference)
+
+                if not value and not default_value:
+                    raise UnknownEnvironmentVariableError(reference)
+            elif not providers or source not in providers:
+                value = block
+            else:
+                value = providers[source].get(reference)
+
+                if not value and not default_value:
+                    raise UnknownExternalValueError('{}:{}'.format(source, reference))
+
+            rendered.append(value or default_value)
+
+        return ''.join(rendered)
+
+
+def cast_bool(data : str) -> bool:
+    data = data.capitalize()
+
+    assert data in ('True', 'False')
+
+    return data == 'True'
+
+
+def cast_duration(data : str) -> datetime.timedelta:
+    """ Cast the duration, e.g., ``1h30m``, ``250ms`` or ``1.5`` (seconds). """
+    try:
+        return datetime.timedelta(seconds = float(data))
+    except ValueError:
+        pass
+
+    position = 0
+    amounts  = {}
+
+    for matches in _re_duration_part.finditer(data):
+        if matches.start() != position:
+            break
+
+        unit = _DURATION_UNITS[matches.group('unit').lower()]
+
+        amounts[unit] = amounts.get(unit, 0) + float(matches.group('amount'))
+        position      = matches.end()
+
+    if not amounts or data[position:].strip():
+        raise ValueError('Invalid duration: {}'.format(data))
+
+    return datetime.timedelta(**amounts)
+
+
+def cast_datetime(data : str) -> datetime.datetime:
+    """ Cast the date and time in ISO 8601, e.g., ``2018-01-31T09:30:00Z``. """
+    data = data.strip()
+
+    if data[-1:] in ('Z', 'z'):
+        data = data[:-1] + '+00:00'
+
+    return datetime.datetime.fromisoformat(data)
+
+
+_BUILT_IN_KINDS = (
+    # kind, caster, immutable
+    ('str',      str,             True),
+    ('unicode',  str,             True),
+    ('int',      int,             True),
+    ('float',    float,           True),
+    ('bool',     cast_bool,       True),
+    ('decimal',  decimal.Decimal, True),
+    ('bytes',    str.encode,      True),
+    ('path',     pathlib.Path,    True),
+    ('duration', cast_duration,   True),
+    ('datetime', cast_datetime,   True),
+    ('regex',    re.compile,      True),
+    ('json',     json.loads,      False),
+)
 
-        self.__re_env_with_default_value_as_string = re.compile('\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+) or "(?P<default>.+)"\s*\}', re.IGNORECASE)
-        self.__re_env_with_default_value_as_int    = re.compile('\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+) or (?P<default>[0-9]+)\s*\}', re.IGNORECASE)
-        self.__re_env_with_default_value_as_float  = re.compile('\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+) or (?P<default>[0-9]*\.[0-9]*)\s*\}', re.IGNORECASE)
-        self.__re_env_without_default_value        = re.compile('\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+)\s*\}', re.IGNORECASE)
+
+class TypeRegistry(object):
+    """ Registry of data types
+
+        Each data type (kind) is mapped to a caster, which takes the string
+        definition and returns the value. The structural kinds (``entity``,
+        ``class``, ``list``, ``tuple``, ``set`` and ``dict``) are handled by
+        the transformer and cannot be registered.
+
+        The casters flagged as immutable return the immutable values, which
+        are then computed once per distinct definition and reused.
+
+        Every registry starts with the built-in data types: ``str``, ``unicode``,
+        ``int``, ``float``, ``bool``, ``decimal``, ``bytes`` (UTF-8), ``path``,
+        ``duration`` (e.g., ``1h30m`` or ``1.5``), ``datetime`` (ISO 8601),
+        ``regex`` and ``json``.
+    """
+    def __init__(self):
+        self.__casters         = {}  # kind -> callable or the path to the callable
+        self.__resolved        = {}  # kind -> callable
+        self.__immutable_kinds = set()
+        self.__lock            = threading.Lock()
+
+        for kind, caster, immutable in _BUILT_IN_KINDS:
+            self.register(kind, caster, immutable)
+
+    def register(self, kind : str, caster, immutable : bool = False, replace : bool = False):
+        """ Register the data type.
+
+            :param str kind: the name of the data type, e.g., ``decimal``
+            :param caster: the callable or the path to the callable, which is
+                           imported on the first use
+            :param bool immutable: flag if the caster returns immutable values
+            :param bool replace: flag to replace the registered caster
+        """
+        if kind in STRUCTURAL_KINDS:
+            raise KindConflictError('{} is a structural type.'.format(kind))
+
+        with self.__lock:
+            registered = self.__casters.get(kind)
+
+            if registered is not None and registered != caster and not replace:
+                raise KindConflictError('{} is already registered with {}.'.format(kind, registered))
+
+            self.__casters[kind] = caster
+            self.__resolved.pop(kind, None)
+
+            if immutable:
+                self.__immutable_kinds.add(kind)
+            else:
+                self.__immutable_kinds.discard(kind)
+
+    def get(self, kind : str) -> callable:
+        """ Get the caster of the data type. """
+        try:
+            return self.__resolved[kind]
+        except KeyError:
+            pass
+
+        try:
+            caster = self.__casters[kind]
+        except KeyError:
+            raise UnknownKindError(kind)
+
+        if isinstance(caster, str):
+            caster = resolve(caster)
+
+        self.__resolved[kind] = caster
+
+        return caster
+
+    def is_immutable(self, kind : str) -> bool:
+        return kind in self.__immutable_kinds
+
+    def kinds(self) -> set:
+        """ All known data types, including the structural ones """
+        return set(self.__casters) | set(STRUCTURAL_KINDS)
+
+    def __contains__(self, kind):
+        return kind in self.__casters or kind in STRUCTURAL_KINDS
+
+    def __getstate__(self):
+        # NOTE The registry is copied to the worker processes of the assembler.
+        return (self.__casters, self.__immutable_kinds)
+
+    def __setstate__(self, state):
+        self.__casters, self.__immutable_kinds = state
+        self.__resolved = {}
+        self.__lock     = threading.Lock()
+
+
+type_registry = TypeRegistry()
+
+
+class Constant(object):
+    """ Value pre-computed by :meth:`Transformer.fold`
+
+        :param value: the value
+        :param callable copy: the callable taking the value and returning a
+                              new copy, for a mutable value (optional)
+    """
+    __slots__ = ('value', 'copy')
+
+    def __init__(self, value, copy : callable = None):
+        self.value = value
+        self.copy  = copy
+
+    def get(self):
+        return self.value if self.copy is None else self.copy(self.value)
+
+
+class Transformer(object):
+    """ Data transformer
+
+        .. versionchanged:: Imagination 2.6
+
+            The environment variables are read from the snapshot of the
+            environment taken on the first use. Call :meth:`refresh_environment`
+            to take a new snapshot.
+
+        .. versionchanged:: Imagination 2.6
+
+            The data types are looked up from :class:`TypeRegistry`.
+
+        .. versionchanged:: Imagination 2.6
+
+            Added the provider blocks, e.g., ``{ file:/run/secrets/db }``,
+            ``{ dotenv:/app/.env#DB_HOST }``, ``{ json:/etc/app.json#db.port }``
+            and ``{ secret:db }`` (in ``/run/secrets``).
+
+        :param callable core_getter: a callable reference to :meth:`Imagination.get`
+        :param TypeRegistry registry: the registry of data types (optional,
+                                      the process-wide ``type_registry`` by default)
+        :param dict providers: the map of source names to value providers
+                               (optional, :func:`imagination.helper.provider.make_default_providers` by default)
+        :param int cache_size: the maximum number of the tokenized strings and
+                               of the immutable values kept by the transformer
+    """
+    def __init__(self, core_getter : callable, registry : TypeRegistry = None,
+                 providers : dict = None, cache_size : int = CACHE_SIZE):
+        self.__core_getter        = core_getter
+        self.__registry           = registry or type_registry
+        self.__providers          = make_default_providers() if providers is None else dict(providers)
+        self.__environment        = None
+        self.__interpolations     = LRUCache(cache_size)  # string -> Interpolation (None without value blocks)
+        self.__immutable_results  = LRUCache(cache_size)  # (kind, definition) -> value
+        self.__logger             = get_logger('transformer', logging.ERROR)
+        self.__structural_casters = {
+            'entity' : self._cast_entity,
+            'class'  : resolve,
+            'list'   : self._cast_list,
+            'tuple'  : lambda data: tuple(self._cast_list(data)),
+            'set'    : lambda data: set(self._cast_list(data)),
+            'dict'   : self._cast_dict,
+        }
+
+    @property
+    def registry(self) -> TypeRegistry:
+        return self.__registry
+
+    def register_provider(self, source : str, provider : ValueProvider):
+        """ Register the value provider, e.g., for ``{ <source>:<reference> }``. """
+        self.__providers[source.lower()] = provider
+
+    def refresh_environment(self, environment : dict = None):
+        """ Take a new snapshot of the environment variables.
+
+            :param dict environment: the environment variables (optional, ``os.environ`` by default)
+        """
+        self.__environment = dict(os.environ if environment is None else environment)
 
     def cast(self, data):
         """ Transform the given data to the given kind.
@@ -32,113 +406,155 @@ class Transformer(object):
                 Added support for environment variables.
 
         """
-        logger = get_logger('transformer', logging.ERROR)
-        logger.debug('Casting {}...'.format(data))
+        if type(data) is Constant:
+            return data.get()
 
         if type(data) is not DataDefinition:
-            logger.debug('Return right away.')
             return data
 
         if not data.transformation_required:
-            logger.debug('Return without transformation.')
             return data.definition
 
-        actual_data = data.definition
-        actual_kind = data.kind
-
-        returnee = self._cast(actual_data, actual_kind)
+        returnee = self._cast(data.definition, data.kind)
 
-        logger.debug('Returning {}({})'.format(type(returnee).__name__, returnee))
+        # NOTE Guarded, as formatting the data definition costs more than casting it.
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug('Cast %r to %s(%r)', data, type(returnee).__name__, returnee)
 
         return returnee
 
-    def _pre_process(self, data):
-        if not isinstance(data, str):
+    def fold(self, data):
+        """ Pre-compute the data which depends neither on the environment nor on entities.
+
+            Only the structural kinds except ``entity`` and the immutable kinds
+            are pre-computed. The data failing to be cast is left as it is, so
+            that the error is raised when it is actually used.
+
+            :param data: the data definition
+
+            :return: :class:`Constant`, or the data definition with the
+                     pre-computed items of the collection
+        """
+        if type(data) is not DataDefinition or not data.transformation_required:
             return data
 
-        returnee = data
+        kind = data.kind
 
-        check_sequence = [
-            self.__re_env_without_default_value,
-            self.__re_env_with_default_value_as_string,
-            self.__re_env_with_default_value_as_float,
-            self.__re_env_with_default_value_as_int,
-        ]
+        if kind in COLLECTION_KINDS:
+            return self._fold_collection(data)
 
-        while True:
-            matches      = None
-            used_pattern = None
+        if kind == 'entity' or self._get_interpolation(data.definition) is not None:
+            return data
 
-            for pattern in check_sequence:
-                matches = pattern.search(returnee)
+        if kind != 'class' and not (kind in self.__registry and self.__registry.is_immutable(kind)):
+            return data
 
-                if matches:
-                    used_pattern = pattern
+        try:
+            return Constant(self._cast(data.definition, kind))
+        except Exception:
+            return data
 
-                    break
+    def fold_parameters(self, params : ParameterCollection) -> ParameterCollection:
+        """ Pre-compute the parameters with :meth:`fold`. """
+        folded_params = ParameterCollection()
 
-            if not matches:
-                break
+        for item in params.sequence():
+            folded_params.add(self.fold(item))
 
-            parsed        = matches.groupdict()
-            env_value     = os.getenv(parsed['env_name'])
-            default_value = parsed['default'] if 'default' in parsed else ''
+        for name, item in list(params.items()):
+            folded_params.add(self.fold(item), name)
 
-            if not env_value and not default_value:
-                raise UnknownEnvironmentVariableError(parsed['env_name'])
+        return folded_params
 
-            returnee = used_pattern.sub(env_value or default_value, returnee, count = 1)
+    def _fold_collection(self, data):
+        kind          = data.kind
+        folded_params = self.fold_parameters(data.definition)
+        folded_items  = list(folded_params.sequence()) + [item for _, item in folded_params.items()]
 
-        return returnee
+        if not all(type(item) is Constant for item in folded_items):
+            return DataDefinition(folded_params, data.name, kind)
 
-    def _cast(self, actual_data, actual_kind):
-        actual_data = self._pre_process(actual_data)
+        try:
+            value = self._cast(folded_params, kind)
+        except Exception:
+            return data
+
+        if any(item.copy is not None for item in folded_items):
+            # Copy the mutable items too.
+            return Constant(value, lambda _: self._cast(folded_params, kind))
+
+        return Constant(value, _SHALLOW_COPIERS.get(kind))
+
+    def _get_interpolation(self, data):
+        """ Get the tokenized string (or ``None`` without value blocks). """
+        if not isinstance(data, str) or '{' not in data or ('$' not in data and ':' not in data):
+            return None
+
+        interpolation = self.__interpolations.get(data, _MISSING)
+
+        if interpolation is not _MISSING:
+            return interpolation
+
+        interpolation = Interpolation(data)
 
-        if actual_kind == 'entity':
-            return self.__core_getter(actual_data)
+        if len(interpolation.segments) == 1 and type(interpolation.segments[0]) is str:
+            interpolation = None
 
-        if actual_kind == 'class':
-            return Loader(actual_data).package
+        self.__interpolations.set(data, interpolation)
 
-        if actual_kind == 'int':
-            return int(actual_data)
+        return interpolation
 
-        if actual_kind == 'float':
-            return float(actual_data)
+    def _pre_process(self, data):
+        interpolation = self._get_interpolation(data)
 
-        if actual_kind == 'bool':
-            actual_data = actual_data.capitalize()
+        if interpolation is None:
+            return data
 
-            assert actual_data in ('True', 'False')
+        if self.__environment is None:
+            self.refresh_environment()
 
-            return actual_data == 'True'
+        return interpolation.render(self.__environment, self.__providers)
 
-        if actual_kind in ['list', 'tuple', 'set']:
-            collection = []
+    def _cast(self, actual_data, actual_kind):
+        actual_data = self._pre_process(actual_data)
 
-            # At theis point, assume that actual_data is ParameterCollection.
+        if actual_kind in self.__structural_casters:
+            return self.__structural_casters[actual_kind](actual_data)
 
-            for item in actual_data.sequence():
-                collection.append(self.cast(item))
+        try:
+            caster = self.__registry.get(actual_kind)
+        except UnknownKindError:
+            error_message = 'Unknown type: {} (Given data type: {})'
+            raise UnknownKindError(error_message.format(actual_kind,
+                                                        type(actual_data).__name__))
 
-            if actual_kind != 'list':
-                collection = eval(actual_kind)(collection)
+        if caster is str and type(actual_data) is str:  # nothing to cast or to cache
+            return actual_data
 
-            return collection
+        if not self.__registry.is_immutable(actual_kind):
+            return caster(actual_data)
 
-        if actual_kind == 'dict':
-            kv_map = {}
+        key = (actual_kind, actual_data)
 
-            # At theis point, assume that actual_data is ParameterCollection.
+        try:
+            returnee = self.__immutable_results.get(key, _MISSING)
+        except TypeError:  # unhashable definition
+            return caster(actual_data)
 
-            for key, value in list(actual_data.items()):
-                kv_map[key] = self.cast(value)
+        if returnee is _MISSING:
+            returnee = caster(actual_data)
+
+            self.__immutable_results.set(key, returnee)
+
+        return returnee
 
-            return kv_map
+    def _cast_entity(self, actual_data):
+        return self.__core_getter(actual_data)
 
-        if actual_kind == 'str':
-            return str(actual_data)
+    def _cast_list(self, actual_data):
+        # At this point, assume that actual_data is ParameterCollection.
+        return [self.cast(item) for item in actual_data.sequence()]
 
-        error_message = 'Unknown type: {} (Given data type: {})'
-        raise ValueError(error_message.format(actual_kind,
-                                              type(actual_data).__name__))
+    def _cast_dict(self, actual_data):
+        # At this point, assume that actual_data is ParameterCollection.
+        return {key: self.cast(value) for key, value in list(actual_data.items())}
@@ -0,0 +1,212 @@
+# v2
+import asyncio
+import inspect
+import threading
+
+
+class BatchSizeMismatchError(RuntimeError):
+    """ Error when the batch method returns a different number of results. """
+
+
+class _Batch(object):
+    """ Calls collected within one window
+
+        The keys are deduplicated, and each caller keeps the position of its
+        key in ``keys``.
+    """
+    __slots__ = ('keys', 'positions', 'outcomes', 'full', 'done', 'futures')
+
+    def __init__(self):
+        self.keys      = []
+        self.positions = {}
+        self.outcomes  = None
+        self.full      = threading.Event()
+        self.done      = threading.Event()
+        self.futures   = []
+
+    def add(self, key):
+        if key not in self.positions:
+            self.positions[key] = len(self.keys)
+            self.keys.append(key)
+
+        return self.positions[key]
+
+    def settle(self, results = None, error = None):
+        if error is not None:
+            self.outcomes = [(False, error)] * len(self.keys)
+
+            return
+
+        if isinstance(results, dict):
+            self.outcomes = [
+                (True, results[key]) if key in results else (False, KeyError(key))
+                for key in self.keys
+            ]
+
+            return
+
+        results = list(results)
+
+        if len(results) != len(self.keys):
+            mismatch      = BatchSizeMismatchError('Expected {} results, got {}'.format(len(self.keys), len(results)))
+            self.outcomes = [(False, mismatch)] * len(self.keys)
+
+            return
+
+        self.outcomes = [(True, result) for result in results]
+
+    def outcome(self, position):
+        succeeded, value = self.outcomes[position]
+
+        if not succeeded:
+            raise value
+
+        return value
+
+
+class Batcher(object):
+    """ Call Batcher (the DataLoader pattern)
+
+        An "around" interceptor collecting the calls of an intercepted method,
+        which takes one key, made within ``window`` seconds, and making one
+        call to the batch method of the same entity with the list of unique
+        keys instead. The batch method must return either the list of results
+        in the same order or the map from keys to results.
+
+        :param str batch_method: the name of the batch method of the intercepted entity
+        :param float window: the time to collect calls in seconds. With
+                             coroutines, ``0`` means one iteration of the event loop.
+        :param int max_size: the maximum number of keys per batch
+
+        The call with more than one parameter or with an unhashable key is not
+        batched. When a key is missing from the returned map, only its callers
+        receive :class:`KeyError`.
+
+        .. note:: The batch method is called on the intercepted instance itself,
+                  so its own interceptions do not apply.
+
+        .. code-block:: xml
+
+            <entity id="user_batcher" class="imagination.interceptor.batching.Batcher">
+                <param name="batch_method">get_users</param>
+                <param name="window" type="float">0.002</param>
+                <param name="max_size" type="int">100</param>
+                <interception around="user_repository" do="get_user" with="batch"/>
+            </entity>
+    """
+    def __init__(self, batch_method : str, window : float = 0.001, max_size : int = 100):
+        if max_size < 1:
+            raise ValueError('The maximum batch size must be positive.')
+
+        self.__batch_method = batch_method
+        self.__window       = window
+        self.__max_size     = max_size
+        self.__pending      = {}
+        self.__lock         = threading.Lock()
+
+    def batch(self, joinpoint, largs, kwargs):
+        """ Batch the intercepted call (the intercepting method). """
+        if kwargs or len(largs) != 1:
+            return joinpoint.proceed(*largs, **kwargs)
+
+        key = largs[0]
+
+        try:
+            hash(key)
+        except TypeError:
+            return joinpoint.proceed(*largs, **kwargs)
+
+        if joinpoint.is_coroutine:
+            return self.__batch_coroutine(joinpoint, key)
+
+        with self.__lock:
+            batch   = self.__pending.get(joinpoint)
+            leading = batch is None
+
+            if leading:
+                batch = self.__pending[joinpoint] = _Batch()
+
+            position = batch.add(key)
+
+            if len(batch.keys) >= self.__max_size:
+                del self.__pending[joinpoint]
+
+                batch.full.set()
+
+        if not leading:
+            batch.done.wait()
+
+            return batch.outcome(position)
+
+        batch.full.wait(self.__window)
+
+        with self.__lock:
+            if self.__pending.get(joinpoint) is batch:
+                del self.__pending[joinpoint]
+
+        try:
+            batch.settle(getattr(joinpoint.instance, self.__batch_method)(list(batch.keys)))
+        except Exception as error:
+            batch.settle(error = error)
+        finally:
+            batch.done.set()
+
+        return batch.outcome(position)
+
+    async def __batch_coroutine(self, joinpoint, key):
+        loop        = asyncio.get_event_loop()
+        pending_key = (joinpoint, loop)
+        future      = loop.create_future()
+
+        with self.__lock:
+            batch = self.__pending.get(pending_key)
+
+            if batch is None:
+                batch = self.__pending[pending_key] = _Batch()
+
+                if self.__window > 0:
+                    loop.call_later(self.__window, self.__flush_coroutine, pending_key, joinpoint, batch)
+                else:
+                    loop.call_soon(self.__flush_coroutine, pending_key, joinpoint, batch)
+
+            batch.futures.append((batch.add(key), future))
+
+            full = len(batch.keys) >= self.__max_size
+
+            if full:
+                # The next call starts a new batch. The scheduled flush skips this one.
+                del self.__pending[pending_key]
+
+        if full:
+            asyncio.ensure_future(self.__dispatch_coroutine(joinpoint, batch))
+
+        return await future
+
+    def __flush_coroutine(self, pending_key, joinpoint, batch):
+        with self.__lock:
+            if self.__pending.get(pending_key) is not batch:
+                return  # already flushed
+
+            del self.__pending[pending_key]
+
+        asyncio.ensure_future(self.__dispatch_coroutine(joinpoint, batch))
+
+    async def __dispatch_coroutine(self, joinpoint, batch):
+        try:
+            results = getattr(joinpoint.instance, self.__batch_method)(list(batch.keys))
+
+            if inspect.isawaitable(results):
+                results = await results
+
+            batch.settle(results)
+        except Exception as error:
+            batch.settle(error = error)
+
+        for position, future in batch.futures:
+            if future.done():
+                continue  # cancelled by the caller
+
+            try:
+                future.set_result(batch.outcome(position))
+            except Exception as error:
+                future.set_exception(error)
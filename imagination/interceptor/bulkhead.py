@@ -0,0 +1,221 @@
+# v2
+import asyncio
+import collections
+import threading
+
+MODE_BLOCK   = 'block'
+MODE_TIMEOUT = 'timeout'
+MODE_REJECT  = 'reject'
+
+
+class BulkheadFullError(RuntimeError):
+    """ Error when the call is rejected as too many calls are in flight. """
+
+
+class _Waiter(object):
+    __slots__ = ('granted', 'notify')
+
+    def __init__(self, notify):
+        self.granted = False
+        self.notify  = notify
+
+
+def _resolve_future(future):
+    if not future.done():
+        future.set_result(True)
+
+
+class _Compartment(object):
+    """ Slots of one intercepted method
+
+        A released slot is handed over to the oldest waiter, whether it is a
+        thread or a task, so that neither can starve the other.
+    """
+    def __init__(self, limit):
+        self.limit     = limit
+        self.in_flight = 0
+        self.rejected  = 0
+        self.lock      = threading.Lock()
+        self.waiters   = collections.deque()
+
+    def acquire(self, blocking, timeout):
+        with self.lock:
+            acquired = self.__try_acquire(blocking)
+
+            if acquired is not None:
+                return acquired
+
+            event  = threading.Event()
+            waiter = _Waiter(event.set)
+
+            self.waiters.append(waiter)
+
+        event.wait(timeout)
+
+        return self.__settle(waiter)
+
+    async def acquire_async(self, blocking, timeout):
+        with self.lock:
+            acquired = self.__try_acquire(blocking)
+
+            if acquired is not None:
+                return acquired
+
+            loop   = asyncio.get_event_loop()
+            future = loop.create_future()
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(_resolve_future, future))
+
+            self.waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            if self.__settle(waiter, False):
+                self.release()
+
+            raise
+
+        return self.__settle(waiter)
+
+    def release(self):
+        with self.lock:
+            if self.waiters:
+                waiter = self.waiters.popleft()
+
+                waiter.granted = True
+                waiter.notify()
+
+                return
+
+            self.in_flight -= 1
+
+    def state(self):
+        with self.lock:
+            return {
+                'limit'     : self.limit,
+                'in_flight' : self.in_flight,
+                'waiting'   : len(self.waiters),
+                'rejected'  : self.rejected,
+            }
+
+    def __try_acquire(self, blocking):
+        if self.in_flight < self.limit and not self.waiters:
+            self.in_flight += 1
+
+            return True
+
+        if not blocking:
+            self.rejected += 1
+
+            return False
+
+        return None  # The caller has to wait.
+
+    def __settle(self, waiter, count_rejection = True):
+        with self.lock:
+            if waiter.granted:
+                return True
+
+            self.waiters.remove(waiter)
+
+            if count_rejection:
+                self.rejected += 1
+
+            return False
+
+
+class Bulkhead(object):
+    """ Bulkhead
+
+        An "around" interceptor limiting the number of in-flight calls of every
+        intercepted method, for both threads and coroutines.
+
+        :param int max_concurrency: the maximum number of in-flight calls per intercepted method
+        :param str mode: ``block`` to wait for a slot, ``timeout`` to wait for
+                         a slot up to ``timeout`` seconds, or ``reject`` to
+                         fail immediately when no slot is available.
+        :param float timeout: the waiting time in seconds for the ``timeout`` mode
+
+        When no slot is available in time, :class:`BulkheadFullError` is raised.
+
+        .. code-block:: xml
+
+            <entity id="bulkhead" class="imagination.interceptor.bulkhead.Bulkhead">
+                <param name="max_concurrency" type="int">8</param>
+                <param name="mode">timeout</param>
+                <param name="timeout" type="float">0.5</param>
+                <interception around="client" do="*" with="limit"/>
+            </entity>
+    """
+    def __init__(self, max_concurrency : int = 10, mode : str = MODE_BLOCK, timeout : float = None):
+        if mode not in (MODE_BLOCK, MODE_TIMEOUT, MODE_REJECT):
+            raise ValueError('Unknown bulkhead mode: {}'.format(mode))
+
+        if max_concurrency < 1:
+            raise ValueError('The maximum concurrency must be positive.')
+
+        if mode == MODE_TIMEOUT and timeout is None:
+            raise ValueError('The timeout must be defined in the "timeout" mode.')
+
+        self.__max_concurrency = max_concurrency
+        self.__blocking        = mode != MODE_REJECT
+        self.__timeout         = timeout if mode == MODE_TIMEOUT else None
+        self.__compartments    = {}
+        self.__lock            = threading.Lock()
+
+    def limit(self, joinpoint, largs, kwargs):
+        """ Limit the intercepted call (the intercepting method). """
+        compartment = self.__get_compartment(joinpoint)
+
+        if joinpoint.is_coroutine:
+            return self.__limit_coroutine(compartment, joinpoint, largs, kwargs)
+
+        if not compartment.acquire(self.__blocking, self.__timeout):
+            raise BulkheadFullError('{}.{}'.format(joinpoint.intercepted_id, joinpoint.method_name))
+
+        try:
+            return joinpoint.proceed(*largs, **kwargs)
+        finally:
+            compartment.release()
+
+    async def __limit_coroutine(self, compartment, joinpoint, largs, kwargs):
+        if not await compartment.acquire_async(self.__blocking, self.__timeout):
+            raise BulkheadFullError('{}.{}'.format(joinpoint.intercepted_id, joinpoint.method_name))
+
+        try:
+            return await joinpoint.proceed(*largs, **kwargs)
+        finally:
+            compartment.release()
+
+    def snapshot(self, intercepted_id : str = None) -> dict:
+        """ Report the state of every intercepted method.
+
+            :param str intercepted_id: the ID of the entity to report (optional)
+
+            :return: the map from ``(intercepted_id, method_name)`` to the map
+                     of ``limit``, ``in_flight``, ``waiting`` (queue depth)
+                     and ``rejected`` (the number of rejections)
+        """
+        with self.__lock:
+            compartments = list(self.__compartments.items())
+
+        return {
+            key: compartment.state()
+            for key, compartment in compartments
+            if intercepted_id is None or key[0] == intercepted_id
+        }
+
+    def __get_compartment(self, joinpoint):
+        key         = (joinpoint.intercepted_id, joinpoint.method_name)
+        compartment = self.__compartments.get(key)
+
+        if compartment is not None:
+            return compartment
+
+        with self.__lock:
+            if key not in self.__compartments:
+                self.__compartments[key] = _Compartment(self.__max_concurrency)
+
+            return self.__compartments[key]
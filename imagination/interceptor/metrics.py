@@ -0,0 +1,215 @@
+# v2
+import threading
+
+try:
+    from time import perf_counter_ns
+except ImportError as e:
+    # Fall back to Python 3.6 and older
+    from time import perf_counter
+
+    def perf_counter_ns():
+        return int(perf_counter() * 1000000000)
+
+# Each power of two is split into 2 ** (_SUB_BUCKET_BITS - 1) linear sub-buckets,
+# which keeps the relative error of any recorded value under 2 ** (1 - _SUB_BUCKET_BITS).
+_SUB_BUCKET_BITS      = 5
+_SUB_BUCKET_HALF_SIZE = 1 << (_SUB_BUCKET_BITS - 1)
+_SUB_BUCKET_SIZE      = 1 << _SUB_BUCKET_BITS
+
+
+def bucket_index(value : int) -> int:
+    """ Get the index of the histogram bucket for the given value. """
+    magnitude = value.bit_length() - _SUB_BUCKET_BITS
+
+    if magnitude <= 0:
+        return value
+
+    return (magnitude << (_SUB_BUCKET_BITS - 1)) + (value >> magnitude)
+
+
+def bucket_range(index : int) -> tuple:
+    """ Get the lowest and the highest values of the bucket at the given index. """
+    if index < _SUB_BUCKET_SIZE:
+        return index, index
+
+    magnitude = index // _SUB_BUCKET_HALF_SIZE - 1
+    lowest    = (index - magnitude * _SUB_BUCKET_HALF_SIZE) << magnitude
+
+    return lowest, lowest + (1 << magnitude) - 1
+
+
+class _Cell(object):
+    """ Per-thread counters of one intercepted method """
+    __slots__ = ('calls', 'errors', 'buckets')
+
+    def __init__(self):
+        self.calls   = 0
+        self.errors  = 0
+        self.buckets = {}
+
+
+class LatencyHistogram(object):
+    """ Merged latency statistics of one intercepted method
+
+        All durations are in nanoseconds.
+
+        :param str intercepted_id: the ID of the intercepted entity
+        :param str method_name: the name of the intercepted method
+    """
+    def __init__(self, intercepted_id : str, method_name : str):
+        self.intercepted_id = intercepted_id
+        self.method_name    = method_name
+        self.calls          = 0
+        self.errors         = 0
+        self.buckets        = {}
+
+    def merge(self, cell):
+        self.calls  += cell.calls
+        self.errors += cell.errors
+
+        for index, count in list(cell.buckets.items()):
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def percentile(self, percentage : float) -> int:
+        """ Get the highest equivalent duration at the given percentile.
+
+            :param float percentage: the percentile, e.g., ``99.0``
+        """
+        if not self.calls:
+            return 0
+
+        threshold = self.calls * percentage / 100.0
+        counted   = 0
+
+        for index in sorted(self.buckets):
+            counted += self.buckets[index]
+
+            if counted >= threshold:
+                return bucket_range(index)[1]
+
+        return self.max
+
+    @property
+    def min(self):
+        return bucket_range(min(self.buckets))[0] if self.buckets else 0
+
+    @property
+    def max(self):
+        return bucket_range(max(self.buckets))[1] if self.buckets else 0
+
+    def __repr__(self):
+        return '<{} {}.{} calls={} errors={} p50={} p99={}>'.format(
+            type(self).__name__,
+            self.intercepted_id,
+            self.method_name,
+            self.calls,
+            self.errors,
+            self.percentile(50),
+            self.percentile(99),
+        )
+
+
+class LatencyRecorder(object):
+    """ Latency Recorder
+
+        An "around" interceptor recording the number of calls, the number of
+        errors and a latency histogram of every intercepted method.
+
+        Each thread records into its own buckets, so the hot path never
+        acquires a lock. The buckets of all threads are merged on read.
+
+        .. code-block:: xml
+
+            <entity id="latency" class="imagination.interceptor.metrics.LatencyRecorder">
+                <interception around="alpha" do="*" with="measure"/>
+            </entity>
+    """
+    def __init__(self):
+        self.__local         = threading.local()
+        self.__shards        = []
+        self.__register_lock = threading.Lock()
+
+    def measure(self, joinpoint, largs, kwargs):
+        """ Measure the intercepted call (the intercepting method). """
+        if joinpoint.is_coroutine:
+            return self.__measure_coroutine(joinpoint, largs, kwargs)
+
+        started = perf_counter_ns()
+
+        try:
+            result = joinpoint.proceed(*largs, **kwargs)
+        except Exception:
+            self.__record(joinpoint, perf_counter_ns() - started, True)
+
+            raise
+
+        self.__record(joinpoint, perf_counter_ns() - started, False)
+
+        return result
+
+    async def __measure_coroutine(self, joinpoint, largs, kwargs):
+        started = perf_counter_ns()
+
+        try:
+            result = await joinpoint.proceed(*largs, **kwargs)
+        except Exception:
+            self.__record(joinpoint, perf_counter_ns() - started, True)
+
+            raise
+
+        self.__record(joinpoint, perf_counter_ns() - started, False)
+
+        return result
+
+    def snapshot(self, intercepted_id : str = None) -> dict:
+        """ Merge the buckets of all threads.
+
+            :param str intercepted_id: the ID of the entity to report (optional)
+
+            :return: the map from ``(intercepted_id, method_name)`` to :class:`LatencyHistogram`
+        """
+        histograms = {}
+
+        with self.__register_lock:
+            shards = list(self.__shards)
+
+        for shard in shards:
+            # NOTE Copying a dictionary is atomic while the owning thread keeps recording.
+            for key, cell in list(dict(shard).items()):
+                if intercepted_id is not None and key[0] != intercepted_id:
+                    continue
+
+                if key not in histograms:
+                    histograms[key] = LatencyHistogram(*key)
+
+                histograms[key].merge(cell)
+
+        return histograms
+
+    def __record(self, joinpoint, elapsed, failed):
+        try:
+            shard = self.__local.shard
+        except AttributeError:
+            shard = self.__register_shard()
+
+        key  = (joinpoint.intercepted_id, joinpoint.method_name)
+        cell = shard.get(key)
+
+        if cell is None:
+            cell = shard[key] = _Cell()
+
+        index = bucket_index(elapsed)
+
+        cell.calls += 1
+        cell.buckets[index] = cell.buckets.get(index, 0) + 1
+
+        if failed:
+            cell.errors += 1
+
+    def __register_shard(self):
+        shard = self.__local.shard = {}
+
+        with self.__register_lock:
+            self.__shards.append(shard)
+
+        return shard
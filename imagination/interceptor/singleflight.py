@@ -0,0 +1,136 @@
+# v2
+import asyncio
+import threading
+
+
+def default_key(*largs, **kwargs):
+    """ Make the coalescing key out of all parameters. """
+    return (largs, frozenset(kwargs.items())) if kwargs else largs
+
+
+class _Flight(object):
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error  = None
+
+
+class SingleFlight(object):
+    """ Single-flight Coalescer
+
+        An "around" interceptor letting only one call of an intercepted method
+        with equal parameters run at a time. Every concurrent caller with the
+        same key waits for that call and shares its result or its exception.
+
+        :param callable key_function: the callable taking the parameters of
+                                      the intercepted method and returning a
+                                      hashable key (optional)
+
+        The call is not coalesced when the key is not hashable.
+
+        .. warning:: Only use this with idempotent methods.
+
+        .. code-block:: xml
+
+            <entity id="single_flight" class="imagination.interceptor.singleflight.SingleFlight">
+                <param name="key_function" type="class">app.keys.user_key</param>
+                <interception around="user_repository" do="get" with="coalesce"/>
+            </entity>
+    """
+    def __init__(self, key_function : callable = None):
+        self.__key_function = key_function or default_key
+        self.__flights      = {}
+        self.__counters     = {}
+        self.__lock         = threading.Lock()
+
+    def coalesce(self, joinpoint, largs, kwargs):
+        """ Coalesce the intercepted call (the intercepting method). """
+        try:
+            key = (joinpoint.intercepted_id, joinpoint.method_name, self.__key_function(*largs, **kwargs))
+
+            hash(key)
+        except TypeError:
+            return joinpoint.proceed(*largs, **kwargs)
+
+        if joinpoint.is_coroutine:
+            return self.__coalesce_coroutine(key, joinpoint, largs, kwargs)
+
+        with self.__lock:
+            flight  = self.__flights.get(key)
+            leading = flight is None
+
+            if leading:
+                flight = self.__flights[key] = _Flight()
+
+            self.__count(key, leading)
+
+        if not leading:
+            flight.done.wait()
+
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.result
+
+        try:
+            flight.result = joinpoint.proceed(*largs, **kwargs)
+        except BaseException as error:
+            flight.error = error
+
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+
+            flight.done.set()
+
+        return flight.result
+
+    async def __coalesce_coroutine(self, key, joinpoint, largs, kwargs):
+        # NOTE A task only runs in its own event loop.
+        key = key + (asyncio.get_event_loop(),)
+
+        with self.__lock:
+            task    = self.__flights.get(key)
+            leading = task is None
+
+            if leading:
+                task = self.__flights[key] = asyncio.ensure_future(joinpoint.proceed(*largs, **kwargs))
+
+                task.add_done_callback(lambda _: self.__land(key))
+
+            self.__count(key, leading)
+
+        # NOTE Shielded so that cancelling one caller does not cancel the others.
+        return await asyncio.shield(task)
+
+    def snapshot(self, intercepted_id : str = None) -> dict:
+        """ Report the number of executions and coalesced calls.
+
+            :param str intercepted_id: the ID of the entity to report (optional)
+
+            :return: the map from ``(intercepted_id, method_name)`` to the map
+                     of ``executions`` and ``coalesced``
+        """
+        with self.__lock:
+            counters = list(self.__counters.items())
+
+        return {
+            key: {'executions': counter[0], 'coalesced': counter[1]}
+            for key, counter in counters
+            if intercepted_id is None or key[0] == intercepted_id
+        }
+
+    def __count(self, key, leading):
+        method_key = key[:2]
+
+        if method_key not in self.__counters:
+            self.__counters[method_key] = [0, 0]
+
+        self.__counters[method_key][0 if leading else 1] += 1
+
+    def __land(self, key):
+        with self.__lock:
+            del self.__flights[key]
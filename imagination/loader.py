@@ -26,11 +26,84 @@ The module contains the package loader used to improve code maintainability.
 
 """
 
-import re
+import builtins
 import importlib
 import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
 from imagination.helper import retrieve_module
 
+_UNRESOLVED       = object()
+_resolution_cache = {}  # dotted path -> (resolved, package or error)
+_resolution_lock  = threading.Lock()  # NOTE only for the cache, as the imports have their own locks
+
+
+def resolve(path_to_package):
+    """ Resolve the package by the dotted path, e.g., ``app.views.HomeView``.
+
+    The outcome, including the failure, is cached for the whole process, so
+    that resolving the same path again only costs one dictionary lookup. The
+    path without a dot refers to a built-in object (e.g., ``int``) or to a
+    top-level module.
+
+    :raises ImportError: if the path cannot be resolved.
+
+    .. versionadded:: 2.6
+    """
+    try:
+        resolved, outcome = _resolution_cache[path_to_package]
+    except KeyError:
+        # NOTE Imported without the lock, so that a slow or nested import never blocks the other resolutions.
+        resolution = _resolve(path_to_package)
+
+        with _resolution_lock:
+            resolved, outcome = _resolution_cache.setdefault(path_to_package, resolution)
+
+    if not resolved:
+        # A new error each time, as raising the cached one would keep extending its traceback.
+        raise type(outcome)(*outcome.args, name = outcome.name, path = outcome.path) from outcome
+
+    return outcome
+
+
+def clear_resolution_cache():
+    """ Forget all resolved paths, e.g., after changing ``sys.path``. """
+    with _resolution_lock:
+        _resolution_cache.clear()
+
+
+def _resolve(path_to_package):
+    module_path, _, package_name = path_to_package.rpartition('.')
+
+    try:
+        if not module_path:
+            if hasattr(builtins, package_name):
+                return True, getattr(builtins, package_name)
+
+            return True, importlib.import_module(package_name)
+
+        try:
+            __import__(module_path, fromlist = [package_name])
+        except TypeError as exception:
+            raise ImportError('Unable to import {}.{} as {}'.format(
+                module_path, package_name, exception
+            ))
+
+        target_module = sys.modules[module_path]
+
+        try:
+            return True, getattr(target_module, package_name)
+        except AttributeError as exception:
+            raise ImportError('Module \'{}\' has no reference to \'{}\', except {}.'.format(
+                target_module.__name__, package_name, ', '.join(dir(target_module))
+            ))
+    except ImportError as exception:
+        return False, exception
+
+
 class OnDemandProxy(object):
     """On-demand Proxy
 
@@ -57,14 +130,15 @@ class Loader(object):
         # Then, instantiate the default renderer.
         renderer = loader.package('app.views')
 
+    .. note:: The package is resolved with :func:`resolve`.
     """
     def __init__(self, path_to_package):
         self._path         = path_to_package
-        self._access_path  = re.split('\.', self._path)
+        self._access_path  = self._path.split('.')
         self._module_path  = '.'.join(self._access_path[:-1])
         self._module       = None
         self._package_name = self._access_path[-1]
-        self._package      = None
+        self._package      = _UNRESOLVED
 
         self.on_demand_package = OnDemandProxy(self)
 
@@ -84,8 +158,8 @@ class Loader(object):
     @property
     def package(self):
         ''' Get a reference to the package. '''
-        if not self._package:
-            self._package = self._retrieve_package()
+        if self._package is _UNRESOLVED:
+            self._package = resolve(self._path)
 
         return self._package
 
@@ -94,33 +168,77 @@ class Loader(object):
         ''' Get the path to the package. '''
         return self.module.__file__
 
-    def _retrieve_package(self):
-        ''' Retrieve a package by the module path and the package name. '''
 
-        target_module = self.module
+class ModulePreloader(object):
+    """ Background module importer
 
-        # Either built-in class or a file.
-        if '.' not in self._path:
-            try:
-                importlib.import_module(self._path)
+    Import the given modules in a thread pool, so that resolving the packages
+    afterwards does not import anything.
 
-                return getattr(target_module, self._path)
-            except ImportError as exception:
-                return eval(self._path)
-                # NOP; assume that the request path is a built-in module.
+    :param module_paths: the names of the modules to import
+    :param int max_workers: the number of threads (optional)
+    :param list import_order: the names of the modules in the order to import
+                              them one by one, e.g., the previously recorded
+                              :attr:`import_order` (optional)
 
-            return
+    .. versionadded:: 2.6
+    """
+    def __init__(self, module_paths, max_workers = None, import_order = None):
+        self._module_paths = sorted(set(module_paths))
+        self._max_workers  = max_workers
+        self._import_order = import_order
+        self._lock         = threading.Lock()
+        self._finished     = threading.Event()
+        self._thread       = None
+
+        self.timings      = {}  # module name -> import time in seconds
+        self.failures     = {}  # module name -> error
+        self.import_order = []  # module names in the order of completion
 
+    def start(self):
+        ''' Start importing in background. '''
+        self._thread = threading.Thread(target = self._run, name = 'imagination-preloader', daemon = True)
+        self._thread.start()
+
+        return self
+
+    def wait(self, timeout = None):
+        ''' Wait until all modules are imported.
+
+        :return: ``False`` if it is not finished in time.
+        '''
+        return self._finished.wait(timeout)
+
+    def _run(self):
         try:
-            __import__(self._module_path, fromlist=[self._package_name])
-        except TypeError as exception:
-            raise ImportError('Unable to import {}.{} as {}'.format(
-                self._module_path, self._package_name, exception
-            ))
+            if self._import_order is not None:
+                known_paths = set(self._module_paths)
+                sequence    = [path for path in self._import_order if path in known_paths]
+                sequenced   = set(sequence)
+
+                sequence.extend(path for path in self._module_paths if path not in sequenced)
+
+                for module_path in sequence:
+                    self._import(module_path)
+
+                return
+
+            with ThreadPoolExecutor(self._max_workers, 'imagination-preloader') as executor:
+                list(executor.map(self._import, self._module_paths))
+        finally:
+            self._finished.set()
+
+    def _import(self, module_path):
+        started = time.perf_counter()
 
         try:
-            return getattr(target_module, self._package_name)
-        except AttributeError as exception:
-            raise ImportError('Module \'{}\' has no reference to \'{}\', except {}.'.format(
-                target_module.__name__, self._package_name, ', '.join(dir(target_module))
-            ))
+            importlib.import_module(module_path)
+        except Exception as exception:
+            with self._lock:
+                self.failures[module_path] = exception
+
+            return
+
+        with self._lock:
+            self.timings[module_path] = time.perf_counter() - started
+            self.import_order.append(module_path)
@@ -0,0 +1,214 @@
+# v2
+""" Memory accounting per entity
+
+Enabled with ``Imagination(record_memory = True)``, e.g.,
+
+.. code-block:: python
+
+    core = Imagination(record_memory = True)
+
+    ...
+
+    report = core.get_memory_report(top = 5)
+
+    report['top_consumers']  # the entities which allocated the most on activation
+    report['growing']        # the prototype entities whose live instances keep growing
+"""
+import collections
+import threading
+import tracemalloc
+import weakref
+
+
+class EntityMemoryStats(object):
+    """ Memory statistics of one entity
+
+        :param str entity_id: the entity ID
+    """
+    __slots__ = ('entity_id', 'activations', 'retained_bytes', 'inclusive_bytes', 'created', 'live', 'untracked')
+
+    def __init__(self, entity_id : str):
+        self.entity_id       = entity_id
+        self.activations     = 0
+        self.retained_bytes  = 0  # Allocated and not freed during the activations, except by the dependencies
+        self.inclusive_bytes = 0  # Same, including the dependencies activated meanwhile
+        self.created         = 0  # Prototype instances
+        self.live            = 0  # Prototype instances still referred
+        self.untracked       = 0  # Prototype instances without weak reference support
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MemoryRecorder(object):
+    """ Recorder of the memory allocated by the activation of each entity
+
+        The allocations are traced with :mod:`tracemalloc`, and the memory
+        still allocated at the end of each activation is attributed to the
+        entity. The memory of the dependencies activated meanwhile, e.g., the
+        factory, is attributed to the dependencies only.
+
+        The instances of the entities which are not cacheable are counted with
+        weak references, so that :meth:`report` tells which entities keep
+        more and more instances alive.
+
+        :param int frames: the number of frames traced per allocation
+        :param int history: the number of the census samples kept to detect the growth
+
+        .. note:: The memory allocated by other threads during an activation
+                  is attributed to the entity too.
+    """
+    def __init__(self, frames : int = 1, history : int = 10):
+        self.__frames     = frames
+        self.__stats      = {}  # entity ID -> EntityMemoryStats
+        self.__references = {}  # ID of the weak reference -> (weak reference, entity ID)
+        self.__samples    = collections.deque(maxlen = history)  # census samples
+        self.__lock       = threading.RLock()  # NOTE re-entered when an instance is released by the GC.
+        self.__local      = threading.local()
+        self.__started    = False
+
+    def start(self) -> 'MemoryRecorder':
+        """ Start tracing the allocations unless already traced. """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.__frames)
+
+            self.__started = True
+
+        return self
+
+    def stop(self):
+        """ Stop tracing the allocations if started by :meth:`start`. """
+        if self.__started:
+            tracemalloc.stop()
+
+            self.__started = False
+
+    def measure(self, entity_id : str, make : callable):
+        """ Make the instance of the entity and record the allocations.
+
+            :param callable make: the callable making the instance
+        """
+        stack = getattr(self.__local, 'stack', None)
+
+        if stack is None:
+            stack = self.__local.stack = []
+
+        nested_bytes = [0]
+
+        stack.append(nested_bytes)
+
+        allocated_before = tracemalloc.get_traced_memory()[0]
+
+        try:
+            return make()
+        finally:
+            inclusive_bytes = tracemalloc.get_traced_memory()[0] - allocated_before
+
+            stack.pop()
+
+            if stack:
+                stack[-1][0] += inclusive_bytes
+
+            with self.__lock:
+                stats = self.__get_stats(entity_id)
+
+                stats.activations     += 1
+                stats.inclusive_bytes += inclusive_bytes
+                stats.retained_bytes  += inclusive_bytes - nested_bytes[0]
+
+    def track(self, entity_id : str, instance):
+        """ Count the instance of the entity until it is released. """
+        with self.__lock:
+            stats = self.__get_stats(entity_id)
+
+            try:
+                reference = weakref.ref(instance, self.__release)
+            except TypeError:
+                stats.untracked += 1
+
+                return
+
+            # NOTE Keyed by the ID, as the weak reference is only hashable with the instance.
+            self.__references[id(reference)] = (reference, entity_id)
+
+            stats.created += 1
+            stats.live    += 1
+
+    def census(self) -> dict:
+        """ Get the number of live instances of each entity which is not cacheable. """
+        with self.__lock:
+            return {entity_id: stats.live for entity_id, stats in self.__stats.items() if stats.created}
+
+    def sample(self) -> dict:
+        """ Take the census into the history. """
+        census = self.census()
+
+        with self.__lock:
+            self.__samples.append(census)
+
+        return census
+
+    def growing(self, samples : int = 3) -> list:
+        """ Get the entities whose live instances have grown in every one of the last samples.
+
+            :param int samples: the number of the last samples to compare
+
+            :return: the list of the entity IDs and the numbers of the live instances,
+                     from the largest growth
+        """
+        with self.__lock:
+            recent_samples = list(self.__samples)[-samples:]
+
+        if len(recent_samples) < max(samples, 2):
+            return []
+
+        growing = []
+
+        for entity_id in recent_samples[-1]:
+            counts = [sample.get(entity_id, 0) for sample in recent_samples]
+
+            if all(previous < current for previous, current in zip(counts, counts[1:])):
+                growing.append((entity_id, counts))
+
+        growing.sort(key = lambda item: (item[1][0] - item[1][-1], item[0]))
+
+        return growing
+
+    def report(self, top : int = 10, samples : int = 3) -> dict:
+        """ Take the census and report the top consumers and the growing entities.
+
+            Called periodically, e.g., by a long-running worker, this finds the leaking entities.
+
+            :param int top: the number of the top consumers
+            :param int samples: see :meth:`growing`
+        """
+        self.sample()
+
+        with self.__lock:
+            all_stats = [stats.to_dict() for stats in self.__stats.values()]
+
+        all_stats.sort(key = lambda stats: (-stats['retained_bytes'], stats['entity_id']))
+
+        return {
+            'traced_bytes'  : tracemalloc.get_traced_memory()[0],
+            'top_consumers' : all_stats[:top],
+            'instances'     : {
+                stats['entity_id']: {'created': stats['created'], 'live': stats['live'], 'untracked': stats['untracked']}
+                for stats in all_stats
+                if stats['created'] or stats['untracked']
+            },
+            'growing'       : self.growing(samples),
+        }
+
+    def __get_stats(self, entity_id):
+        if entity_id not in self.__stats:
+            self.__stats[entity_id] = EntityMemoryStats(entity_id)
+
+        return self.__stats[entity_id]
+
+    def __release(self, reference):
+        with self.__lock:
+            _, entity_id = self.__references.pop(id(reference), (None, None))
+
+            if entity_id is not None:
+                self.__stats[entity_id].live -= 1
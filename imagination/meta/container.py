@@ -1,7 +1,7 @@
 # v2
 from ..debug          import PrintableMixin
 from ..helper.general import extract_dependency_ids_from_parameters
-from .definition      import ParameterCollection
+from .definition      import ParameterCollection, intern_string
 
 
 class FrozenContainerError(RuntimeError):
@@ -11,22 +11,28 @@ class FrozenContainerError(RuntimeError):
 
 
 class Container(PrintableMixin):
+    """ Base of the container metadata
+
+        The parameters are frozen and shared with the identical ones, see
+        :meth:`imagination.meta.definition.ParameterCollection.freeze`.
+    """
+    __slots__ = ('_is_frozen', '_cacheable', '_identifier', '_params', '_interceptions',
+                 '_dependencies')
+
     def __init__(self,
                  identifier    : str,
                  params        : ParameterCollection = None,
-                 interceptions : list = [],
+                 interceptions : list = None,
                  cacheable     : bool = True
                  ):
         assert identifier, 'Container ID must be defined.'
 
         self._is_frozen     = False
         self._cacheable     = cacheable
-        self._identifier    = identifier.strip()
-        self._params        = params or ParameterCollection()
-        self._interceptions = interceptions
-        self._dependencies  = set()  # Container ID
-
-        self._dependency_calculated = False
+        self._identifier    = intern_string(identifier.strip())
+        self._params        = (params or ParameterCollection()).freeze()
+        self._interceptions = tuple(interceptions) if interceptions else ()
+        self._dependencies  = None  # Container IDs, calculated on demand
 
     @property
     def id(self):
@@ -39,7 +45,7 @@ class Container(PrintableMixin):
                 'Forbidden to change the identifier in the frozen state'
             )
 
-        self._identifier = new_id
+        self._identifier = intern_string(new_id)
 
     @property
     def params(self):
@@ -55,30 +61,28 @@ class Container(PrintableMixin):
 
     @property
     def dependencies(self):
-        if not self._dependency_calculated:
-            self._dependencies.update(
-                extract_dependency_ids_from_parameters(self._params)
-            )
-
-            self._dependency_calculated = True
+        if self._dependencies is None:
+            self._dependencies = extract_dependency_ids_from_parameters(self._params)
 
         return self._dependencies
 
 
 class Entity(Container):
     """ Metadata representing Entity """
+    __slots__ = ('_fqcn',)
+
     def __init__(self,
                  identifier    : str,
                  fqcn          : str,
                  params        : ParameterCollection = None,
-                 interceptions : list = [],
+                 interceptions : list = None,
                  cacheable     : bool = True
                  ):
         Container.__init__(self, identifier, params, interceptions, cacheable)
 
         assert fqcn, 'Container\'s class must be defined.'
 
-        self._fqcn = fqcn
+        self._fqcn = intern_string(fqcn)
 
     @property
     def fqcn(self):
@@ -87,12 +91,14 @@ class Entity(Container):
 
 class Factorization(Container):
     """ Metadata representing Factorization """
+    __slots__ = ('_factory_id', '_factory_method_name')
+
     def __init__(self,
                  identifier          : str,
                  factory_id          : str,
                  factory_method_name : str,
                  params              : ParameterCollection = None,
-                 interceptions       : list = [],
+                 interceptions       : list = None,
                  cacheable           : bool = True
                  ):
         Container.__init__(self, identifier, params, interceptions, cacheable)
@@ -100,8 +106,8 @@ class Factorization(Container):
         assert factory_id,          'Undefined factory ID'
         assert factory_method_name, 'Undefined factory method'
 
-        self._factory_id          = factory_id
-        self._factory_method_name = factory_method_name
+        self._factory_id          = intern_string(factory_id)
+        self._factory_method_name = intern_string(factory_method_name)
 
     @property
     def factory_id(self):
@@ -113,16 +119,12 @@ class Factorization(Container):
 
     @property
     def dependencies(self):
-        if not self._dependency_calculated:
+        if self._dependencies is None:
+            self._dependencies = extract_dependency_ids_from_parameters(self._params)
+
             # Add the factory container ID as the primary dependency.
             self._dependencies.add(self._factory_id)
 
-            self._dependencies.update(
-                extract_dependency_ids_from_parameters(self._params)
-            )
-
-            self._dependency_calculated = True
-
         return self._dependencies
 
 
@@ -138,6 +140,8 @@ class Lambda(Container):
         .. warn:: This type of containers does not use parameters.
         .. warn:: This type of containers does not support interception.
     """
+    __slots__ = ('_fq_callable_name',)
+
     def __init__(self,
                  identifier       : str,
                  fq_callable_name : str,
@@ -148,7 +152,7 @@ class Lambda(Container):
 
         assert fq_callable_name, 'Undefined callable'
 
-        self._fq_callable_name = fq_callable_name
+        self._fq_callable_name = intern_string(fq_callable_name)
 
         if params and len(params):
             raise LambdaUnusedParameterWarning('The parameters will not be used.')
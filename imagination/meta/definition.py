@@ -1,11 +1,32 @@
 # v2
+import sys
+import weakref
+
 from ..debug import PrintableMixin
 
+_SHAREABLE_DEFINITION_TYPES = (str, int, float, bool, type(None))
+
+_shared_definitions = weakref.WeakValueDictionary()  # content -> DataDefinition
+_shared_collections = weakref.WeakValueDictionary()  # content -> frozen ParameterCollection
+
+
+def intern_string(value):
+    """ Intern the string, so that the identical strings are shared (or return the value as it is). """
+    return sys.intern(value) if type(value) is str else value
+
 
 class DuplicateParameterDefinitionWarning(Warning):
     """ Warning for Duplicate Parameter Definition """
 
 
+class InvalidInterceptionError(ValueError):
+    """ Error when the interception is defined with invalid options. """
+
+
+class FrozenParameterCollectionError(RuntimeError):
+    """ Error when the external code attempts to modify the frozen parameter collection. """
+
+
 class DataDefinition(PrintableMixin):
     """ Parameter/Data Definition
 
@@ -14,11 +35,13 @@ class DataDefinition(PrintableMixin):
         :param str kind: the data type
         :param bool transformation_required: flag if data transformation required
     """
+    __slots__ = ('__name', '__kind', '__definition', '__transformation_required', '__weakref__')
+
     def __init__(self, definition, name : str = None, kind : str = None,
                  transformation_required : bool = True):
-        self.__name       = name
-        self.__kind       = kind or 'str'
-        self.__definition = definition
+        self.__name       = intern_string(name)
+        self.__kind       = intern_string(kind or 'str')
+        self.__definition = intern_string(definition) if self.__kind in ('entity', 'class') else definition
 
         self.__transformation_required = transformation_required
 
@@ -38,11 +61,40 @@ class DataDefinition(PrintableMixin):
     def transformation_required(self):
         return self.__transformation_required
 
+    def share(self):
+        """ Get the shared data definition identical to this one.
+
+            The nested parameter collection is frozen with :meth:`ParameterCollection.freeze`.
+            The definition of any other type than a string, a number, a boolean
+            or ``None`` is not shared.
+        """
+        definition = self.__definition
+
+        if type(definition) is ParameterCollection:
+            frozen_definition = definition.freeze()
+
+            if frozen_definition is not definition:
+                return DataDefinition(frozen_definition, self.__name, self.__kind,
+                                      self.__transformation_required).share()
+        elif type(definition) not in _SHAREABLE_DEFINITION_TYPES:
+            return self
+
+        key = (self.__name, self.__kind, type(definition), definition, self.__transformation_required)
+
+        return _shared_definitions.setdefault(key, self)
+
 
 class ParameterCollection(PrintableMixin):
+    """ Collection of the positional and the keyword parameters
+
+        Once frozen with :meth:`freeze`, the parameters are kept in tuples.
+    """
+    __slots__ = ('__list', '__map', '__frozen', '__weakref__')
+
     def __init__(self):
-        self.__list = list()
-        self.__map  = dict()
+        self.__list   = list()
+        self.__map    = dict()  # or the tuple of the pairs of the names and the definitions once frozen
+        self.__frozen = False
 
     @property
     def all(self):
@@ -56,10 +108,13 @@ class ParameterCollection(PrintableMixin):
             yield item
 
     def items(self):
-        for k, v in list(self.__map.items()):
+        for k, v in (self.__map if self.__frozen else list(self.__map.items())):
             yield k, v
 
     def add(self, meta_parameter : DataDefinition, name = None):
+        if self.__frozen:
+            raise FrozenParameterCollectionError()
+
         if not name:
             self.__list.append(meta_parameter)
 
@@ -73,6 +128,36 @@ class ParameterCollection(PrintableMixin):
     def __len__(self):
         return len(self.__list) + len(self.__map)
 
+    @property
+    def frozen(self):
+        return self.__frozen
+
+    def freeze(self):
+        """ Freeze the collection into tuples.
+
+            The identical strings, data definitions and (frozen) collections
+            are shared, so the returned collection may be another instance
+            identical to this one. This collection must not be modified after.
+
+            :return: the shared frozen collection
+        """
+        if self.__frozen:
+            return self
+
+        sequence = tuple(item.share() for item in self.__list)
+        pairs    = tuple((intern_string(name), item.share()) for name, item in self.__map.items())
+        key      = (sequence, pairs)
+        shared   = _shared_collections.get(key)
+
+        if shared is not None:
+            return shared
+
+        self.__list   = sequence
+        self.__map    = pairs
+        self.__frozen = True
+
+        return _shared_collections.setdefault(key, self)
+
 
 class Interception(PrintableMixin):
     """ Metadata for Interception
@@ -82,31 +167,76 @@ class Interception(PrintableMixin):
             The "before" event is now the same as "pre" and "after" is the same
             as "post" from version 2. The "pre" and "post" events will be
             deprecated.
+
+        .. note::
+
+            The intercepting method of an "around" interception receives the
+            :class:`imagination.wrapper.JoinPoint`, the positional parameters
+            and the keyword parameters, and it is responsible for calling
+            ``joinpoint.proceed``.
+
+        .. note::
+
+            The method to intercept ``*`` means every public method of the
+            intercepted entity.
     """
     __self_references__ = {'self', 'me'}  # "me" is a legacy self-reference.
-    __known_events__    = ('before', 'after', 'error', 'pre', 'post')
+    __known_events__    = ('before', 'after', 'error', 'around', 'pre', 'post')
     __remap_events__    = {'pre': 'before', 'post': 'after'}
+    __known_modes__     = ('sync', 'async')
+    __async_events__    = ('before', 'after')
+
+    __slots__ = ('_when_to_intercept', '_intercepted_id', '_method_to_intercept', '_interceptor_id',
+                 '_intercepting_method', '_count_items', '_mode', '_sample_rate', '_sample_every',
+                 '_enabled')
 
     def __init__(self,
                  when_to_intercept   : str,
                  intercepted_id      : str,
                  method_to_intercept : str,
                  interceptor_id      : str,
-                 intercepting_method : str
+                 intercepting_method : str,
+                 count_items         : bool = False,
+                 mode                : str = 'sync',
+                 sample_rate         : float = 1.0,
+                 sample_every        : int = 1,
+                 enabled             : bool = True
                  ):
 
-        assert when_to_intercept in self.__known_events__, 'Unknown event given ({})'.format(when_to_intercept)
-        assert method_to_intercept and interceptor_id and intercepting_method
+        if when_to_intercept not in self.__known_events__:
+            raise InvalidInterceptionError('Unknown event given ({})'.format(when_to_intercept))
+
+        if not (method_to_intercept and interceptor_id and intercepting_method):
+            raise InvalidInterceptionError('The method to intercept, the interceptor and the intercepting method are required.')
+
+        if mode not in self.__known_modes__:
+            raise InvalidInterceptionError('Unknown mode given ({})'.format(mode))
+
+        if not 0 < sample_rate <= 1:
+            raise InvalidInterceptionError('The sample rate must be in (0, 1] ({})'.format(sample_rate))
+
+        if sample_every < 1:
+            raise InvalidInterceptionError('The sample interval must be positive ({})'.format(sample_every))
+
+        if mode != 'sync' and self.__remap_events__.get(when_to_intercept, when_to_intercept) not in self.__async_events__:
+            raise InvalidInterceptionError(
+                'The "{}" event does not support the "{}" mode'.format(when_to_intercept, mode)
+            )
 
         # NOTE Remap for PARTIAL backward compatibility.
         if when_to_intercept in self.__remap_events__:
             when_to_intercept = self.__remap_events__[when_to_intercept]
 
-        self._when_to_intercept   = when_to_intercept
-        self._intercepted_id      = intercepted_id
-        self._method_to_intercept = method_to_intercept
-        self._interceptor_id      = interceptor_id
-        self._intercepting_method = intercepting_method
+        self._when_to_intercept   = intern_string(when_to_intercept)
+        self._intercepted_id      = intern_string(intercepted_id)
+        self._method_to_intercept = intern_string(method_to_intercept)
+        self._interceptor_id      = intern_string(interceptor_id)
+        self._intercepting_method = intern_string(intercepting_method)
+        self._count_items         = count_items
+        self._mode                = intern_string(mode)
+        self._sample_rate         = sample_rate
+        self._sample_every        = sample_every
+        self._enabled             = enabled
 
     @property
     def when_to_intercept(self):
@@ -128,5 +258,44 @@ class Interception(PrintableMixin):
     def intercepting_method(self):
         return self._intercepting_method
 
+    @property
+    def count_items(self):
+        """ Flag to give the number of produced items to an "after"
+            interception of a generator, as ``item_count``.
+        """
+        return self._count_items
+
+    @property
+    def mode(self):
+        """ The execution mode; ``sync`` to execute the intercepting method
+            in the calling thread, or ``async`` to hand it over to the
+            background dispatcher of the core (``before`` and ``after`` only).
+        """
+        return self._mode
+
+    @property
+    def sample_rate(self):
+        """ The probability to intercept a call """
+        return self._sample_rate
+
+    @property
+    def sample_every(self):
+        """ The interval to intercept a call, e.g., ``100`` for every 100th call """
+        return self._sample_every
+
+    @property
+    def sampled(self):
+        """ Flag if only some calls are intercepted """
+        return self._sample_rate < 1 or self._sample_every > 1
+
+    @property
+    def enabled(self):
+        """ Flag if the interception is enabled initially
+
+            .. note:: Use :meth:`imagination.core.Imagination.enable_interceptions`
+                      to enable the interception at runtime.
+        """
+        return self._enabled
+
     def is_self_interception(self):
         return self._interceptor_id in self.__self_references__
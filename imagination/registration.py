@@ -0,0 +1,256 @@
+# v2
+""" Registration of the containers in Python, without configuration files
+
+The decorators record the metadata into a :class:`MetadataRegistry` when the
+decorated module is imported, e.g.,
+
+.. code-block:: python
+
+    from imagination.registration import entity, factory, intercept, ref
+
+    @entity('app.db', params = {'host': '{ $DB_HOST or "localhost" }', 'port': 5432})
+    class Database(object):
+        @factory('app.db.session')
+        def make_session(self):
+            ...
+
+    @entity('app.audit')
+    class Auditor(object):
+        @intercept('before', 'app.db', 'make_session')
+        def record(self, *args, **kwargs):
+            ...
+
+Then, the whole registry is loaded at once with
+``core.update_metadata(default_registry.containers())``.
+
+The parameter values are converted with :func:`make_data_definition`.
+"""
+import threading
+
+from .meta.container  import Container, Entity, Factorization, Lambda
+from .meta.definition import DataDefinition, Interception, ParameterCollection
+
+_COLLECTION_KINDS = {list: 'list', tuple: 'tuple', set: 'set', frozenset: 'set'}
+
+
+class UnreachableReferenceError(ValueError):
+    """ Error when the class or the callable cannot be resolved by its dotted path,
+        e.g., it is defined in a function or in another class.
+    """
+
+
+class MetadataRegistry(object):
+    """ Registry of the container metadata recorded by the decorators
+
+        The metadata is kept in the order of registration. A container
+        registered again with the same ID overrides the previous one.
+    """
+    def __init__(self):
+        self.__containers = {}
+        self.__lock       = threading.Lock()
+
+    def add(self, meta_container : Container) -> Container:
+        with self.__lock:
+            self.__containers[meta_container.id] = meta_container
+
+        return meta_container
+
+    def containers(self) -> dict:
+        """ Get the map of the container ID to the metadata, e.g., for :meth:`Imagination.update_metadata`. """
+        with self.__lock:
+            return dict(self.__containers)
+
+    def clear(self):
+        with self.__lock:
+            self.__containers.clear()
+
+    def __contains__(self, container_id):
+        return container_id in self.__containers
+
+    def __len__(self):
+        return len(self.__containers)
+
+
+default_registry = MetadataRegistry()
+
+
+def ref(entity_id : str) -> DataDefinition:
+    """ Refer to the entity as a parameter. """
+    return DataDefinition(entity_id, kind = 'entity')
+
+
+def typed(definition, kind : str) -> DataDefinition:
+    """ Define the parameter of the given data type, e.g., ``typed('1.00 CAD', 'money')``. """
+    return DataDefinition(definition, kind = kind)
+
+
+def get_reference_path(reference) -> str:
+    """ Get the dotted path of the module-level class or callable. """
+    if isinstance(reference, str):
+        return reference
+
+    name = getattr(reference, '__qualname__', None) or getattr(reference, '__name__', None)
+
+    if not name or '.' in name or not getattr(reference, '__module__', None):
+        raise UnreachableReferenceError('{} is not defined at the module level.'.format(reference))
+
+    return '{}.{}'.format(reference.__module__, name)
+
+
+def make_data_definition(value, name : str = None) -> DataDefinition:
+    """ Convert the Python value into the data definition.
+
+        - :class:`DataDefinition`, e.g., from :func:`ref` or :func:`typed`, is kept.
+        - A string is of the ``str`` type, so that the value blocks are rendered.
+        - A boolean or a number is of the ``bool``, ``int`` or ``float`` type.
+        - A class is of the ``class`` type.
+        - A list, a tuple, a set or a dictionary is converted item by item.
+        - Anything else, including ``None``, is given as it is.
+    """
+    value_type = type(value)
+
+    if value_type is DataDefinition:
+        return DataDefinition(value.definition, name, value.kind, value.transformation_required)
+
+    if value_type is str:
+        return DataDefinition(value, name, 'str')
+
+    if value_type is bool:
+        return DataDefinition('true' if value else 'false', name, 'bool')
+
+    if value_type in (int, float):
+        return DataDefinition(value, name, value_type.__name__)
+
+    if isinstance(value, type):
+        return DataDefinition(get_reference_path(value), name, 'class')
+
+    if value_type in _COLLECTION_KINDS:
+        return DataDefinition(make_parameters(value), name, _COLLECTION_KINDS[value_type])
+
+    if value_type is dict:
+        return DataDefinition(make_parameters(params = value), name, 'dict')
+
+    return DataDefinition(value, name, transformation_required = False)
+
+
+def make_parameters(args : list = None, params : dict = None) -> ParameterCollection:
+    """ Make the parameter collection.
+
+        :param list args: the positional parameters
+        :param dict params: the keyword parameters
+    """
+    collection = ParameterCollection()
+
+    for value in args or []:
+        collection.add(make_data_definition(value))
+
+    for name, value in (params or {}).items():
+        collection.add(make_data_definition(value, name), name)
+
+    return collection
+
+
+def make_entity(entity_id : str, cls, args : list = None, params : dict = None,
+                interceptions : list = None, cacheable : bool = True) -> Entity:
+    """ Make the metadata of the entity.
+
+        :param str entity_id: the entity ID
+        :param cls: the class or its dotted path
+        :param list args: the positional parameters
+        :param dict params: the keyword parameters
+        :param list interceptions: the interceptions by this entity
+        :param bool cacheable: flag to reuse the instance
+    """
+    return Entity(entity_id, get_reference_path(cls), make_parameters(args, params),
+                  list(interceptions or []), cacheable)
+
+
+def make_factorization(entity_id : str, factory_id : str, factory_method_name : str,
+                       args : list = None, params : dict = None,
+                       interceptions : list = None, cacheable : bool = True) -> Factorization:
+    """ Make the metadata of the entity made by the factory method of another entity. """
+    return Factorization(entity_id, factory_id, factory_method_name, make_parameters(args, params),
+                         list(interceptions or []), cacheable)
+
+
+def make_callable(entity_id : str, function, cacheable : bool = True) -> Lambda:
+    """ Make the metadata of the callable entity.
+
+        :param function: the callable or its dotted path
+    """
+    return Lambda(entity_id, get_reference_path(function), cacheable = cacheable)
+
+
+def entity(entity_id : str, args : list = None, params : dict = None, cacheable : bool = True,
+           registry : MetadataRegistry = None):
+    """ Register the decorated class as an entity.
+
+        The methods decorated with :func:`factory` and :func:`intercept` are
+        registered with this entity as the factory or the interceptor.
+
+        :param MetadataRegistry registry: the registry (optional, ``default_registry`` by default)
+    """
+    target_registry = default_registry if registry is None else registry
+
+    def register(cls):
+        interceptions  = []
+        factorizations = []
+
+        for name, member in vars(cls).items():
+            for when, intercepted_id, method, options in getattr(member, '__imagination_interceptions__', ()):
+                interceptions.append(Interception(when, intercepted_id, method, entity_id, name, **options))
+
+            for factorization_id, factorization_options in getattr(member, '__imagination_factorizations__', ()):
+                factorizations.append(make_factorization(factorization_id, entity_id, name, **factorization_options))
+
+        target_registry.add(make_entity(entity_id, cls, args, params, interceptions, cacheable))
+
+        for factorization in factorizations:
+            target_registry.add(factorization)
+
+        return cls
+
+    return register
+
+
+def factory(entity_id : str, factory_id : str = None, args : list = None, params : dict = None,
+            cacheable : bool = True, registry : MetadataRegistry = None):
+    """ Register the entity made by the decorated method.
+
+        :param str factory_id: the ID of the factory entity (optional, the
+                               entity of the class decorated with :func:`entity` by default)
+    """
+    target_registry = default_registry if registry is None else registry
+    options         = {'args': args, 'params': params, 'cacheable': cacheable}
+
+    def register(method):
+        if factory_id:
+            target_registry.add(make_factorization(entity_id, factory_id, method.__name__, **options))
+
+            return method
+
+        method.__imagination_factorizations__ = getattr(method, '__imagination_factorizations__', ()) \
+            + ((entity_id, options),)
+
+        return method
+
+    return register
+
+
+def intercept(when_to_intercept : str, intercepted_id : str, method_to_intercept : str, **options):
+    """ Make the decorated method intercept the method of another entity.
+
+        The decorated method must be in the class decorated with :func:`entity`.
+
+        :param str when_to_intercept: ``before``, ``after``, ``error`` or ``around``
+        :param options: the other options of :class:`imagination.meta.definition.Interception`,
+                        e.g., ``mode``, ``sample_rate`` or ``enabled``
+    """
+    def register(method):
+        method.__imagination_interceptions__ = getattr(method, '__imagination_interceptions__', ()) \
+            + ((when_to_intercept, intercepted_id, method_to_intercept, options),)
+
+        return method
+
+    return register
+
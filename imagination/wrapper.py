@@ -1,4 +1,11 @@
 # v2
+import inspect
+import itertools
+import random
+
+WILDCARD_METHOD = '*'
+
+
 def is_wrapper(obj):
     return hasattr(obj, '__imagination_wrapper__')
 
@@ -11,12 +18,19 @@ class Wrapper(object):
         :param callable core_get: a callable reference to the associated :method:`Imagination.get`.
         :param object instance: a wrapped instance
         :param dict interceptions: the event-type-to-method-name-to-interception map
+        :param str intercepted_id: the ID of the wrapped entity
+        :param callable dispatch_advice: a callable reference to the dispatcher of the "async" interceptions
+
+        .. note:: The interceptions registered to the method name ``*`` apply
+                  to every public method of the wrapped instance.
     """
-    def __init__(self, core_get, instance, interceptions):
+    def __init__(self, core_get, instance, interceptions, intercepted_id = None, dispatch_advice = None):
         self.__dict__ = {
             '_internal_core_get'        : core_get,
             '_internal_instance'        : instance,
             '_internal_interceptions'   : interceptions,
+            '_internal_intercepted_id'  : intercepted_id,
+            '_internal_dispatch_advice' : dispatch_advice,
             '_internal_cache_callables' : {},
         }
 
@@ -36,6 +50,7 @@ class Wrapper(object):
         if name in self.__dict__:
             return self.__dict__[name]
 
+        # NOTE The cache must be read before the interceptions. See _reset_interceptions.
         cached_callables = self.__dict__['_internal_cache_callables']
 
         if name in cached_callables:
@@ -47,35 +62,155 @@ class Wrapper(object):
         instance = self.__dict__['_internal_instance']
 
         if not hasattr(instance, name):
-            raise AttributeError('{} has no attribute "{}".'.format(type(actual_object).__name__), name)
+            raise AttributeError('{} has no attribute "{}".'.format(type(instance).__name__, name))
 
         returning_callable = getattr(instance, name)
+        method_interceptions = self._select_interceptions(interceptions, name, returning_callable)
 
-        if name in interceptions:
+        if method_interceptions:
             interceptable_callable = InterceptableCallable(
                 core_get,
                 returning_callable,
-                interceptions[name]
+                method_interceptions,
+                self.__dict__['_internal_intercepted_id'],
+                name,
+                instance,
+                self.__dict__['_internal_dispatch_advice']
             )
 
             cached_callables[name] = interceptable_callable
 
             return interceptable_callable
 
+        # NOTE The un-intercepted method is cached too, e.g., while its interceptions are disabled.
+        if inspect.ismethod(returning_callable) and returning_callable.__self__ is instance:
+            cached_callables[name] = returning_callable
+
         return returning_callable
 
+    def _reset_interceptions(self, interceptions):
+        """ Replace the interceptions, e.g., when an interception is enabled or disabled. """
+        self.__dict__['_internal_interceptions']   = interceptions
+        self.__dict__['_internal_cache_callables'] = {}
+
+    def _select_interceptions(self, interceptions, name, reference):
+        if WILDCARD_METHOD not in interceptions or name[0] == '_' or not callable(reference):
+            return interceptions.get(name)
+
+        wildcard_interceptions = interceptions[WILDCARD_METHOD]
+
+        if name not in interceptions:
+            return wildcard_interceptions
+
+        specific_interceptions = interceptions[name]
+
+        return {
+            event_type: specific_interceptions[event_type] + wildcard_interceptions[event_type]
+            for event_type in specific_interceptions
+        }
+
+
+class JoinPoint(object):
+    """ Join point given to "around" interceptions
+
+        The join point is created once per intercepted method, not per call.
+
+        :param str intercepted_id: the ID of the intercepted entity
+        :param str method_name: the name of the intercepted method
+        :param callable proceed: the next step of the call chain, which takes
+                                 the same parameters as the intercepted method
+        :param bool is_coroutine: flag if the intercepted method is a coroutine function
+        :param object instance: the intercepted instance (optional)
+    """
+    __slots__ = ('intercepted_id', 'method_name', 'proceed', 'is_coroutine', 'instance')
+
+    def __init__(self, intercepted_id, method_name, proceed, is_coroutine = False, instance = None):
+        self.intercepted_id = intercepted_id
+        self.method_name    = method_name
+        self.proceed        = proceed
+        self.is_coroutine   = is_coroutine
+        self.instance       = instance
+
+
 class InterceptableCallable(object):
     """ Interceptable callable object
 
         This class is to actually handle the call operation with the ability to intercept the activity.
+
+        The "around" interceptions are chained once at construction, from the
+        outermost (first defined) to the innermost, which calls the actual callable.
+
+        When the intercepted method returns a generator, an asynchronous
+        generator or a coroutine, the returned object is relayed without
+        buffering, and the "after" and "error" interceptions happen when it
+        is exhausted (or awaited) or when it fails. A stream closed early by
+        the consumer is not intercepted.
     """
-    def __init__(self, core_get, callable_reference, interceptions):
-        self._internal_core_get      = core_get
-        self._internal_callable      = callable_reference
-        self._internal_interceptions = interceptions
+    def __init__(self, core_get, callable_reference, interceptions,
+                 intercepted_id = None, method_name = None, instance = None,
+                 dispatch_advice = None):
+        self._internal_core_get        = core_get
+        self._internal_callable        = callable_reference
+        self._internal_interceptions   = interceptions
+        self._internal_dispatch_advice = dispatch_advice
+        self._internal_samplers        = self._make_samplers()
+        self._internal_invoke          = self._chain_around_interceptions(
+            intercepted_id,
+            method_name or getattr(callable_reference, '__name__', None),
+            instance
+        )
+
+    def _chain_around_interceptions(self, intercepted_id, method_name, instance):
+        invoke       = self._internal_callable
+        is_coroutine = inspect.iscoroutinefunction(invoke)
+
+        for interception in reversed(self._internal_interceptions.get('around') or []):
+            joinpoint = JoinPoint(intercepted_id, method_name, invoke, is_coroutine, instance)
+            invoke    = self._make_around_step(interception, joinpoint)
+
+        return invoke
+
+    def _make_around_step(self, interception, joinpoint):
+        core_get            = self._internal_core_get
+        interceptor_id      = interception.interceptor_id
+        intercepting_method = interception.intercepting_method
+
+        if interception.sampled:
+            sampler = _make_sampler(interception)
+
+            def sampled_step(*largs, **kwargs):
+                if not sampler():
+                    return joinpoint.proceed(*largs, **kwargs)
+
+                interceptor = core_get(interceptor_id)
+
+                return getattr(interceptor, intercepting_method)(joinpoint, largs, kwargs)
+
+            return sampled_step
+
+        def step(*largs, **kwargs):
+            interceptor = core_get(interceptor_id)
+
+            return getattr(interceptor, intercepting_method)(joinpoint, largs, kwargs)
+
+        return step
+
+    def _make_samplers(self):
+        """ Make the samplers of the sampled "before", "after" and "error" interceptions. """
+        return {
+            interception: _make_sampler(interception)
+            for event_type in ('before', 'after', 'error')
+            for interception in self._internal_interceptions.get(event_type) or []
+            if interception.sampled
+        }
+
+    def _skips(self, interception):
+        sampler = self._internal_samplers.get(interception)
+
+        return sampler is not None and not sampler()
 
     def _has_interceptions(self, event_type):
-        return bool(self._internal_interceptions[event_type])
+        return bool(self._internal_interceptions.get(event_type))
 
     def _intercept(self, event_type, largs = None, kwargs = None, error = None):
         if not self._has_interceptions(event_type):
@@ -87,13 +222,24 @@ class InterceptableCallable(object):
         last_result = None
 
         for interception in self._internal_interceptions[event_type]:
-            interceptor         = self._internal_core_get(interception.interceptor_id)
-            intercepting_method = getattr(interceptor,
-                                          interception.intercepting_method)
+            if self._internal_samplers and self._skips(interception):
+                continue
 
-            last_result = intercepting_method(error, largs, kwargs) \
-                if error \
-                else intercepting_method(*largs, **kwargs)
+            if interception.mode == 'async' and self._internal_dispatch_advice:
+                self._internal_dispatch_advice(self._execute_interception, interception, largs, kwargs)
+
+                continue
+
+            last_result = self._execute_interception(interception, largs, kwargs, error)
+
+    def _execute_interception(self, interception, largs, kwargs, error = None):
+        interceptor         = self._internal_core_get(interception.interceptor_id)
+        intercepting_method = getattr(interceptor,
+                                      interception.intercepting_method)
+
+        return intercepting_method(error, largs, kwargs) \
+            if error \
+            else intercepting_method(*largs, **kwargs)
 
     def __call__(self, *largs, **kwargs):
         self._intercept('before', largs, kwargs)
@@ -102,15 +248,152 @@ class InterceptableCallable(object):
 
         if self._has_interceptions('error'):
             try:
-                result = self._internal_callable(*largs, **kwargs)
+                result = self._internal_invoke(*largs, **kwargs)
             except Exception as error:
                 self._intercept('error', largs, kwargs, error)
 
                 raise error
         else:
-            result = self._internal_callable(*largs, **kwargs)
+            result = self._internal_invoke(*largs, **kwargs)
+
+        if not (self._has_interceptions('after') or self._has_interceptions('error')):
+            return result
+
+        if inspect.isgenerator(result):
+            return self._intercept_generator(result, largs, kwargs)
+
+        if inspect.isasyncgen(result):
+            return self._intercept_async_generator(result, largs, kwargs)
+
+        if inspect.iscoroutine(result):
+            return self._intercept_coroutine(result, largs, kwargs)
+
+        if self._has_interceptions('after'):
+            self._intercept('after', [result])
+
+        return result
+
+    def _intercept_generator(self, generator, largs, kwargs):
+        """ Relay the generator and intercept when it is exhausted or fails. """
+        counter = _ItemCounter(generator)
+
+        try:
+            returned = yield from counter
+        except Exception as error:
+            self._intercept('error', largs, kwargs, error)
+
+            raise
+
+        self._intercept_end_of_stream(returned, counter.count)
+
+        return returned
+
+    async def _intercept_async_generator(self, generator, largs, kwargs):
+        """ Relay the asynchronous generator and intercept when it is exhausted or fails. """
+        item_count = 0
+
+        try:
+            item = await generator.asend(None)
+
+            while True:
+                item_count += 1
+
+                try:
+                    sent_value = yield item
+                except GeneratorExit:
+                    await generator.aclose()
+
+                    raise
+                except BaseException as thrown:
+                    # Like "yield from", the thrown exception is given to the generator.
+                    item = await generator.athrow(thrown)
+                else:
+                    item = await generator.asend(sent_value)
+        except StopAsyncIteration:
+            pass
+        except Exception as error:
+            self._intercept('error', largs, kwargs, error)
+
+            raise
+
+        self._intercept_end_of_stream(None, item_count)
+
+    async def _intercept_coroutine(self, coroutine, largs, kwargs):
+        try:
+            result = await coroutine
+        except Exception as error:
+            self._intercept('error', largs, kwargs, error)
+
+            raise
 
         if self._has_interceptions('after'):
             self._intercept('after', [result])
 
         return result
+
+    def _intercept_end_of_stream(self, returned, item_count):
+        for interception in self._internal_interceptions.get('after') or []:
+            if self._internal_samplers and self._skips(interception):
+                continue
+
+            kwargs = {'item_count': item_count} if interception.count_items else {}
+
+            if interception.mode == 'async' and self._internal_dispatch_advice:
+                self._internal_dispatch_advice(self._execute_interception, interception, [returned], kwargs)
+
+                continue
+
+            self._execute_interception(interception, [returned], kwargs)
+
+
+def _make_sampler(interception):
+    """ Make the callable deciding if the next call is intercepted. """
+    sample_rate  = interception.sample_rate
+    sample_every = interception.sample_every
+
+    if sample_every > 1:
+        # NOTE next() on itertools.count is atomic in CPython.
+        counter = itertools.count()
+
+        if sample_rate < 1:
+            return lambda: next(counter) % sample_every == 0 and random.random() < sample_rate
+
+        return lambda: next(counter) % sample_every == 0
+
+    return lambda: random.random() < sample_rate
+
+
+class _ItemCounter(object):
+    """ Generator proxy counting the produced items """
+    __slots__ = ('generator', 'count')
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.count     = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self.generator)
+
+        self.count += 1
+
+        return item
+
+    def send(self, value):
+        item = self.generator.send(value)
+
+        self.count += 1
+
+        return item
+
+    def throw(self, *args):
+        item = self.generator.throw(*args)
+
+        self.count += 1
+
+        return item
+
+    def close(self):
+        self.generator.close()
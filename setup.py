@@ -1,8 +1,10 @@
-from distutils.core import setup
+from setuptools import setup
+
+from imagination import __version__
 
 setup(
     name         = 'imagination',
-    version      = '2.5.3',
+    version      = '.'.join(str(number) for number in __version__),
     description  = 'Reusable Component Framework',
     author       = 'Juti Noppornpitak',
     author_email = 'juti_n@yahoo.co.jp',
@@ -12,6 +14,12 @@ setup(
         'imagination.assembler',
         'imagination.decorator',
         'imagination.helper',
+        'imagination.interceptor',
         'imagination.meta',
-    ]
+    ],
+    entry_points = {
+        'console_scripts': [
+            'imagination = imagination.cli:main',
+        ],
+    },
 )
@@ -0,0 +1,19 @@
+class UserRepository(object):
+    def __init__(self):
+        self.batches = []
+
+    def get_user(self, user_id):
+        return self.get_users([user_id])[0]
+
+    def get_users(self, user_ids):
+        self.batches.append(user_ids)
+
+        return ['user-{}'.format(user_id) for user_id in user_ids]
+
+    async def find_user(self, user_id):
+        return (await self.find_users([user_id]))[user_id]
+
+    async def find_users(self, user_ids):
+        self.batches.append(user_ids)
+
+        return {user_id: 'user-{}'.format(user_id) for user_id in user_ids if user_id >= 0}
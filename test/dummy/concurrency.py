@@ -0,0 +1,34 @@
+import asyncio
+import threading
+
+
+class Gate(object):
+    """ Service whose calls stay in flight until the gate opens """
+    def __init__(self):
+        self.opened  = threading.Event()
+        self.entered = threading.Semaphore(0)
+        self.calls   = 0
+
+    def pass_through(self, value, **options):
+        self.calls += 1
+        self.entered.release()
+        self.opened.wait(5)
+
+        return value
+
+    async def pass_through_async(self, value):
+        self.calls += 1
+
+        while not self.opened.is_set():
+            await asyncio.sleep(0.001)
+
+        return value
+
+    def fail_through(self, value):
+        self.pass_through(value)
+
+        raise LookupError(value)
+
+
+def ignore_options(value, **options):
+    return value
@@ -1,3 +1,6 @@
+DEFAULT_COUNT = 0
+
+
 class ObjectWithListAndDict(object):
     def __init__(self, l=[], d={}, t=tuple()):
         self.l = l
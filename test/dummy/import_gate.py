@@ -0,0 +1,4 @@
+import threading
+
+started  = threading.Event()
+released = threading.Event()
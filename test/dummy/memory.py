@@ -0,0 +1,13 @@
+class Buffer(object):
+    def __init__(self, size : int):
+        self.data = bytearray(size)
+
+
+class Holder(object):
+    def __init__(self, buffer : Buffer):
+        self.buffer = buffer
+
+
+class Job(object):
+    def __init__(self):
+        self.data = bytearray(1000)
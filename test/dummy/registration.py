@@ -0,0 +1,52 @@
+from imagination.registration import MetadataRegistry, entity, factory, intercept, ref
+
+registry = MetadataRegistry()
+
+
+@entity(
+    'registered.store',
+    params   = {
+        'name'     : '{ $REGISTERED_STORE_NAME or "memory" }',
+        'capacity' : 8,
+        'tags'     : ['a', 'b'],
+        'options'  : {'strict': True},
+    },
+    registry = registry,
+)
+class Store(object):
+    def __init__(self, name, capacity, tags, options):
+        self.name     = name
+        self.capacity = capacity
+        self.tags     = tags
+        self.options  = options
+        self.items    = []
+
+    def put(self, item):
+        self.items.append(item)
+
+    @factory('registered.session', params = {'label': 'main'}, registry = registry)
+    def open(self, label):
+        return Session(self, label)
+
+
+class Session(object):
+    def __init__(self, store, label):
+        self.store = store
+        self.label = label
+
+
+@entity('registered.auditor', registry = registry)
+class Auditor(object):
+    def __init__(self):
+        self.records = []
+
+    @intercept('before', 'registered.store', 'put')
+    def record(self, item):
+        self.records.append(item)
+
+
+@entity('registered.client', args = [ref('registered.store'), Session], registry = registry)
+class Client(object):
+    def __init__(self, store, session_class):
+        self.store         = store
+        self.session_class = session_class
@@ -42,3 +42,10 @@ class Charlie(object):
         self.conversation.log(self, 'serve')
 
         return self.name
+
+class Delta(object):
+    def fail(self):
+        raise RuntimeError('delta')
+
+    async def wait(self, value):
+        return value
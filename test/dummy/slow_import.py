@@ -0,0 +1,8 @@
+from dummy.import_gate import released, started
+
+started.set()
+released.wait(5)
+
+
+class Slow(object):
+    pass
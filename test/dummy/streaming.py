@@ -0,0 +1,68 @@
+import threading
+import time
+
+
+class Stream(object):
+    def __init__(self):
+        self.produced = 0
+        self.closed   = False
+
+    def numbers(self, limit):
+        for i in range(limit):
+            self.produced += 1
+
+            yield i
+
+        return 'done'
+
+    def broken_numbers(self, limit):
+        yield from self.numbers(limit)
+
+        raise ValueError(limit)
+
+    async def async_numbers(self, limit):
+        for i in range(limit):
+            self.produced += 1
+
+            yield i
+
+    async def resilient_numbers(self, limit):
+        try:
+            for i in range(limit):
+                try:
+                    yield i
+                except ValueError:
+                    yield -1
+        finally:
+            self.closed = True
+
+    async def total(self, limit):
+        return sum(range(limit))
+
+    def sum_up(self, limit):
+        return sum(range(limit))
+
+
+class Auditor(object):
+    def __init__(self):
+        self.records = []
+
+    def record(self, result, item_count = None):
+        self.records.append(('after', result, item_count))
+
+    def record_error(self, error, largs, kwargs):
+        self.records.append(('error', type(error).__name__, largs))
+
+
+class SlowAuditor(Auditor):
+    def __init__(self):
+        Auditor.__init__(self)
+
+        self.threads = set()
+
+    def record(self, result, item_count = None):
+        time.sleep(0.01)
+
+        self.threads.add(threading.current_thread().name)
+
+        Auditor.record(self, result, item_count)
@@ -0,0 +1,20 @@
+import decimal
+
+
+class Money(object):
+    def __init__(self, definition):
+        amount, currency = definition.split(' ')
+
+        self.amount   = decimal.Decimal(amount)
+        self.currency = currency
+
+
+class Invoice(object):
+    def __init__(self, total, due_in, issued_at, pattern, options, tags, notes = None):
+        self.total     = total
+        self.due_in    = due_in
+        self.issued_at = issued_at
+        self.pattern   = pattern
+        self.options   = options
+        self.tags      = tags
+        self.notes     = notes
@@ -0,0 +1,20 @@
+class Temperature(object):
+    def __init__(self, celsius : float, label : str = 'room'):
+        self.celsius = celsius
+        self.label   = label
+
+    def read(self):
+        return self.celsius
+
+
+class Thermostat(object):
+    def __init__(self, sensor : Temperature):
+        self.sensor = sensor
+
+    def make_sensor(self, celsius):
+        return Temperature(celsius)
+
+
+class Peer(object):
+    def __init__(self, peer):
+        self.peer = peer
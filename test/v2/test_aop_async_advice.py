@@ -0,0 +1,128 @@
+import sys
+import threading
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core  import Assembler
+    from imagination.dispatcher      import AdviceDispatcher
+    from imagination.meta.definition import Interception, InvalidInterceptionError
+
+
+class UnitTest(unittest.TestCase):
+    def test_unsupported_event(self):
+        with self.assertRaises(InvalidInterceptionError):
+            Interception('error', 'alpha', 'order', 'bravo', 'handle_error', mode = 'async')
+
+    def test_drop(self):
+        gate       = threading.Event()
+        dispatcher = AdviceDispatcher(max_queue_size = 1, overflow = 'drop')
+        executed   = []
+
+        self.assertTrue(dispatcher.dispatch(gate.wait))
+
+        while dispatcher.pending:
+            pass  # until the worker takes the first advice
+
+        self.assertTrue(dispatcher.dispatch(executed.append, 1))
+        self.assertFalse(dispatcher.dispatch(executed.append, 2))
+
+        gate.set()
+        dispatcher.shut_down()
+
+        self.assertEqual([1], executed)
+        self.assertEqual({'dispatched': 2, 'dropped': 1, 'failed': 0, 'pending': 0}, dispatcher.snapshot())
+
+    def test_drop_oldest(self):
+        gate       = threading.Event()
+        dispatcher = AdviceDispatcher(max_queue_size = 1, overflow = 'drop-oldest')
+        executed   = []
+
+        dispatcher.dispatch(gate.wait)
+
+        while dispatcher.pending:
+            pass
+
+        dispatcher.dispatch(executed.append, 1)
+        dispatcher.dispatch(executed.append, 2)
+
+        gate.set()
+        dispatcher.shut_down()
+
+        self.assertEqual([2], executed)
+
+    def test_dispatch_from_advice(self):
+        gate       = threading.Event()
+        dispatcher = AdviceDispatcher(max_queue_size = 1, overflow = 'block')
+        executed   = []
+
+        def advise():
+            gate.wait()
+            dispatcher.dispatch(executed.append, 'nested')  # The queue is full.
+
+        dispatcher.dispatch(advise)
+
+        while dispatcher.pending:
+            pass
+
+        dispatcher.dispatch(executed.append, 'queued')
+
+        gate.set()
+
+        shutting_down = threading.Thread(target = dispatcher.shut_down, daemon = True)
+        shutting_down.start()
+        shutting_down.join(5)
+
+        self.assertFalse(shutting_down.is_alive())  # The worker never waits for itself.
+        self.assertEqual(['nested', 'queued'], executed)
+
+    def test_shut_down_while_dispatching(self):
+        dispatcher = AdviceDispatcher(max_queue_size = 1, overflow = 'drop-oldest')
+        started    = threading.Barrier(5)
+
+        def dispatch():
+            started.wait()
+
+            for i in range(2000):
+                dispatcher.dispatch(len, ())
+
+        threads = [threading.Thread(target = dispatch) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        started.wait()
+
+        shutting_down = threading.Thread(target = dispatcher.shut_down, daemon = True)
+        shutting_down.start()
+        shutting_down.join(5)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(shutting_down.is_alive())  # The stop signal is never dropped.
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load('test/data/locator-aop-async-advice.xml')
+
+        self.core = self.assembler.core
+
+    def test_after(self):
+        stream  = self.core.get('stream')
+        auditor = self.core.get('auditor')
+
+        for i in range(5):
+            self.assertEqual(3, stream.sum_up(3))
+
+        self.assertEqual([0, 1], list(stream.numbers(2)))
+        self.assertLess(len(auditor.records), 6)
+
+        self.core.shut_down()
+
+        self.assertEqual([('after', 3, None)] * 5 + [('after', 'done', 2)], auditor.records)
+        self.assertNotIn(threading.current_thread().name, auditor.threads)
@@ -0,0 +1,94 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core  import Assembler
+    from imagination.assembler.xml   import InvalidInterceptionAttributeError, XMLParser
+    from imagination.meta.definition import Interception, InvalidInterceptionError
+    from imagination.wrapper         import InterceptableCallable, _make_sampler
+
+
+class UnitTest(unittest.TestCase):
+    def test_sample_every(self):
+        sampler = _make_sampler(Interception('after', 'alpha', 'order', 'bravo', 'acknowledge', sample_every = 4))
+
+        self.assertEqual([True, False, False, False] * 2, [sampler() for i in range(8)])
+
+    def test_sample_rate(self):
+        sampler = _make_sampler(Interception('after', 'alpha', 'order', 'bravo', 'acknowledge', sample_rate = 0.5))
+        sampled = len([i for i in range(4000) if sampler()])
+
+        self.assertTrue(1600 < sampled < 2400, sampled)
+
+    def test_invalid_sample_rate(self):
+        with self.assertRaises(InvalidInterceptionError):
+            Interception('after', 'alpha', 'order', 'bravo', 'acknowledge', sample_rate = 0)
+
+    def test_invalid_sampling_attribute(self):
+        directory = tempfile.mkdtemp()
+        filepath  = os.path.join(directory, 'containers.xml')
+        template  = (
+            '<imagination>'
+            '<entity id="tracer" class="dummy.streaming.Auditor">'
+            '<interception after="stream" do="sum_up" with="record" {}/>'
+            '</entity>'
+            '</imagination>'
+        )
+
+        try:
+            for attributes in ('sample="0"', 'sample="1.5"', 'sample="half"', 'every="0"', 'every="2.5"'):
+                with open(filepath, 'w') as f:
+                    f.write(template.format(attributes))
+
+                with self.assertRaises(InvalidInterceptionAttributeError) as context:
+                    XMLParser().parse(filepath)
+
+                self.assertIn('tracer', str(context.exception))
+                self.assertIn(attributes, str(context.exception))
+        finally:
+            shutil.rmtree(directory)
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load('test/data/locator-aop-sampling.xml')
+
+        self.core = self.assembler.core
+
+    def test_sampling(self):
+        stream = self.core.get('stream')
+        tracer = self.core.get('tracer')
+
+        for i in range(6):
+            stream.sum_up(i)
+
+        self.assertEqual([('after', 0, None), ('after', 3, None)], tracer.records)
+
+    def test_runtime_switch(self):
+        stream = self.core.get('stream')
+        tracer = self.core.get('tracer')
+
+        self.assertNotIsInstance(stream.numbers, InterceptableCallable)
+        self.assertIsInstance(stream.sum_up, InterceptableCallable)
+
+        self.assertEqual(2, self.core.disable_interceptions('tracer'))
+        self.assertNotIsInstance(stream.sum_up, InterceptableCallable)
+        self.assertIs(stream.sum_up, stream.sum_up)  # The un-intercepted method is cached.
+
+        stream.sum_up(1)
+
+        self.assertEqual([], tracer.records)
+
+        self.assertEqual(2, self.core.enable_interceptions('tracer', 'record'))
+        self.assertIsInstance(stream.numbers, InterceptableCallable)
+
+        list(stream.numbers(2))
+
+        self.assertEqual([('after', 'done', None)], tracer.records)
@@ -0,0 +1,69 @@
+import asyncio
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core import Assembler
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load('test/data/locator-aop-streaming.xml')
+
+        self.core    = self.assembler.core
+        self.stream  = self.core.get('stream')
+        self.auditor = self.core.get('auditor')
+
+    def test_generator(self):
+        numbers = self.stream.numbers(3)
+
+        self.assertEqual([], self.auditor.records)
+        self.assertEqual(0, next(numbers))
+        self.assertEqual(1, self.stream.produced)
+        self.assertEqual([], self.auditor.records)
+        self.assertEqual([1, 2], list(numbers))
+        self.assertEqual([('after', 'done', 3)], self.auditor.records)
+
+    def test_generator_with_error(self):
+        with self.assertRaises(ValueError):
+            for i in self.stream.broken_numbers(2):
+                pass
+
+        self.assertEqual([('error', 'ValueError', (2,))], self.auditor.records)
+
+    def test_generator_closed_early(self):
+        for i in self.stream.numbers(5):
+            break
+
+        self.assertEqual([], self.auditor.records)
+
+    def test_async_generator(self):
+        async def consume():
+            return [i async for i in self.stream.async_numbers(4)]
+
+        self.assertEqual([0, 1, 2, 3], asyncio.run(consume()))
+        self.assertEqual([('after', None, 4)], self.auditor.records)
+
+    def test_async_generator_with_thrown_error(self):
+        async def consume():
+            numbers = self.stream.resilient_numbers(5)
+            items   = [await numbers.__anext__(), await numbers.athrow(ValueError()), await numbers.__anext__()]
+
+            self.assertFalse(self.stream.closed)
+
+            with self.assertRaises(KeyError):
+                await numbers.athrow(KeyError('ghost'))
+
+            return items
+
+        self.assertEqual([0, -1, 1], asyncio.run(consume()))
+        self.assertTrue(self.stream.closed)
+        self.assertEqual([('error', 'KeyError', (5,))], self.auditor.records)
+
+    def test_coroutine(self):
+        self.assertEqual(3, asyncio.run(self.stream.total(3)))
+        self.assertEqual([('after', 3, None)], self.auditor.records)
@@ -0,0 +1,135 @@
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from unittest import mock
+
+if sys.version_info >= (3, 3):
+    import imagination
+
+    from imagination.assembler.cache    import export_container, import_container
+    from imagination.assembler.core     import Assembler
+    from imagination.assembler.xml      import XMLParser
+    from imagination.debug              import export_meta_container
+    from imagination.helper.transformer import TypeRegistry, UnknownKindError
+
+    class CountingXMLParser(XMLParser):
+        def __init__(self, registry = None):
+            super().__init__(registry)
+
+            self.parsed_filepaths = []
+
+        def parse_with_types(self, filepath):
+            self.parsed_filepaths.append(filepath)
+
+            return super().parse_with_types(filepath)
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.directory  = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.directory, 'cache', 'metadata.bin')
+        self.filepaths  = []
+
+        for name in ('locator.xml', 'locator-factorization.xml', 'locator-types.xml'):
+            self.filepaths.append(os.path.join(self.directory, name))
+
+            shutil.copy(os.path.join('test/data', name), self.filepaths[-1])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self, registry = None):
+        parser    = CountingXMLParser(registry or TypeRegistry())
+        assembler = Assembler(max_workers = 1, parsers = [parser], cache_path = self.cache_path)
+
+        assembler.load(*self.filepaths)
+
+        return assembler, parser
+
+    def test_export_and_import(self):
+        for filepath in sorted(glob.glob('test/data/*.xml')):
+            try:
+                container_map = XMLParser(TypeRegistry()).parse(filepath)
+            except UnknownKindError:
+                continue
+
+            for meta_container in container_map.values():
+                self.assertEqual(export_meta_container(meta_container),
+                                 export_meta_container(import_container(export_container(meta_container))))
+
+    def test_cache_hit(self):
+        _, parser = self.load()
+
+        self.assertEqual(3, len(parser.parsed_filepaths))
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        registry          = TypeRegistry()
+        assembler, parser = self.load(registry)
+
+        self.assertEqual([], parser.parsed_filepaths)
+        self.assertEqual(3, assembler.cache.hits)
+        self.assertIn('money', registry)  # The data types are cached too.
+        self.assertEqual(2, assembler.core.get('poow-1').a)
+        self.assertTrue(assembler.core.contain('invoice'))
+
+    def test_invalidation_per_file(self):
+        self.load()
+
+        with open(self.filepaths[0]) as f:
+            content = f.read()
+
+        with open(self.filepaths[0], 'w') as f:
+            f.write(content.replace('<param name="a" type="int">2</param>', '<param name="a" type="int">3</param>'))
+
+        future = os.stat(self.filepaths[0]).st_mtime + 10
+
+        os.utime(self.filepaths[0], (future, future))
+
+        assembler, parser = self.load()
+
+        self.assertEqual([self.filepaths[0]], parser.parsed_filepaths)
+        self.assertEqual(3, assembler.core.get('poow-1').a)
+
+        _, parser = self.load()
+
+        self.assertEqual([], parser.parsed_filepaths)
+
+    def test_touched_file(self):
+        self.load()
+
+        future = os.stat(self.filepaths[1]).st_mtime + 10
+
+        os.utime(self.filepaths[1], (future, future))
+
+        _, parser = self.load()
+
+        self.assertEqual([], parser.parsed_filepaths)
+
+    def test_version_change(self):
+        self.load()
+
+        with mock.patch.object(imagination, '__version__', (99, 0, 0)):
+            _, parser = self.load()
+
+        self.assertEqual(3, len(parser.parsed_filepaths))
+
+    def test_corrupted_cache(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+
+        with open(self.cache_path, 'wb') as f:
+            f.write(b'\x00garbage')
+
+        _, parser = self.load()
+
+        self.assertEqual(3, len(parser.parsed_filepaths))
+
+        _, parser = self.load()
+
+        self.assertEqual([], parser.parsed_filepaths)
@@ -2,8 +2,10 @@ import sys
 import unittest
 
 if sys.version_info >= (3, 3):
-    from imagination.debug          import dump_meta_container
-    from imagination.assembler.core import Assembler
+    from imagination.assembler.core     import Assembler, DuplicateContainerIDError
+    from imagination.assembler.xml      import XMLParser
+    from imagination.debug              import export_meta_container
+    from imagination.helper.transformer import TypeRegistry, type_registry
 
 
 class FunctionalTest(unittest.TestCase):
@@ -26,4 +28,54 @@ class FunctionalTest(unittest.TestCase):
         self.assertIn('poo',    meta_containers['owlad'].dependencies)
 
     def test_activation_order(self):
-        pass
\ No newline at end of file
+        pass
+
+    def test_parallel_parsing(self):
+        filepaths = self.test_filepaths + ['test/data/locator-aop-streaming.xml', 'test/data/locator-types.xml']
+
+        sequential = Assembler(max_workers = 1)._load_config_files(*filepaths)
+
+        for assembler in (Assembler(max_workers = 4), Assembler(max_workers = 2, use_processes = True)):
+            meta_containers = assembler._load_config_files(*filepaths)
+
+            self.assertEqual(list(sequential), list(meta_containers))
+
+            for container_id, meta_container in sequential.items():
+                self.assertEqual(export_meta_container(meta_container),
+                                 export_meta_container(meta_containers[container_id]))
+
+            self.assertEqual('test/data/locator-types.xml', assembler.origins['invoice'])
+
+    def test_override_order(self):
+        filepaths = ['test/data/locator-override.xml', 'test/data/locator.xml', 'test/data/locator-types.xml']
+
+        for use_processes in (False, True):
+            assembler = Assembler(max_workers = 3, use_processes = use_processes)
+
+            with self.assertLogs('imagination.assembler', 'WARNING') as logs:
+                assembler.load(*filepaths)
+
+            self.assertIn('poow-2 is defined in test/data/locator-override.xml and overridden by test/data/locator.xml.',
+                          logs.output[0])
+            self.assertEqual(5, assembler.core.get('poow-2').a)
+            self.assertEqual('test/data/locator.xml', assembler.origins['poow-2'])
+
+            # The data type used by the first file is defined by the last one.
+            self.assertEqual('3.00', str(assembler.core.get('receipt').total.amount))
+            self.assertIn('money', type_registry)
+
+        # Sequentially, with the data type not registered yet
+        registry  = TypeRegistry()
+        assembler = Assembler(max_workers = 1, parsers = [XMLParser(registry)])
+
+        with self.assertLogs('imagination.assembler', 'WARNING'):
+            meta_containers = assembler._load_config_files(*filepaths)
+
+        self.assertIn('receipt', meta_containers)
+        self.assertIn('money', registry)
+
+    def test_strict_override(self):
+        assembler = Assembler(strict = True)
+
+        with self.assertRaisesRegex(DuplicateContainerIDError, 'locator-override.xml'):
+            assembler.load('test/data/locator.xml', 'test/data/locator-override.xml')
\ No newline at end of file
@@ -0,0 +1,155 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core     import Assembler
+    from imagination.assembler.stream   import StreamingXMLParser
+    from imagination.assembler.xml      import XMLParser
+    from imagination.exc                import UndefinedContainerIDError
+    from imagination.helper.transformer import TypeRegistry
+
+    class CountingXMLParser(XMLParser):
+        def __init__(self, registry = None):
+            super().__init__(registry)
+
+            self.parsed_filepaths  = []
+            self.indexed_filepaths = []
+
+        def parse_with_types(self, filepath):
+            self.parsed_filepaths.append(os.path.basename(filepath))
+
+            return super().parse_with_types(filepath)
+
+        def index_with_types(self, filepath):
+            self.indexed_filepaths.append(os.path.basename(filepath))
+
+            return super().index_with_types(filepath)
+
+
+SHARDS = {
+    'kitchen.xml': '''
+        <entity id="conversation" class="dummy.sample_aop.Conversation"/>
+        <entity id="charlie" class="dummy.sample_aop.Charlie">
+            <param type="entity" name="conversation">conversation</param>
+        </entity>
+    ''',
+    'alpha.xml': '''
+        <entity id="alpha" class="dummy.sample_aop.Alpha">
+            <param type="entity" name="conversation">conversation</param>
+            <param type="entity" name="accompany">beta</param>
+            <interception before="charlie" do="cook" with="order"/>
+            <interception after="charlie" do="serve" with="say_thank"/>
+        </entity>
+    ''',
+    'beta.xml': '''
+        <entity id="beta" class="dummy.sample_aop.Beta">
+            <param type="entity" name="conversation">conversation</param>
+            <interception after="alpha" do="order" with="acknowledge"/>
+        </entity>
+    ''',
+    'unused.xml': '''
+        <type name="money" with="dummy.types.Money" immutable="true"/>
+        <entity id="charlie" class="dummy.core.PlainOldObject"/>
+        <entity id="poo" class="dummy.core.PlainOldObject"/>
+    ''',
+}
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.directory  = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.directory, 'metadata.bin')
+        self.filepaths  = []
+
+        for name in ('unused.xml', 'kitchen.xml', 'alpha.xml', 'beta.xml'):
+            self.filepaths.append(os.path.join(self.directory, name))
+
+            with open(self.filepaths[-1], 'w') as f:
+                f.write('<imagination>{}</imagination>'.format(SHARDS[name]))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self, parser = None, cache_path = None):
+        parser    = parser or CountingXMLParser(TypeRegistry())
+        assembler = Assembler(max_workers = 1, parsers = [parser], cache_path = cache_path, lazy = True)
+
+        assembler.load(*self.filepaths)
+
+        return assembler.core, parser
+
+    def test_load_on_first_use(self):
+        core, parser = self.load()
+
+        self.assertEqual(['unused.xml', 'kitchen.xml', 'alpha.xml', 'beta.xml'], parser.indexed_filepaths)
+        self.assertEqual([], parser.parsed_filepaths)
+        self.assertEqual({'conversation', 'charlie', 'alpha', 'beta', 'poo'}, set(core.all_ids()))
+        self.assertTrue(core.contain('alpha'))
+        self.assertTrue(parser.registry.is_immutable('money'))
+
+        charlie = core.get('charlie')
+
+        self.assertEqual(['kitchen.xml'], parser.parsed_filepaths)
+        self.assertFalse(core.is_loaded('alpha'))
+
+        # The interceptions by the entities not loaded yet apply.
+        charlie.cook()
+        charlie.serve()
+
+        self.assertEqual(['kitchen.xml', 'alpha.xml', 'beta.xml'], parser.parsed_filepaths)
+        self.assertEqual(
+            [
+                'Alpha: orders "egg"',
+                'Beta: acknowledge "egg"',
+                'Charlie: cook',
+                'Charlie: serve',
+                'Alpha: says "Thank you" to Charlie',
+            ],
+            core.get('conversation').logs
+        )
+
+        self.assertFalse(core.is_loaded('poo'))
+
+    def test_missing_container(self):
+        core, _ = self.load()
+
+        with open(self.filepaths[1], 'w') as f:
+            f.write('<imagination>{}</imagination>'.format(SHARDS['kitchen.xml'].split('<entity id="charlie"')[0]))
+
+        with self.assertRaises(UndefinedContainerIDError):
+            core.get('charlie')
+
+        self.assertFalse(core.contain('charlie'))
+        self.assertIsNotNone(core.get('conversation'))
+
+    def test_cached_index(self):
+        self.load(cache_path = self.cache_path)
+
+        core, parser = self.load(cache_path = self.cache_path)
+
+        self.assertEqual([], parser.indexed_filepaths)
+        self.assertEqual({'conversation', 'charlie', 'alpha', 'beta', 'poo'}, set(core.all_ids()))
+
+        core.get('charlie').cook()
+
+        self.assertEqual(['kitchen.xml', 'alpha.xml', 'beta.xml'], parser.parsed_filepaths)
+
+        core, parser = self.load(cache_path = self.cache_path)
+
+        core.get('charlie').cook()
+
+        self.assertEqual([], parser.parsed_filepaths)
+        self.assertEqual(3, len(core.get('conversation').logs))
+
+    def test_streaming_parser(self):
+        core, _ = self.load(StreamingXMLParser(TypeRegistry()))
+
+        core.get('charlie').cook()
+
+        self.assertEqual(3, len(core.get('conversation').logs))
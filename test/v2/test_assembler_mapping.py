@@ -0,0 +1,72 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core     import Assembler
+    from imagination.assembler.json     import JSONParser
+    from imagination.assembler.mapping  import MappingNode, UnsupportedValueError
+    from imagination.assembler.toml     import TOMLParser, tomllib
+    from imagination.assembler.xml      import XMLParser
+    from imagination.debug              import export_meta_container
+    from imagination.helper.transformer import TypeRegistry
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def assert_parity(self, parser, filepath):
+        expected = XMLParser(TypeRegistry()).parse('test/data/topology.xml')
+        actual   = parser.parse(filepath)
+
+        self.assertEqual(sorted(expected), sorted(actual))
+
+        for container_id, meta_container in expected.items():
+            self.assertEqual(export_meta_container(meta_container),
+                             export_meta_container(actual[container_id]),
+                             container_id)
+
+    def test_json(self):
+        parser = JSONParser(TypeRegistry())
+
+        self.assertTrue(parser.can_handle('app/containers.JSON'))
+        self.assertFalse(parser.can_handle('app/containers.xml'))
+
+        self.assert_parity(parser, 'test/data/topology.json')
+
+        self.assertIn('money', parser.registry)
+
+    def test_structured_value(self):
+        registry = TypeRegistry()
+
+        for mapping in ({'name': 'a', 'type': 'json', 'value': {'k': [1, 2]}}, {'name': 'a', 'value': {'k': [1, 2]}}):
+            node = MappingNode('param', mapping)
+
+            self.assertEqual('json', node.attribute('type'))
+            self.assertEqual({'k': [1, 2]}, registry.get('json')(node.data()))
+
+        with self.assertRaisesRegex(UnsupportedValueError, 'param "a"'):
+            MappingNode('param', {'name': 'a', 'type': 'str', 'value': [1]}).data()
+
+    def test_toml(self):
+        if tomllib is None:
+            self.skipTest('TOML is not supported without tomllib or tomli.')
+
+        self.assert_parity(TOMLParser(TypeRegistry()), 'test/data/topology.toml')
+
+    def test_assembler(self):
+        for filepath in ('test/data/topology.json', 'test/data/topology.toml'):
+            if filepath.endswith('.toml') and tomllib is None:
+                continue
+
+            assembler = Assembler()
+            assembler.load(filepath)
+
+            core = assembler.core
+
+            self.assertEqual(2, core.get('poow').a)
+            self.assertFalse(core.get('poow').d)
+            self.assertEqual(6, core.get('doubler')(3))
+            self.assertEqual('CAD', core.get('owlad').t[1].currency)
+            self.assertEqual({'a': 6, 'b': {'ramen'}}, core.get('owlad').d)
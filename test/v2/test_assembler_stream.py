@@ -0,0 +1,61 @@
+import glob
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.abstract import ConfigParser
+    from imagination.assembler.core     import Assembler
+    from imagination.assembler.json     import JSONParser
+    from imagination.assembler.stream   import StreamingXMLParser
+    from imagination.assembler.xml      import XMLParser
+    from imagination.debug              import export_meta_container
+    from imagination.helper.transformer import TypeRegistry, UnknownKindError
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_parity(self):
+        for filepath in sorted(glob.glob('test/data/*.xml')):
+            try:
+                expected = XMLParser(TypeRegistry()).parse(filepath)
+            except UnknownKindError:
+                with self.assertRaises(UnknownKindError):
+                    StreamingXMLParser(TypeRegistry()).parse(filepath)
+
+                continue
+
+            actual   = StreamingXMLParser(TypeRegistry()).parse(filepath)
+
+            self.assertEqual(list(expected), list(actual), filepath)
+
+            for container_id, meta_container in expected.items():
+                self.assertEqual(export_meta_container(meta_container),
+                                 export_meta_container(actual[container_id]),
+                                 '{}: {}'.format(filepath, container_id))
+
+    def test_shared_members(self):
+        registry = TypeRegistry()
+
+        for parser in (XMLParser(registry), StreamingXMLParser(registry), JSONParser(registry)):
+            parser.register_types([('shared_' + type(parser).__name__, 'decimal.Decimal', True)])
+
+            self.assertIs(registry, parser.registry)
+            self.assertIn('shared_' + type(parser).__name__, registry)
+
+        self.assertTrue(StreamingXMLParser().can_handle('test/data/LOCATOR.XML'))
+        self.assertFalse(StreamingXMLParser().can_handle('test/data/topology.json'))
+        self.assertEqual(XMLParser().parse('test/data/locator.xml').keys(),
+                         StreamingXMLParser().parse('test/data/locator.xml').keys())
+
+        with self.assertRaises(NotImplementedError):
+            ConfigParser().parse('test/data/locator.xml')
+
+    def test_assembler(self):
+        assembler = Assembler(parsers = [StreamingXMLParser()])
+        assembler.load('test/data/locator.xml', 'test/data/locator-types.xml')
+
+        self.assertEqual(2, assembler.core.get('poow-1').a)
+        self.assertEqual('CAD', assembler.core.get('invoice').total.currency)
@@ -0,0 +1,107 @@
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.cli import EXIT_ERROR, EXIT_FINDINGS, EXIT_OK, main
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def run_command(self, *argv):
+        output      = io.StringIO()
+        errors      = io.StringIO()
+        exit_code   = main(list(argv), output, errors)
+        self.errors = errors.getvalue()
+
+        return exit_code, output.getvalue()
+
+    def test_stats(self):
+        exit_code, output = self.run_command('stats', '--json', 'test/data/locator-aop.xml')
+
+        stats = json.loads(output)
+
+        self.assertEqual(EXIT_OK, exit_code)
+        self.assertEqual(4, stats['containers'])
+        self.assertEqual(2, stats['max_depth'])
+        self.assertEqual(['conversation', 3], stats['most_depended'][0])
+        self.assertEqual(4, stats['interceptions'])
+        self.assertEqual([], stats['cycles'])
+
+        exit_code, output = self.run_command('stats', 'test/data/locator-aop.xml')
+
+        self.assertIn('max depth', output)
+
+    def test_dependants(self):
+        self.assertEqual(
+            (EXIT_OK, 'alpha\nbeta\ncharlie\n'),
+            self.run_command('dependants', 'conversation', 'test/data/locator-aop.xml')
+        )
+        self.assertEqual(
+            (EXIT_OK, 'alpha\n'),
+            self.run_command('dependants', 'beta', 'test/data/locator-aop.xml', '--transitive')
+        )
+        self.assertEqual(EXIT_ERROR, self.run_command('dependants', 'ghost', 'test/data/locator-aop.xml')[0])
+        self.assertIn('Undefined container: ghost', self.errors)
+
+    def test_validate(self):
+        exit_code, output = self.run_command('validate', 'test/data/locator-invalid.xml')
+
+        self.assertEqual(EXIT_FINDINGS, exit_code)
+        self.assertIn('dioe [undefined-dependency] Undefined dependency: ghost', output)
+        self.assertEqual((EXIT_OK, '0 problem(s) found\n'), self.run_command('validate', 'test/data/locator.xml'))
+
+    def test_compile(self):
+        directory  = tempfile.mkdtemp()
+        cache_path = os.path.join(directory, 'metadata.bin')
+
+        try:
+            exit_code, output = self.run_command('compile', '--cache', cache_path, 'test/data/locator.xml')
+
+            self.assertEqual(EXIT_OK, exit_code)
+            self.assertTrue(os.path.exists(cache_path))
+            self.assertEqual(EXIT_ERROR, self.run_command('compile', 'test/data/locator.xml')[0])
+            self.assertIn('--cache', self.errors)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_time(self):
+        exit_code, output = self.run_command('time', '--repeat', '2', 'test/data/locator.xml')
+
+        self.assertEqual(EXIT_OK, exit_code)
+        self.assertEqual(['parse', 'lock-down', 'warm-up'], [line.split()[0] for line in output.splitlines()])
+        self.assertTrue(all('cold' in line and 'warm min' in line for line in output.splitlines()))
+
+        exit_code, output = self.run_command('time', 'test/data/locator.xml')
+
+        self.assertEqual(EXIT_OK, exit_code)
+        self.assertFalse(any('warm min' in line for line in output.splitlines()))
+
+    def test_stream(self):
+        exit_code, output = self.run_command('stats', '--json', '--stream', 'test/data/topology.json', 'test/data/locator.xml')
+
+        self.assertEqual(EXIT_OK, exit_code)
+        self.assertEqual(12, json.loads(output)['containers'])
+
+    def test_unsupported_file(self):
+        exit_code, output = self.run_command('stats', 'test/data/unknown.yml')
+
+        self.assertEqual(EXIT_ERROR, exit_code)
+        self.assertEqual('', output)
+        self.assertIn('UnsupportedConfigFileError', self.errors)
+
+    def test_path_restored(self):
+        original_path = list(sys.path)
+
+        self.assertEqual(EXIT_OK, self.run_command('stats', '--path', 'test/dummy', 'test/data/locator.xml')[0])
+        self.assertEqual(original_path, sys.path)
+
+        self.assertEqual(EXIT_ERROR, self.run_command('stats', '--path', 'test/dummy', 'test/data/unknown.yml')[0])
+        self.assertEqual(original_path, sys.path)
@@ -0,0 +1,51 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core import Assembler
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load(
+            'test/data/locator.xml',
+            'test/data/locator-factorization.xml',
+            'test/data/container-callable.xml',
+        )
+
+        self.core = self.assembler.core
+
+    def test_collect_module_paths(self):
+        self.assertEqual(
+            {'dummy.core', 'dummy.factorization', 'dummy.exec'},
+            self.core._collect_module_paths()
+        )
+
+    def test_preload(self):
+        self.core.lock_down(preload_modules = True, max_workers = 2)
+
+        preloader = self.core.module_preloader
+
+        self.assertTrue(preloader.wait(5))
+        self.assertEqual({'dummy.core', 'dummy.factorization', 'dummy.exec'}, set(preloader.timings))
+        self.assertEqual({}, preloader.failures)
+        self.assertIsNotNone(self.core.get('dioc'))
+
+    def test_preload_in_order(self):
+        import_order = ['dummy.exec', 'dummy.unused', 'dummy.core']
+
+        self.core.lock_down(preload_modules = True, import_order = import_order)
+
+        preloader = self.core.module_preloader
+
+        self.assertTrue(preloader.wait(5))
+        self.assertEqual(['dummy.exec', 'dummy.core', 'dummy.factorization'], preloader.import_order)
+
+    def test_no_preload(self):
+        self.core.lock_down()
+
+        self.assertIsNone(self.core.module_preloader)
@@ -0,0 +1,69 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.analysis       import GraphValidationError, find_cycles
+    from imagination.assembler.core import Assembler
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def load(self, *filepaths):
+        assembler = Assembler()
+        assembler.load(*filepaths)
+
+        return assembler.core
+
+    def test_valid_graph(self):
+        core = self.load(
+            'test/data/locator.xml',
+            'test/data/locator-factorization.xml',
+            'test/data/container-callable.xml',
+            'test/data/locator-aop.xml',
+        )
+
+        core.lock_down(validate = True)
+
+        self.assertEqual([], core.findings)
+        self.assertEqual(2, core.get('poow-1').a)
+
+    def test_all_findings_at_once(self):
+        core = self.load('test/data/locator-invalid.xml')
+
+        with self.assertRaises(GraphValidationError) as context:
+            core.lock_down(validate = True)
+
+        findings = sorted((finding.container_id, finding.code) for finding in context.exception.findings)
+
+        self.assertEqual(
+            [
+                ('alice', 'dependency-cycle'),
+                ('dioe', 'undefined-dependency'),
+                ('hot', 'annotation-mismatch'),
+                ('made', 'missing-method'),
+                ('poow', 'missing-parameter'),
+                ('poow', 'unexpected-parameter'),
+                ('thermostat', 'annotation-mismatch'),
+                ('unknown', 'unresolvable-reference'),
+                ('watcher', 'missing-method'),
+                ('watcher', 'missing-method'),
+            ],
+            findings
+        )
+        self.assertIs(context.exception.findings, core.findings)
+
+    def test_validated_signature(self):
+        core = self.load('test/data/locator-invalid.xml')
+
+        self.assertTrue(core.validate(raise_error = False))
+
+        self.assertEqual(21.5, core.get('warm').celsius)
+        self.assertEqual(19, core.get('made-well').celsius)
+
+    def test_find_cycles(self):
+        graph = {'a': {'b'}, 'b': {'c'}, 'c': {'a', 'd'}, 'd': set(), 'e': {'e'}, 'f': {'ghost'}}
+
+        self.assertEqual([['a', 'b', 'c'], ['e']], find_cycles(graph))
@@ -0,0 +1,81 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.decorator           import validator
+    from imagination.decorator.validator import SpecialType, restrict_type
+    from imagination.exception           import MisplacedValidatorError
+
+
+class Person(object):
+    def __init__(self, name):
+        self.name    = name
+        self.friends = []
+
+    def add_friends(self, friends, notify = None):
+        self.friends.extend(friends)
+
+        return len(self.friends)
+
+    def rename(self, name : str, suffix : 'str' = ''):
+        self.name = '{}{}'.format(name, suffix)
+
+
+def greet(person, greeting = 'Hello'):
+    return '{} {}'.format(greeting, person.name)
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_positional_and_keyword_types(self):
+        add_friends = restrict_type(list, notify = SpecialType.function)(Person.add_friends)
+        person      = Person('alpha')
+
+        self.assertEqual(2, add_friends(person, ['beta', 'charlie']))
+        self.assertEqual(3, add_friends(person, ('delta',), notify = print))  # The fallback of the list
+        self.assertEqual('add_friends', add_friends.__name__)
+
+        with self.assertRaisesRegex(TypeError, 'Argument #0 was excepting list but str has been given.'):
+            add_friends(person, 'echo')
+
+        with self.assertRaisesRegex(TypeError, 'Argument #notify was excepting function but int has been given.'):
+            add_friends(person, [], notify = 1)
+
+        self.assertEqual('Hello alpha', restrict_type(Person, str)(greet)(person))
+
+        with self.assertRaises(TypeError):
+            restrict_type(Person, str)(greet)(person, 1)
+
+    def test_annotations(self):
+        rename = restrict_type()(Person.rename)
+        person = Person('alpha')
+
+        rename(person, 'beta', suffix = 1)  # Only the types are checked.
+
+        with self.assertRaisesRegex(TypeError, 'Argument #0 was excepting str but int has been given.'):
+            rename(person, 1)
+
+        with self.assertRaisesRegex(TypeError, 'Argument #name was excepting str but int has been given.'):
+            rename(person, name = 1)
+
+        self.assertIs(greet, restrict_type()(greet))  # Nothing to check
+
+    def test_invalid_usage(self):
+        with self.assertRaises(MisplacedValidatorError):
+            restrict_type(int)(Person)
+
+        with self.assertRaisesRegex(TypeError, 'The expected type must be a type.'):
+            restrict_type('int')(greet)
+
+    def test_disabled(self):
+        validator.set_disabled()
+
+        try:
+            self.assertIs(greet, restrict_type(Person)(greet))
+        finally:
+            validator.set_disabled(False)
+
+        self.assertIsNot(greet, restrict_type(Person)(greet))
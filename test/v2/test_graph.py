@@ -0,0 +1,62 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core import Assembler
+    from imagination.exc            import UndefinedContainerIDError
+    from imagination.graph          import DependencyGraph
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.graph = DependencyGraph(
+            {'a': {'b', 'c'}, 'b': {'c', 'ghost'}, 'c': set(), 'd': {'e', 'a'}, 'e': {'d'}, 'f': {'f'}},
+            {'c': {'f'}}
+        )
+
+    def test_dependencies_and_dependants(self):
+        self.assertEqual(['b', 'c'], self.graph.dependencies('a'))
+        self.assertEqual(['c'], self.graph.dependencies('b'))
+        self.assertEqual(['a', 'b'], self.graph.dependants('c'))
+        self.assertEqual(['a', 'b', 'd', 'e'], self.graph.dependants('c', transitive = True))
+        self.assertEqual(7, self.graph.edge_count)
+
+        with self.assertRaises(UndefinedContainerIDError):
+            self.graph.dependants('ghost')
+
+    def test_depths(self):
+        self.assertEqual({'a': 2, 'b': 1, 'c': 0, 'd': 3, 'e': 3, 'f': 0}, self.graph.depths())
+        self.assertEqual(3, self.graph.depth('e'))
+
+    def test_components(self):
+        self.assertEqual([['c'], ['b'], ['a'], ['d', 'e'], ['f']], self.graph.components())
+        self.assertEqual([['d', 'e'], ['f']], self.graph.cycles())
+
+    def test_invalidated(self):
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], self.graph.invalidated('c'))
+        self.assertEqual(['a', 'b', 'c', 'd', 'e', 'f'], self.graph.invalidated('f'))
+        self.assertEqual(['d', 'e'], self.graph.invalidated('e'))
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_core(self):
+        assembler = Assembler(lazy = True)
+        assembler.load('test/data/locator-aop.xml')
+
+        core  = assembler.core
+        graph = core.dependency_graph
+
+        self.assertEqual(['alpha', 'beta', 'charlie'], graph.dependants('conversation'))
+        self.assertEqual(['alpha', 'beta', 'charlie'], graph.invalidated('beta'))
+        self.assertIsNot(graph, core.dependency_graph)
+
+        core.lock_down()
+
+        self.assertIs(core.dependency_graph, core.dependency_graph)
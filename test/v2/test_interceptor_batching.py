@@ -0,0 +1,75 @@
+import asyncio
+import sys
+import threading
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core import Assembler
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load('test/data/locator-aop-batching.xml')
+
+        self.core = self.assembler.core
+
+    def test_threads(self):
+        repository = self.core.get('user_repository')
+        results    = {}
+
+        def run(user_id):
+            results[user_id] = repository.get_user(user_id)
+
+        threads = [threading.Thread(target = run, args = (i % 3,)) for i in range(6)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({0: 'user-0', 1: 'user-1', 2: 'user-2'}, results)
+        self.assertEqual([[0, 1, 2]], [sorted(batch) for batch in repository.batches])
+
+    def test_max_size(self):
+        repository = self.core.get('user_repository')
+        threads    = [threading.Thread(target = repository.get_user, args = (i,)) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(list(range(8)), sorted(sum(repository.batches, [])))
+        self.assertTrue(all(len(batch) <= 4 for batch in repository.batches))
+
+    def test_coroutine(self):
+        repository = self.core.get('user_repository')
+
+        async def scenario():
+            return await asyncio.gather(
+                *[repository.find_user(i) for i in (1, 2, 1, -1)],
+                return_exceptions = True
+            )
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual(['user-1', 'user-2', 'user-1'], results[:3])
+        self.assertIsInstance(results[3], KeyError)
+        self.assertEqual([[1, 2, -1]], repository.batches)
+
+    def test_coroutine_max_size(self):
+        repository = self.core.get('user_repository')
+
+        async def scenario():
+            return await asyncio.gather(*[repository.find_user(i) for i in range(10)])
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual(['user-{}'.format(i) for i in range(10)], results)
+        self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], repository.batches)
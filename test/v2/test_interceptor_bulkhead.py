@@ -0,0 +1,85 @@
+import asyncio
+import sys
+import threading
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core        import Assembler
+    from imagination.interceptor.bulkhead  import BulkheadFullError
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load('test/data/locator-aop-bulkhead.xml')
+
+        self.core = self.assembler.core
+
+    def test_reject_mode(self):
+        gate     = self.core.get('gate')
+        bulkhead = self.core.get('bulkhead')
+        threads  = [threading.Thread(target = gate.pass_through, args = (i,)) for i in range(2)]
+
+        for thread in threads:
+            thread.start()
+            gate._internal_instance.entered.acquire()
+
+        with self.assertRaises(BulkheadFullError):
+            gate.pass_through(3)
+
+        state = bulkhead.snapshot('gate')[('gate', 'pass_through')]
+
+        self.assertEqual(2, state['in_flight'])
+        self.assertEqual(1, state['rejected'])
+
+        gate._internal_instance.opened.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4, gate.pass_through(4))
+        self.assertEqual(0, bulkhead.snapshot()[('gate', 'pass_through')]['in_flight'])
+
+    def test_timeout_mode(self):
+        gate     = self.core.get('patient_gate')
+        bulkhead = self.core.get('patient_bulkhead')
+        thread   = threading.Thread(target = gate.pass_through, args = (1,))
+
+        thread.start()
+        gate._internal_instance.entered.acquire()
+
+        with self.assertRaises(BulkheadFullError):
+            gate.pass_through(2)
+
+        gate._internal_instance.opened.set()
+        thread.join()
+
+        self.assertEqual(3, gate.pass_through(3))
+        self.assertEqual(1, bulkhead.snapshot()[('patient_gate', 'pass_through')]['rejected'])
+
+    def test_coroutine(self):
+        gate     = self.core.get('gate')
+        bulkhead = self.core.get('bulkhead')
+
+        async def scenario():
+            first  = asyncio.ensure_future(gate.pass_through_async(1))
+            second = asyncio.ensure_future(gate.pass_through_async(2))
+
+            await asyncio.sleep(0.01)
+
+            with self.assertRaises(BulkheadFullError):
+                await gate.pass_through_async(3)
+
+            gate._internal_instance.opened.set()
+
+            return await asyncio.gather(first, second)
+
+        self.assertEqual([1, 2], asyncio.run(scenario()))
+
+        state = bulkhead.snapshot()[('gate', 'pass_through_async')]
+
+        self.assertEqual(0, state['in_flight'])
+        self.assertEqual(1, state['rejected'])
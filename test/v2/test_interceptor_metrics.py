@@ -0,0 +1,89 @@
+import asyncio
+import sys
+import threading
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core       import Assembler
+    from imagination.core                 import Imagination, LATENCY_RECORDER_ID
+    from imagination.interceptor.metrics  import bucket_index, bucket_range
+    from imagination.meta.container       import Entity
+    from imagination.wrapper              import Wrapper
+
+
+class UnitTest(unittest.TestCase):
+    def test_bucket_index_and_range(self):
+        previous_index = -1
+
+        for value in list(range(0, 4096)) + [10 ** 6, 10 ** 9, 10 ** 12]:
+            index           = bucket_index(value)
+            lowest, highest = bucket_range(index)
+
+            self.assertGreaterEqual(index, previous_index)
+            self.assertLessEqual(lowest, value)
+            self.assertGreaterEqual(highest, value)
+            self.assertLessEqual(highest - lowest, max(1, value // 16))
+
+            previous_index = index
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_declarative(self):
+        assembler = Assembler()
+        assembler.load('test/data/locator-aop-metrics.xml')
+
+        core    = assembler.core
+        charlie = core.get('charlie')
+
+        self.assertIsInstance(charlie, Wrapper)
+
+        for i in range(10):
+            charlie.cook()
+
+        self.assertEqual('Charlie', charlie.serve())
+        self.assertEqual('Charlie', charlie.name)
+
+        histograms = core.get('latency').snapshot()
+
+        self.assertEqual({('charlie', 'cook'), ('charlie', 'serve')}, set(histograms))
+        self.assertEqual(10, histograms[('charlie', 'cook')].calls)
+        self.assertEqual(1,  histograms[('charlie', 'serve')].calls)
+        self.assertEqual(0,  histograms[('charlie', 'serve')].errors)
+
+    def test_wildcard_option(self):
+        core = Imagination(record_latency = True)
+        core.set_metadata('delta', Entity('delta', 'dummy.sample_aop.Delta'))
+
+        delta = core.get('delta')
+
+        def run():
+            for i in range(100):
+                with self.assertRaises(RuntimeError):
+                    delta.fail()
+
+        threads = [threading.Thread(target = run) for i in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(3, asyncio.run(delta.wait(3)))
+
+        histograms = core.get_latency_stats('delta')
+        histogram  = histograms[('delta', 'fail')]
+
+        self.assertEqual(400, histogram.calls)
+        self.assertEqual(400, histogram.errors)
+        self.assertLessEqual(histogram.percentile(50), histogram.percentile(99))
+        self.assertLessEqual(histogram.percentile(99), histogram.max)
+        self.assertEqual(1, histograms[('delta', 'wait')].calls)
+        self.assertNotIn(LATENCY_RECORDER_ID, {key[0] for key in core.get_latency_stats()})
+
+    def test_disabled(self):
+        self.assertEqual({}, Imagination().get_latency_stats())
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import threading
+import time
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core import Assembler
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.assembler = Assembler()
+        self.assembler.load('test/data/locator-aop-singleflight.xml')
+
+        self.core = self.assembler.core
+
+    def _run_concurrently(self, method, value, options, count = 5):
+        outcomes = []
+
+        def run(index):
+            try:
+                outcomes.append(method(value, **{'index': index} if options else {}))
+            except Exception as error:
+                outcomes.append(error)
+
+        threads = [threading.Thread(target = run, args = (i,)) for i in range(count)]
+
+        for thread in threads:
+            thread.start()
+
+        return threads, outcomes
+
+    def test_shared_result(self):
+        gate    = self.core.get('gate')
+        dummy   = gate._internal_instance
+
+        threads, outcomes = self._run_concurrently(gate.pass_through, 'alpha', True)
+
+        dummy.entered.acquire()
+        time.sleep(0.05)  # Let the other threads join the flight.
+        dummy.opened.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(['alpha'] * 5, outcomes)
+        self.assertEqual(1, dummy.calls)
+
+        counters = self.core.get('single_flight').snapshot('gate')[('gate', 'pass_through')]
+
+        self.assertEqual(1, counters['executions'])
+        self.assertEqual(4, counters['coalesced'])
+
+        # The next call is not coalesced with the landed one.
+        self.assertEqual('alpha', gate.pass_through('alpha'))
+        self.assertEqual(2, dummy.calls)
+
+    def test_shared_error(self):
+        gate  = self.core.get('gate')
+        dummy = gate._internal_instance
+
+        threads, outcomes = self._run_concurrently(gate.fail_through, 'bravo', False)
+
+        dummy.entered.acquire()
+        time.sleep(0.05)
+        dummy.opened.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(5, len(outcomes))
+        self.assertTrue(all(isinstance(outcome, LookupError) for outcome in outcomes))
+        self.assertEqual(1, dummy.calls)
+
+    def test_coroutine(self):
+        gate  = self.core.get('gate')
+        dummy = gate._internal_instance
+
+        async def scenario():
+            calls = [asyncio.ensure_future(gate.pass_through_async('charlie')) for i in range(5)]
+
+            await asyncio.sleep(0.01)
+
+            dummy.opened.set()
+
+            return await asyncio.gather(*calls)
+
+        self.assertEqual(['charlie'] * 5, asyncio.run(scenario()))
+        self.assertEqual(1, dummy.calls)
@@ -0,0 +1,75 @@
+import sys
+import threading
+import unittest
+
+from imagination.loader import Loader, clear_resolution_cache, resolve
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        clear_resolution_cache()
+
+    def test_resolve(self):
+        from dummy.core import PlainOldObject
+
+        self.assertIs(PlainOldObject, resolve('dummy.core.PlainOldObject'))
+        self.assertIs(PlainOldObject, resolve('dummy.core.PlainOldObject'))
+        self.assertIs(PlainOldObject, Loader('dummy.core.PlainOldObject').package)
+
+    def test_resolve_without_dot(self):
+        self.assertIs(int, resolve('int'))
+        import json
+
+        self.assertIs(json, resolve('json'))
+
+    def test_resolve_falsy_object(self):
+        loader = Loader('dummy.core.DEFAULT_COUNT')
+
+        self.assertEqual(0, loader.package)
+        self.assertEqual(0, loader.package)
+
+    def test_negative_cache(self):
+        self.assertRaises(ImportError, resolve, 'dummy.core.UnknownObject')
+        self.assertRaises(ImportError, resolve, 'dummy.core.UnknownObject')
+        self.assertRaises(ImportError, resolve, 'dummy.unknown_module.UnknownObject')
+
+        sys.modules['dummy.core'].UnknownObject = object
+
+        try:
+            # The failure is remembered until the cache is cleared.
+            self.assertRaises(ImportError, resolve, 'dummy.core.UnknownObject')
+
+            clear_resolution_cache()
+
+            self.assertIs(object, resolve('dummy.core.UnknownObject'))
+        finally:
+            del sys.modules['dummy.core'].UnknownObject
+
+    def test_error(self):
+        with self.assertRaises(ImportError) as context:
+            resolve('dummy.unknown_module.UnknownObject')
+
+        self.assertEqual('dummy.unknown_module', context.exception.name)
+        self.assertIsInstance(context.exception.__cause__, ImportError)
+
+    def test_resolution_during_slow_import(self):
+        from dummy import import_gate
+
+        outcomes = {}
+        threads  = [
+            threading.Thread(target = lambda: outcomes.update(slow = resolve('dummy.slow_import.Slow'))),
+            threading.Thread(target = lambda: outcomes.update(fast = resolve('dummy.core.PlainOldObject'))),
+        ]
+
+        threads[0].start()
+        import_gate.started.wait(5)
+        threads[1].start()
+        threads[1].join(2)
+
+        try:
+            self.assertIn('fast', outcomes)  # Not blocked by the other import
+        finally:
+            import_gate.released.set()
+            threads[0].join()
+
+        self.assertEqual('Slow', outcomes['slow'].__name__)
@@ -0,0 +1,94 @@
+import gc
+import sys
+import tracemalloc
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.core         import Imagination
+    from imagination.memory       import MemoryRecorder
+    from imagination.registration import ref
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.recorder = MemoryRecorder().start()
+
+    def tearDown(self):
+        self.recorder.stop()
+
+    def test_nested_activations(self):
+        outer = self.recorder.measure('outer', lambda: (
+            bytearray(100000),
+            self.recorder.measure('inner', lambda: bytearray(500000)),
+        ))
+
+        report = self.recorder.report()
+
+        self.assertEqual(['inner', 'outer'], [stats['entity_id'] for stats in report['top_consumers']])
+
+        inner_stats, outer_stats = report['top_consumers']
+
+        self.assertGreaterEqual(inner_stats['retained_bytes'], 500000)
+        self.assertLess(outer_stats['retained_bytes'], 200000)
+        self.assertGreaterEqual(outer_stats['inclusive_bytes'], 600000)
+
+    def test_census(self):
+        instances = []
+
+        for _ in range(3):
+            instances.append(self.recorder.measure('job', lambda: set()))
+            self.recorder.track('job', instances[-1])
+            self.recorder.track('number', 1)
+            self.recorder.sample()
+
+        self.assertEqual([('job', [1, 2, 3])], self.recorder.growing())
+
+        del instances[:]
+        gc.collect()
+
+        report = self.recorder.report()
+
+        self.assertEqual({'created': 3, 'live': 0, 'untracked': 0}, report['instances']['job'])
+        self.assertEqual({'created': 0, 'live': 0, 'untracked': 3}, report['instances']['number'])
+        self.assertEqual([], report['growing'])
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.core = Imagination(record_memory = True)
+
+        self.core.register_entity('buffer', 'dummy.memory.Buffer', params = {'size': 1000000})
+        self.core.register_entity('holder', 'dummy.memory.Holder', params = {'buffer': ref('buffer')})
+        self.core.register_entity('job', 'dummy.memory.Job', cacheable = False)
+
+    def tearDown(self):
+        self.core.shut_down()
+
+    def test_report(self):
+        self.assertTrue(tracemalloc.is_tracing())
+
+        self.core.get('holder')
+
+        jobs = []
+
+        for _ in range(3):
+            jobs.append(self.core.get('job'))
+
+            report = self.core.get_memory_report(top = 1)
+
+        self.assertIsNot(jobs[0], jobs[1])
+        self.assertEqual('buffer', report['top_consumers'][0]['entity_id'])
+        self.assertGreaterEqual(report['top_consumers'][0]['retained_bytes'], 1000000)
+        self.assertEqual({'created': 3, 'live': 3, 'untracked': 0}, report['instances']['job'])
+        self.assertEqual([('job', [1, 2, 3])], report['growing'])
+
+        self.core.shut_down()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual({}, Imagination().get_memory_report())
@@ -0,0 +1,52 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.meta.container  import Entity
+    from imagination.meta.definition import DataDefinition, FrozenParameterCollectionError, Interception, \
+                                            ParameterCollection
+
+
+def make_parameters(host):
+    nested = ParameterCollection()
+    nested.add(DataDefinition('1', kind = 'int'))
+
+    params = ParameterCollection()
+    params.add(DataDefinition(host, 'host'), 'host')
+    params.add(DataDefinition(nested, 'ports', 'list'), 'ports')
+
+    return params
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_freeze_shares_identical_collections(self):
+        host = ''.join(['local', 'host'])  # not the same string object as below
+
+        first  = make_parameters(host).freeze()
+        second = make_parameters('localhost').freeze()
+
+        self.assertTrue(first.frozen)
+        self.assertIs(first, second)
+        self.assertEqual(['host', 'ports'], [name for name, _ in first.items()])
+        self.assertIsNot(first, make_parameters('remote').freeze())
+
+    def test_frozen_collection_rejects_changes(self):
+        params = make_parameters('localhost').freeze()
+
+        with self.assertRaises(FrozenParameterCollectionError):
+            params.add(DataDefinition('a'))
+
+    def test_containers_are_compact(self):
+        entity_id = ''.join(['app', '.db'])
+        entity    = Entity(entity_id, 'dummy.core.Alpha', make_parameters('localhost'))
+
+        self.assertIs(sys.intern('app.db'), entity.id)
+        self.assertEqual((), entity.interceptions)
+        self.assertTrue(entity.params.frozen)
+
+        for instance in (entity, DataDefinition('a'), Interception('before', 'a', 'b', 'c', 'd')):
+            self.assertFalse(hasattr(instance, '__dict__'), type(instance).__name__)
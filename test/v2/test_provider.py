@@ -0,0 +1,128 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.exc                import UnknownExternalValueError
+    from imagination.helper.provider    import DotEnvProvider, FileProvider, JSONProvider, parse_dotenv
+    from imagination.helper.transformer import Transformer
+    from imagination.meta.definition    import DataDefinition
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.directory = tempfile.mkdtemp()
+
+        self.write('db', 'panda\n')
+        self.write('.env', '# Database\nexport DB_HOST=db.local\nDB_PORT = "5432"\n')
+        self.write('app.json', '{"db": {"hosts": ["db1", "db2"], "port": 5432, "options": {"ssl": true}}}')
+
+        self.transformer = Transformer(None)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def write(self, name, content):
+        with open(self.path(name), 'w') as f:
+            f.write(content)
+
+    def cast(self, definition, kind = 'str'):
+        return self.transformer.cast(DataDefinition(definition, kind = kind))
+
+    def test_file(self):
+        self.assertEqual('panda', self.cast('{ file:' + self.path('db') + ' }'))
+        self.assertEqual('user=panda;', self.cast('user={file:' + self.path('db') + '};'))
+
+    def test_utf8(self):
+        with open(self.path('chef'), 'wb') as f:
+            f.write('pâté\n'.encode('utf-8'))
+
+        self.assertEqual('pâté', self.cast('{ file:' + self.path('chef') + ' }'))
+
+    def test_secret(self):
+        self.transformer.register_provider('secret', FileProvider(self.directory))
+
+        self.assertEqual('panda', self.cast('{ secret:db }'))
+
+        # Only the files directly in the directory are allowed.
+        with self.assertRaises(UnknownExternalValueError):
+            self.cast('{ secret:../db }')
+
+    def test_dotenv(self):
+        self.assertEqual('db.local', self.cast('{ dotenv:' + self.path('.env') + '#DB_HOST }'))
+        self.assertEqual(5432, self.cast('{ dotenv:' + self.path('.env') + '#DB_PORT }', 'int'))
+
+    def test_json(self):
+        reference = 'json:' + self.path('app.json')
+
+        self.assertEqual('db2', self.cast('{ ' + reference + '#db.hosts.1 }'))
+        self.assertEqual(5432, self.cast('{ ' + reference + '#db.port }', 'int'))
+        self.assertEqual({'ssl': True}, self.cast('{ ' + reference + '#db.options }', 'json'))
+
+    def test_default_value(self):
+        self.assertEqual('sushi', self.cast('{ file:' + self.path('food') + ' or "sushi" }'))
+        self.assertEqual('5', self.cast('{ json:' + self.path('app.json') + '#db.timeout or 5 }'))
+
+        with self.assertRaises(UnknownExternalValueError):
+            self.cast('{ file:' + self.path('food') + ' }')
+
+    def test_unknown_source(self):
+        self.assertEqual('{name:>10}', self.cast('{name:>10}'))
+
+    def test_one_read_per_file(self):
+        provider = JSONProvider(ttl = 60)
+
+        self.transformer.register_provider('json', provider)
+
+        for key in ('db.hosts.0', 'db.hosts.1', 'db.port'):
+            self.cast('{ json:' + self.path('app.json') + '#' + key + ' }')
+
+        self.assertEqual(1, provider.reader.reads)
+
+    def test_ttl_and_modification_time(self):
+        provider = FileProvider(ttl = 0)
+
+        self.transformer.register_provider('file', provider)
+
+        self.assertEqual('panda', self.cast('{ file:' + self.path('db') + ' }'))
+        self.assertEqual('panda', self.cast('{ file:' + self.path('db') + ' }'))
+        self.assertEqual(1, provider.reader.reads)
+
+        self.write('db', 'red panda\n')
+
+        future = time.time() + 10
+
+        os.utime(self.path('db'), (future, future))
+
+        self.assertEqual('red panda', self.cast('{ file:' + self.path('db') + ' }'))
+        self.assertEqual(2, provider.reader.reads)
+
+    def test_cached_within_ttl(self):
+        provider = DotEnvProvider(ttl = 60)
+
+        self.transformer.register_provider('dotenv', provider)
+
+        self.assertEqual('db.local', self.cast('{ dotenv:' + self.path('.env') + '#DB_HOST }'))
+
+        self.write('.env', 'DB_HOST=db.remote\n')
+
+        self.assertEqual('db.local', self.cast('{ dotenv:' + self.path('.env') + '#DB_HOST }'))
+
+        provider.reader.clear()
+
+        self.assertEqual('db.remote', self.cast('{ dotenv:' + self.path('.env') + '#DB_HOST }'))
+
+    def test_parse_dotenv(self):
+        self.assertEqual(
+            {'A': '1', 'B': 'two words', 'C': "it's"},
+            parse_dotenv('A=1\n\n# comment\nB="two words"\nexport C="it\'s"\ninvalid\n')
+        )
@@ -0,0 +1,102 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.core         import Imagination
+    from imagination.meta.container import Entity, Factorization, Lambda
+    from imagination.registration import MetadataRegistry, UnreachableReferenceError, \
+                                         default_registry, entity, make_data_definition, ref, typed
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.core = Imagination()
+
+    def test_decorators(self):
+        from dummy.registration import registry, Session, Store
+
+        self.assertEqual(
+            ['registered.store', 'registered.session', 'registered.auditor', 'registered.client'],
+            list(registry.containers())
+        )
+        self.assertNotIn('registered.store', default_registry)
+
+        self.core.update_metadata(registry.containers())
+
+        store = self.core.get('registered.store')
+
+        self.assertEqual('memory', store.name)
+        self.assertEqual(8, store.capacity)
+        self.assertEqual(['a', 'b'], store.tags)
+        self.assertEqual({'strict': True}, store.options)
+
+        session = self.core.get('registered.session')
+
+        self.assertIsInstance(session, Session)
+        self.assertEqual('main', session.label)
+
+        store.put('sushi')
+
+        self.assertEqual(['sushi'], self.core.get('registered.auditor').records)
+
+        client = self.core.get('registered.client')
+
+        self.assertIs(store, client.store)
+        self.assertIs(Session, client.session_class)
+
+    def test_register_entity(self):
+        from dummy.core import PlainOldObjectWithParameters
+
+        metadata = self.core.register_entity('poow', PlainOldObjectWithParameters, args = [2, 3.5, False])
+
+        self.assertIsInstance(metadata, Entity)
+        self.assertEqual('dummy.core.PlainOldObjectWithParameters', metadata.fqcn)
+
+        self.core.register_entity('poo', 'dummy.core.PlainOldObject')
+        self.core.register_entity('dioe', 'dummy.core.DependencyInjectableObjectWithEntity',
+                                  params = {'entity': ref('poo')})
+        self.core.register_factorization('product', 'factory', 'make', cacheable = False)
+
+        poow = self.core.get('poow')
+
+        self.assertEqual((2, 3.5, False), (poow.a, poow.b, poow.d))
+        self.assertIs(self.core.get('poo'), self.core.get('dioe').e)
+        self.assertIsInstance(self.core.get_metadata('product'), Factorization)
+
+    def test_register_callable(self):
+        from dummy.exec import foo
+
+        self.assertIsInstance(self.core.register_callable('foo', foo), Lambda)
+        self.assertIs(foo, self.core.get('foo'))
+
+    def test_make_data_definition(self):
+        self.assertEqual(('bool', 'true'), self.describe(make_data_definition(True)))
+        self.assertEqual(('int', 5), self.describe(make_data_definition(5)))
+        self.assertEqual(('money', '1.00 CAD'), self.describe(make_data_definition(typed('1.00 CAD', 'money'))))
+        self.assertEqual(('class', 'dummy.core.PlainOldObject'), self.describe(make_data_definition(
+            __import__('dummy.core', fromlist = ['PlainOldObject']).PlainOldObject
+        )))
+
+        instance = object()
+        data     = make_data_definition(instance, 'instance')
+
+        self.assertEqual('instance', data.name)
+        self.assertIs(instance, data.definition)
+        self.assertFalse(data.transformation_required)
+
+    def test_unreachable_reference(self):
+        class LocalClass(object):
+            pass
+
+        registry = MetadataRegistry()
+
+        with self.assertRaises(UnreachableReferenceError):
+            entity('local', registry = registry)(LocalClass)
+
+        self.assertEqual(0, len(registry))
+
+    def describe(self, data):
+        return data.kind, data.definition
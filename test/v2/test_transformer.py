@@ -2,7 +2,7 @@ import os
 import unittest
 
 from imagination.exc                import UnknownEnvironmentVariableError
-from imagination.helper.transformer import Transformer
+from imagination.helper.transformer import LRUCache, Transformer
 
 
 class UnitTest(unittest.TestCase):
@@ -39,3 +39,49 @@ class UnitTest(unittest.TestCase):
 
         with self.assertRaises(UnknownEnvironmentVariableError):
             self.transformer._pre_process(input_data)
+
+    def test_pre_process_with_multiple_default_values(self):
+        expectation = 'sushi and ramen'
+        input_data  = '{ $FOOD or "sushi" } and { $NOODLE or "ramen" }'
+
+        self.assertEqual(expectation, self.transformer._pre_process(input_data))
+
+    def test_pre_process_without_environment_block(self):
+        input_data = 'It costs $5 {today}.'
+
+        self.assertIs(input_data, self.transformer._pre_process(input_data))
+
+    def test_pre_process_with_environment_snapshot(self):
+        input_data = 'I like { $FOOD }.'
+
+        self.transformer.refresh_environment({'FOOD': 'sushi'})
+
+        self.assertEqual('I like sushi.', self.transformer._pre_process(input_data))
+
+        self.transformer.refresh_environment({'FOOD': 'ramen'})
+
+        self.assertEqual('I like ramen.', self.transformer._pre_process(input_data))
+
+    def test_pre_process_with_bounded_cache(self):
+        transformer = Transformer(None, cache_size = 2)
+
+        transformer.refresh_environment({'FOOD': 'sushi'})
+
+        for input_data in ('I like { $FOOD }.', 'You like { $FOOD }.', 'We like { $FOOD }.', 'I like { $FOOD }.'):
+            self.assertEqual(input_data.replace('{ $FOOD }', 'sushi'), transformer._pre_process(input_data))
+
+    def test_lru_cache(self):
+        cache = LRUCache(2)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        self.assertEqual(1, cache.get('a'))  # "b" is now the least recently used item.
+
+        cache.set('c', 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertNotIn('b', cache)
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(3, cache.get('c'))
+        self.assertIsNone(cache.get('b'))
@@ -0,0 +1,124 @@
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core     import Assembler
+    from imagination.helper.transformer import Constant, Transformer, TypeRegistry
+    from imagination.meta.definition    import DataDefinition, ParameterCollection
+
+
+def make_collection(kind, *items):
+    collection = ParameterCollection()
+
+    for item in items:
+        if isinstance(item, tuple):
+            collection.add(item[1], item[0])
+        else:
+            collection.add(item)
+
+    return DataDefinition(collection, kind = kind)
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.cast_count = 0
+        self.registry   = TypeRegistry()
+        self.registry.register('counted', self.count, immutable = True)
+        self.registry.register('volatile', self.count)
+
+        self.transformer = Transformer(lambda entity_id: 'entity:' + entity_id, self.registry)
+
+    def count(self, data):
+        self.cast_count += 1
+
+        return int(data)
+
+    def test_fold_immutable_value(self):
+        folded = self.transformer.fold(DataDefinition('12', kind = 'counted'))
+
+        self.assertIs(Constant, type(folded))
+        self.assertEqual(12, self.transformer.cast(folded))
+        self.assertEqual(12, self.transformer.cast(folded))
+        self.assertEqual(1, self.cast_count)
+
+    def test_no_folding(self):
+        dynamic_definitions = [
+            DataDefinition('sushi', kind = 'entity'),
+            DataDefinition('{ $FOOD or "12" }', kind = 'counted'),
+            DataDefinition('12', kind = 'volatile'),
+            DataDefinition('twelve', kind = 'int'),  # failing to be cast
+            DataDefinition('12', kind = 'int', transformation_required = False),
+        ]
+
+        for definition in dynamic_definitions:
+            self.assertIs(definition, self.transformer.fold(definition))
+
+        with self.assertRaises(ValueError):
+            self.transformer.cast(self.transformer.fold(DataDefinition('twelve', kind = 'int')))
+
+    def test_fold_mutable_collection(self):
+        definition = make_collection(
+            'list',
+            DataDefinition('1', kind = 'int'),
+            make_collection('tuple', DataDefinition('2', kind = 'int')),
+        )
+
+        folded = self.transformer.fold(definition)
+        first  = self.transformer.cast(folded)
+        second = self.transformer.cast(folded)
+
+        self.assertEqual([1, (2,)], first)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertIs(first[1], second[1])
+
+    def test_fold_nested_mutable_collection(self):
+        definition = make_collection(
+            'dict',
+            ('numbers', make_collection('list', DataDefinition('1', kind = 'int'))),
+        )
+
+        folded = self.transformer.fold(definition)
+        first  = self.transformer.cast(folded)
+        second = self.transformer.cast(folded)
+
+        self.assertEqual({'numbers': [1]}, first)
+        self.assertIsNot(first['numbers'], second['numbers'])
+
+    def test_fold_immutable_collection(self):
+        folded = self.transformer.fold(make_collection('tuple', DataDefinition('1', kind = 'int')))
+
+        self.assertIs(self.transformer.cast(folded), self.transformer.cast(folded))
+
+    def test_fold_partially(self):
+        definition = make_collection(
+            'list',
+            DataDefinition('12', kind = 'counted'),
+            DataDefinition('sushi', kind = 'entity'),
+        )
+
+        folded = self.transformer.fold(definition)
+
+        self.assertIs(DataDefinition, type(folded))
+        self.assertEqual([12, 'entity:sushi'], self.transformer.cast(folded))
+        self.assertEqual([12, 'entity:sushi'], self.transformer.cast(folded))
+        self.assertEqual(1, self.cast_count)
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_lock_down(self):
+        assembler = Assembler()
+        assembler.load('test/data/locator-types.xml')
+        assembler.core.lock_down()
+
+        invoice = assembler.core.get('invoice')
+
+        self.assertEqual({'copies': 2}, invoice.options)
+        self.assertEqual({'paid', b'urgent'}, invoice.tags)
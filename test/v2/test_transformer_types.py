@@ -0,0 +1,107 @@
+import datetime
+import decimal
+import pathlib
+import sys
+import unittest
+
+if sys.version_info >= (3, 3):
+    from imagination.assembler.core     import Assembler
+    from imagination.assembler.xml      import XMLParser
+    from imagination.helper.transformer import KindConflictError, Transformer, TypeRegistry, UnknownKindError
+    from imagination.meta.definition    import DataDefinition
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+        self.registry    = TypeRegistry()
+        self.transformer = Transformer(None, self.registry)
+
+    def cast(self, definition, kind):
+        return self.transformer.cast(DataDefinition(definition, kind = kind))
+
+    def test_built_in_kinds(self):
+        self.assertEqual(decimal.Decimal('0.10'), self.cast('0.10', 'decimal'))
+        self.assertEqual(b'caf\xc3\xa9', self.cast('café', 'bytes'))
+        self.assertEqual(pathlib.Path('/tmp/app'), self.cast('/tmp/app', 'path'))
+        self.assertEqual({'a': [1, 2]}, self.cast('{"a": [1, 2]}', 'json'))
+        self.assertTrue(self.cast('^[a-z]+$', 'regex').match('sushi'))
+        self.assertFalse(self.cast('false', 'bool'))
+
+    def test_duration(self):
+        self.assertEqual(datetime.timedelta(seconds = 1.5), self.cast('1.5', 'duration'))
+        self.assertEqual(datetime.timedelta(milliseconds = 250), self.cast('250ms', 'duration'))
+        self.assertEqual(datetime.timedelta(hours = 1, minutes = 30), self.cast('1h30m', 'duration'))
+        self.assertEqual(datetime.timedelta(days = 2, seconds = 5), self.cast('2d 5s', 'duration'))
+
+        with self.assertRaises(ValueError):
+            self.cast('1h and a bit', 'duration')
+
+    def test_datetime(self):
+        expected = datetime.datetime(2018, 1, 31, 9, 30, tzinfo = datetime.timezone.utc)
+
+        self.assertEqual(expected, self.cast('2018-01-31T09:30:00Z', 'datetime'))
+        self.assertEqual(expected, self.cast('2018-01-31T09:30:00+00:00', 'datetime'))
+
+    def test_immutable_results_are_reused(self):
+        self.assertIs(self.cast('0.10', 'decimal'), self.cast('0.10', 'decimal'))
+        self.assertIsNot(self.cast('{"a": 1}', 'json'), self.cast('{"a": 1}', 'json'))
+
+    def test_register(self):
+        self.registry.register('upper', str.upper)
+        self.registry.register('basename', 'os.path.basename', immutable = True)
+
+        self.assertIn('upper', self.registry)
+        self.assertEqual('SUSHI', self.cast('sushi', 'upper'))
+        self.assertEqual('sushi', self.cast('/food/sushi', 'basename'))
+
+        # The same caster can be registered again.
+        self.registry.register('basename', 'os.path.basename', immutable = True)
+
+        with self.assertRaises(KindConflictError):
+            self.registry.register('basename', str.upper)
+
+        with self.assertRaises(KindConflictError):
+            self.registry.register('list', list)
+
+        self.registry.register('basename', str.upper, replace = True)
+
+        self.assertEqual('RAMEN', self.cast('ramen', 'basename'))
+
+    def test_unknown_kind(self):
+        with self.assertRaises(UnknownKindError):
+            self.cast('sushi', 'food')
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        if sys.version_info < (3, 3):
+            self.skipTest('The tested feature is not supported in Python {}.'.format(sys.version))
+
+    def test_parse_registers_types(self):
+        registry = TypeRegistry()
+
+        XMLParser(registry).parse('test/data/locator-types.xml')
+
+        self.assertIn('money', registry)
+        self.assertNotIn('money', TypeRegistry())
+
+    def test_parse_with_unknown_kind(self):
+        with self.assertRaises(UnknownKindError):
+            XMLParser(TypeRegistry()).parse('test/data/locator-unknown-type.xml')
+
+    def test_types(self):
+        assembler = Assembler()
+        assembler.load('test/data/locator-types.xml')
+
+        invoice = assembler.core.get('invoice')
+
+        self.assertEqual(decimal.Decimal('12.50'), invoice.total.amount)
+        self.assertEqual('CAD', invoice.total.currency)
+        self.assertEqual(datetime.timedelta(days = 9), invoice.due_in)
+        self.assertEqual(2018, invoice.issued_at.year)
+        self.assertTrue(invoice.pattern.match('INV-123'))
+        self.assertEqual({'copies': 2}, invoice.options)
+        self.assertEqual({'paid', b'urgent'}, invoice.tags)